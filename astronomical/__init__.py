@@ -5,10 +5,10 @@ according to the user's current whereabouts and whenabouts.
 """
 
 import os
-import sys
-
-from .service.logging import logger, setup_logging
-
-setup_logging()
 
 __version__ = "0.5.0"
+
+# opt-in profiling of the whole process; see astronomical.service.profiling
+if os.getenv("ASTRONOMICAL_PROFILE"):
+    from astronomical.service.profiling import profile_process
+    profile_process()
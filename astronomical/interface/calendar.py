@@ -0,0 +1,175 @@
+"""Interface module for exporting calendars.
+
+Sunrise, sunset, NAC hour boundaries and alarms are written as iCalendar
+(RFC 5545) events as they are calculated. Days are calculated in chunks with
+the bulk NAC and alarm calculations, so a calendar of many years is never
+held in memory. Sunrise and sunset come from the almanac, for the synodic day
+holding each calendar day's noon, so they are the sun events NAC time keeps
+to and fall on NAC 6am and 6pm. DTSTAMP is in UTC, as RFC 5545 requires.
+"""
+
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterator, List, Optional, Sequence, TextIO, Tuple
+
+import numpy as np
+
+import astronomical
+from astronomical.model import almanac, nac
+from astronomical.model.configuration import SleepRequirements
+from astronomical.model.schedule import alarm_schedule
+from astronomical.model.solar_system import PlanetaryLocation
+from astronomical.service.logging import logger
+
+CHUNK_DAYS: int = 31  # days calculated at a time
+EVENTS: Sequence[str] = ("sun", "nac", "alarms")
+LINE_OCTETS: int = 75  # longest content line before folding
+PRODUCT_ID: str = \
+    f"-//TheOrganist24//Astronomical {astronomical.__version__}//EN"
+
+
+def fold(line: str) -> str:
+    """Fold a content line to 75 octets and end it with CRLF."""
+    encoded: bytes = line.encode()
+    if len(encoded) <= LINE_OCTETS:
+        return line + "\r\n"
+    parts: List[str] = []
+    start: int = 0
+    limit: int = LINE_OCTETS
+    while start < len(encoded):
+        end: int = min(start + limit, len(encoded))
+        while end < len(encoded) and encoded[end] & 0xC0 == 0x80:
+            end -= 1  # do not split a UTF-8 character
+        parts.append(encoded[start:end].decode())
+        start, limit = end, LINE_OCTETS - 1  # continuations start " "
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def escape(text: str) -> str:
+    """Escape a TEXT value's backslashes, separators and newlines."""
+    return (text.replace("\\", "\\\\").replace(";", "\\;")
+            .replace(",", "\\,").replace("\r\n", "\n")
+            .replace("\n", "\\n"))
+
+
+def _stamps(instants: np.ndarray) -> List[str]:
+    """Format datetime64 instants as iCalendar floating date-times."""
+    return [stamp.replace("-", "").replace(":", "")
+            for stamp in np.datetime_as_string(instants, unit="s")]
+
+
+def _day_sun_times(location: PlanetaryLocation, start: date, end: date
+                   ) -> Tuple[np.ndarray, np.ndarray]:
+    """Return sunrise and sunset (datetime64) on each day, NaT if absent.
+
+    Each day takes the synodic day holding its noon, as NAC time does.
+    """
+    noons = np.arange(np.datetime64(start, "D"), np.datetime64(end, "D")
+                      ).astype("datetime64[us]") + np.timedelta64(12, "h")
+    table = almanac.sun_times(location, noons[0].astype(datetime),
+                              noons[-1].astype(datetime) + timedelta(
+                                  seconds=1))
+    rows = np.searchsorted(table.day, noons, side="right") - 1
+    return table.rise[rows], table.set[rows]
+
+
+def _events(kind: str, summaries: Sequence[str], instants: np.ndarray,
+            site: str, created: str) -> Iterator[str]:
+    """Yield an instantaneous event at each instant.
+
+    Instants which are NaT (no sunrise on a polar day, for instance) are
+    skipped.
+    """
+    present = ~np.isnat(instants)
+    for summary, stamp in zip(np.asarray(summaries)[present],
+                              _stamps(instants[present])):
+        yield (f"BEGIN:VEVENT\r\n"
+               f"{fold(f'UID:{kind}-{stamp}-{site}@astronomical')}"
+               f"DTSTAMP:{created}\r\n"
+               f"DTSTART:{stamp}\r\n"
+               f"{fold(f'SUMMARY:{escape(summary)}')}"
+               f"TRANSP:TRANSPARENT\r\n"
+               f"END:VEVENT\r\n")
+
+
+def calendar_lines(location: PlanetaryLocation, start: date, end: date,
+                   requirements: Optional[SleepRequirements] = None,
+                   events: Sequence[str] = EVENTS,
+                   created: Optional[datetime] = None) -> Iterator[str]:
+    """Yield an iCalendar of events from start to end, piece by piece.
+
+    Parameters
+    ----------
+    location (PlanetaryLocation)    where the calendar is for
+    start (date)                    first day
+    end (date)                      end of the range (exclusive)
+    requirements (SleepRequirements)
+                                    sleep requirements for alarms (None)
+    events (Sequence[str])          any of "sun", "nac" and "alarms"
+    created (datetime)              when the calendar is made (now); naive
+                                    times are taken as UTC
+
+    Yields
+    ------
+    lines (str)                     one or more content lines, each ending
+                                    in CRLF
+    """
+    unknown = set(events) - set(EVENTS)
+    if unknown:
+        raise ValueError(f"Calendar events must be among {EVENTS}")
+    if "alarms" in events and requirements is None:
+        raise ValueError("Alarms need sleep requirements")
+    created = created or datetime.now(timezone.utc)
+    if created.tzinfo is not None:
+        created = created.astimezone(timezone.utc).replace(tzinfo=None)
+    stamp: str = _stamps(np.array([created], dtype="datetime64[s]"))[0] \
+        + "Z"
+    site: str = f"{location.latitude:.4f},{location.longitude:.4f}"
+    hours: List[str] = [f"NAC {hour:02d}:00" for hour in range(24)]
+
+    yield "BEGIN:VCALENDAR\r\n"
+    yield "VERSION:2.0\r\n"
+    yield fold(f"PRODID:{PRODUCT_ID}")
+    yield fold(f"X-WR-CALNAME:{escape(location.name)}")
+
+    first: date = start
+    while first < end:
+        last: date = min(first + timedelta(days=CHUNK_DAYS), end)
+        days: int = (last - first).days
+        if "sun" in events:
+            rises, sets = _day_sun_times(location, first, last)
+            yield from _events("sunrise", ["Sunrise"] * days, rises, site,
+                               stamp)
+            yield from _events("sunset", ["Sunset"] * days, sets, site,
+                               stamp)
+        if "nac" in events:
+            boundaries = nac.hour_boundaries(location, first, last)
+            yield from _events("nac", hours * days, boundaries.ravel(), site,
+                               stamp)
+        if "alarms" in events and requirements is not None:
+            alarms = alarm_schedule(requirements.sleep,
+                                    requirements.earliest_wake_up,
+                                    requirements.latest_wake_up,
+                                    requirements.ablutions, location.planet,
+                                    first, last)
+            for kind, instants in (("Sleep", alarms.sleep),
+                                   ("Wake", alarms.wake),
+                                   ("Work", alarms.work)):
+                yield from _events(kind.lower(), [kind] * days, instants,
+                                   site, stamp)
+        first = last
+
+    yield "END:VCALENDAR\r\n"
+    logger.debug(f"FUNCTION \"calendar_lines\": "
+                 f"finished \"{(end - start).days}\" days.")
+
+
+def write_calendar(destination: TextIO, location: PlanetaryLocation,
+                   start: date, end: date,
+                   requirements: Optional[SleepRequirements] = None,
+                   events: Sequence[str] = EVENTS) -> None:
+    """Write an iCalendar of events from start to end as it is calculated.
+
+    Open files with `newline=""` so line endings are left as CRLF.
+    """
+    destination.writelines(calendar_lines(location, start, end,
+                                          requirements, events))
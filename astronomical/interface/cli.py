@@ -1,18 +1,33 @@
-"""Command line script."""
+"""Command line script.
+
+Only argparse is imported up front; each option imports the model and
+services it needs, so `--version` and `--help` return without loading them.
+"""
 
 
 import argparse
 import sys
-from datetime import datetime
-
-from loguru import logger
+from typing import Any, Optional
 
 import astronomical
-from astronomical.interface.configuration import UserDefaults
-from astronomical.model.real_world_calculations import Alarms, Time
-from astronomical.service.configuration import DefaultService
-from astronomical.service.requirements import (AlarmsService, SunService,
-                                               TimeService)
+
+# help is static so it does not need the services imported
+SUN_HELP: str = "return sunrise/set times, and the sun's relative position"
+TIME_HELP: str = "return current time as defined by me"
+MOON_HELP: str = \
+    "return moonrise/set times, the moon's phase and relative position"
+ALARMS_HELP: str = \
+    "return alarm type objects for going to sleep and getting up"
+CALENDAR_HELP: str = ("write sunrise/set, NAC hours and alarms as an "
+                      "iCalendar to FILE ('-' for standard output)")
+EPHEMERIS_HELP: str = ("fit Chebyshev segments of the sun's path over the "
+                       "days for the configured planet and save them to "
+                       "FILE")
+NBODY_HELP: str = ("integrate the configured star, planet and moon as an "
+                   "N-body system over the days and stream a daily state "
+                   "to FILE")
+CALENDAR_DAYS: int = 365
+NBODY_STEP: int = 60  # minutes
 
 
 def main():
@@ -20,37 +35,177 @@ def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("-v", "--version", help="show the version and exit",
                         action="store_true")
-    parser.add_argument("-s", "--sun", help=SunService.__doc__.lower()[:-1],
+    parser.add_argument("-s", "--sun", help=SUN_HELP, action="store_true")
+    parser.add_argument("-t", "--time", help=TIME_HELP, action="store_true")
+    parser.add_argument("-m", "--moon", help=MOON_HELP, action="store_true")
+    parser.add_argument("-a", "--alarms", help=ALARMS_HELP,
                         action="store_true")
-    parser.add_argument("-t", "--time", help=TimeService.__doc__.lower()[:-1],
+    parser.add_argument("-c", "--calendar", help=CALENDAR_HELP,
+                        metavar="FILE")
+    parser.add_argument("-e", "--ephemeris", help=EPHEMERIS_HELP,
+                        metavar="FILE")
+    parser.add_argument("-n", "--nbody", help=NBODY_HELP, metavar="FILE")
+    parser.add_argument("--start", help="first day of the calendar, "
+                        "ephemeris or integration (today)",
+                        metavar="YYYY-MM-DD")
+    parser.add_argument("--days", help=f"days in the calendar, ephemeris or "
+                        f"integration ({CALENDAR_DAYS})", type=int,
+                        default=CALENDAR_DAYS)
+    parser.add_argument("--step", help=f"integration step in minutes "
+                        f"({NBODY_STEP})", type=int, default=NBODY_STEP)
+    parser.add_argument("--no-cache",
+                        help="calculate afresh without the on-disk cache",
                         action="store_true")
-    parser.add_argument("-a", "--alarms",
-                        help=AlarmsService.__doc__.lower()[:-1],
+    parser.add_argument("--clear-cache", help="empty the on-disk cache",
                         action="store_true")
     args = parser.parse_args()
 
+    if args.version:
+        print(astronomical.__version__)
+        sys.exit(0)
+
+    from astronomical.service.logging import logger
+    logger.catch(onerror=lambda _: sys.exit(1))(run)(args)
+
+
+def run(args: argparse.Namespace) -> None:
+    """Run the options needing the model."""
+    from datetime import datetime
+
+    from astronomical.service.logging import logger
+
+    cache = open_cache(args)
+    if not (args.sun or args.time or args.moon or args.alarms
+            or args.calendar or args.ephemeris or args.nbody):
+        return
+
     # supply config
+    from astronomical.interface.configuration import UserDefaults
+    from astronomical.service.configuration import DefaultService
     instant: datetime = datetime.now()
     defaults = DefaultService(UserDefaults(), instant)
 
     # parse main function arguments
-    if args.version:
-        print(astronomical.__version__)
-        sys.exit(0)
-    elif args.sun:
+    if args.sun:
+        from astronomical.service.requirements import SunService
         logger.debug(f"CLI OPTION: \"sun\" invoked.")
         sun = SunService(defaults.state)
         print(sun)
     elif args.time:
+        from astronomical.model.real_world_calculations import Time
+        from astronomical.service.requirements import TimeService
         logger.debug(f"CLI OPTION: \"time\" invoked.")
         time = TimeService(Time(defaults.state, instant))
         print(time)
+    elif args.moon:
+        from astronomical.model.lunar import moon_events, moon_position
+        from astronomical.service.requirements import MoonService
+        logger.debug(f"CLI OPTION: \"moon\" invoked.")
+        if defaults.moon is None:
+            raise ValueError(f"No moon is configured for "
+                             f"{defaults.locale.planet.name}")
+        moon = MoonService(
+            moon_position(defaults.moon, defaults.locale, instant),
+            moon_events(defaults.moon, defaults.locale, instant))
+        print(moon)
     elif args.alarms:
+        from astronomical.service.persistent_cache import cached_alarms
+        from astronomical.service.requirements import AlarmsService
         logger.debug(f"CLI OPTION: \"alarms\" invoked.")
         alarms = AlarmsService(
-            Alarms(defaults.sleep_requirements.sleep,
-                   defaults.sleep_requirements.earliest_wake_up,
-                   defaults.sleep_requirements.latest_wake_up,
-                   defaults.sleep_requirements.ablutions,
-                   defaults.locale))
+            cached_alarms(None if args.no_cache else cache,
+                          defaults.sleep_requirements, defaults.locale))
         print(alarms)
+    elif args.calendar:
+        logger.debug(f"CLI OPTION: \"calendar\" invoked.")
+        write_calendar(args, defaults)
+    elif args.ephemeris:
+        logger.debug(f"CLI OPTION: \"ephemeris\" invoked.")
+        write_ephemeris(args, defaults)
+    elif args.nbody:
+        logger.debug(f"CLI OPTION: \"nbody\" invoked.")
+        write_nbody(args, defaults)
+
+
+def open_cache(args: argparse.Namespace) -> Optional[Any]:
+    """Open the on-disk cache to share daily results between invocations."""
+    if args.no_cache and not args.clear_cache:
+        return None
+    import sqlite3
+
+    from astronomical.model.event_cache import sun_events_cache
+    from astronomical.service.logging import logger
+    from astronomical.service.persistent_cache import (PersistentCache,
+                                                       SunEventsStore)
+
+    cache: Optional[PersistentCache] = None
+    try:
+        cache = PersistentCache()
+    except (OSError, sqlite3.Error) as ex:
+        logger.warning(f"CLI: on-disk cache unavailable; {ex}.")
+    if cache and args.clear_cache:
+        cache.clear()
+    if cache and not args.no_cache:
+        sun_events_cache.store = SunEventsStore(cache)
+    return cache
+
+
+def write_calendar(args: argparse.Namespace, defaults: Any) -> None:
+    """Write the calendar asked for, streaming it to file or stdout."""
+    from datetime import date, timedelta
+
+    from astronomical.interface import calendar
+
+    start: date = date.fromisoformat(args.start) if args.start \
+        else date.today()
+    end: date = start + timedelta(days=args.days)
+    if args.calendar == "-":
+        calendar.write_calendar(sys.stdout, defaults.locale, start, end,
+                                defaults.sleep_requirements)
+        return
+    with open(args.calendar, "w", newline="") as calendar_file:
+        calendar.write_calendar(calendar_file, defaults.locale, start, end,
+                                defaults.sleep_requirements)
+
+
+def write_ephemeris(args: argparse.Namespace, defaults: Any) -> None:
+    """Fit and save the ephemeris asked for, reporting its accuracy."""
+    from datetime import date, datetime, time, timedelta
+
+    from astronomical.model.ephemeris import fit_planet
+
+    start: datetime = datetime.combine(
+        date.fromisoformat(args.start) if args.start else date.today(),
+        time())
+    ephemeris = fit_planet(defaults.locale.planet, start,
+                           start + timedelta(days=args.days))
+    with open(args.ephemeris, "wb") as ephemeris_file:
+        ephemeris.save(ephemeris_file)
+    print(f"{len(ephemeris.coefficients)} segments within "
+          f"{ephemeris.error:.1e} degrees")
+
+
+def write_nbody(args: argparse.Namespace, defaults: Any) -> None:
+    """Integrate the configured bodies, streaming daily states to file."""
+    from datetime import date, datetime, time, timedelta
+
+    from astronomical.model.nbody import NBodySystem, propagate, write_states
+
+    start: datetime = datetime.combine(
+        date.fromisoformat(args.start) if args.start else date.today(),
+        time())
+    if args.step < 1 or timedelta(days=1) % timedelta(minutes=args.step):
+        raise ValueError("The step must be a whole number of minutes "
+                         "dividing a day")
+    planet = defaults.locale.planet
+    bodies = [planet.parent, planet] \
+        + ([defaults.moon] if defaults.moon is not None else [])
+    system = NBodySystem.from_bodies(bodies, start)
+    energy: float = system.energy()
+    per_day: int = 24 * 60 // args.step
+    with open(args.nbody, "wb") as states_file:
+        written: int = write_states(states_file, system, propagate(
+            system, timedelta(minutes=args.step), args.days * per_day,
+            every=per_day))
+    print(f"{written} states of {len(bodies)} bodies; energy conserved to "
+          f"{abs((system.energy() - energy) / energy):.1e}")
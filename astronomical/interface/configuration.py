@@ -101,6 +101,18 @@ class UserDefaults:
                         = datetime.strptime(
                             config["planet"]["ref_midnight"],
                             "%Y-%m-%d %H:%M:%S")
+                    if "ref_perihelion" in config["planet"]:
+                        planet_data["ref_perihelion"] = datetime.strptime(
+                            config["planet"]["ref_perihelion"],
+                            "%Y-%m-%d %H:%M:%S")
+                    if "orbit" in config["planet"]:
+                        planet_data["orbit"] = config["planet"]["orbit"]
+                    if "table_days" in config["planet"]:
+                        data["table_days"] = int(
+                            config["planet"]["table_days"])
+                    if "ephemeris" in config["planet"]:
+                        data["ephemeris"] = expanduser(
+                            config["planet"]["ephemeris"])
                     planet_data["parent"] = star
                     planet: Planet = Planet(**planet_data)
                     data["planet"] = planet
@@ -0,0 +1,142 @@
+"""This module calculates sun times in bulk over a range of days.
+
+Planet-level quantities are worked out once for the whole range. The sun's
+altitude is then sampled over a grid of every day, every coarse sample and
+every site in one array call, half a day either side of each day's local
+noon. The sunrise before noon and the sunset after it are bracketed from the
+grid, as `PlanetaryLocation._calculate_sun_times` finds them, and all the
+brackets are narrowed together by one bisection. No Python loop runs over
+days or sites; long ranges of many sites are taken a block of days at a time
+to bound the grid's size.
+"""
+
+import math
+from datetime import datetime, timedelta
+from typing import NamedTuple, Tuple
+
+import numpy as np
+
+from astronomical.model import array_physics
+from astronomical.model.events import (DEFAULT_TOLERANCE, Daylight,
+                                       bisect_array, crossing_brackets)
+from astronomical.model.solar_system import Planet, PlanetaryLocation
+from astronomical.service.logging import logger
+
+BLOCK_COLUMNS: int = 8192  # days times sites solved in one grid
+
+
+class SunTimesTable(NamedTuple):
+    """Columnar sun times, one row per synodic day.
+
+    Attributes
+    ----------
+    day (ndarray)           midnight starting each synodic day (datetime64)
+    rise (ndarray)          sunrise (datetime64); NaT if the sun does not rise
+    set (ndarray)           sunset (datetime64); NaT if the sun does not set
+    daylight (ndarray)      Daylight value of each day (str)
+    """
+
+    day: np.ndarray
+    rise: np.ndarray
+    set: np.ndarray
+    daylight: np.ndarray
+
+
+def day_starts(planet: Planet, start: datetime, end: datetime
+               ) -> np.ndarray:
+    """Calculate the start (s) of each synodic day overlapping start to end."""
+    syn_day: float = planet._calculate_synodic_day().total_seconds()
+    ref_midnight: float = float(array_physics.to_seconds(planet.ref_midnight))
+    first: int = math.floor(
+        (array_physics.to_seconds(start) - ref_midnight) / syn_day)
+    last: int = math.ceil(
+        (array_physics.to_seconds(end) - ref_midnight) / syn_day)
+    return ref_midnight + syn_day * np.arange(first, max(last, first + 1))
+
+
+def solve_sun_times(planet: Planet, latitudes: np.ndarray,
+                    longitudes: np.ndarray, starts: np.ndarray,
+                    tolerance: timedelta
+                    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Calculate sunrise and sunset for many sites over many days.
+
+    Returns sunrise and sunset (s since the Unix epoch; NaN when absent) and
+    the Daylight value, each shaped (days, sites).
+    """
+    block: int = max(1, BLOCK_COLUMNS // max(1, len(latitudes)))
+    if len(starts) > block:
+        blocks = [solve_sun_times(planet, latitudes, longitudes,
+                                  starts[first:first + block], tolerance)
+                  for first in range(0, len(starts), block)]
+        return tuple(np.concatenate(part)  # type: ignore
+                     for part in zip(*blocks))
+
+    # planet-level quantities, once for the whole range
+    position = planet._calculate_sun_position()
+    syn_day: float = planet._calculate_synodic_day().total_seconds()
+    day_column = np.asarray(starts)[:, np.newaxis]
+    since_march_equinox = day_column \
+        - float(array_physics.to_seconds(planet.ref_march_equinox))
+
+    def sun_altitude(seconds_elapsed: np.ndarray) -> np.ndarray:
+        """Calculate the sun's altitude seconds into each day at each site."""
+        dec, offset = position(since_march_equinox + seconds_elapsed)
+        ha = array_physics.solar_hour_angle(syn_day, seconds_elapsed) \
+            - longitudes + offset
+        return np.asarray(array_physics.altitude(latitudes, dec, ha))
+
+    # local noon, as in PlanetaryLocation._calculate_noon
+    shape: Tuple[int, int] = (len(starts), len(latitudes))
+    offset = position(since_march_equinox + syn_day / 2)[1]
+    noon = np.broadcast_to(
+        syn_day * (((180 + longitudes - offset) / 360) % 1), shape)
+
+    # one column of the sample grid, half a day either side of noon, per day
+    # and site
+    rising, setting, _ = crossing_brackets(
+        lambda points: sun_altitude(noon + points[..., np.newaxis]).reshape(
+            len(points), -1),
+        -syn_day / 2, syn_day / 2)
+    # the sunrise before noon and the sunset after it
+    rising = np.where(rising[1] <= 0.0, rising, np.nan).reshape((2,) + shape)
+    setting = np.where(setting[0] >= 0.0, setting, np.nan).reshape(
+        (2,) + shape)
+    low = noon + np.stack([rising[0], setting[0]])
+    high = noon + np.stack([rising[1], setting[1]])
+
+    events = bisect_array(sun_altitude, low, high, tolerance.total_seconds())
+    daylight: np.ndarray = np.where(
+        ~np.isnan(low).any(axis=0), Daylight.NORMAL.value,
+        np.where(sun_altitude(noon) > 0.0, Daylight.POLAR_DAY.value,
+                 Daylight.POLAR_NIGHT.value)).astype(object)
+    events[:, daylight != Daylight.NORMAL.value] = np.nan
+    return day_column + events[0], day_column + events[1], daylight
+
+
+def sun_times(location: PlanetaryLocation, start: datetime, end: datetime,
+              tolerance: timedelta = DEFAULT_TOLERANCE) -> SunTimesTable:
+    """Calculate sunrise and sunset for each synodic day from start to end.
+
+    Parameters
+    ----------
+    location (PlanetaryLocation)    where to calculate for
+    start (datetime)                the first day is the one containing this
+    end (datetime)                  end of the range (exclusive)
+    tolerance (timedelta)           sunrise/sunset precision (1s)
+
+    Returns
+    -------
+    table (SunTimesTable)           columnar arrays, one row per day
+    """
+    starts: np.ndarray = day_starts(location.planet, start, end)
+    rises, sets, daylight = solve_sun_times(location.planet,
+                                            np.array([location.latitude]),
+                                            np.array([location.longitude]),
+                                            starts, tolerance)
+    table = SunTimesTable(array_physics.to_datetime64(starts),
+                          array_physics.to_datetime64(rises[:, 0]),
+                          array_physics.to_datetime64(sets[:, 0]),
+                          daylight[:, 0].astype(str))
+    logger.debug(f"FUNCTION \"sun_times\": "
+                 f"returns \"{len(starts)}\" days.")
+    return table
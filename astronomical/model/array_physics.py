@@ -0,0 +1,150 @@
+"""Array-native Physics Equations for evaluating many positions at once.
+
+These are the NumPy counterparts of the coordinate functions in the physics
+module. Every argument may be a scalar or an array and arguments broadcast
+against each other, so a grid of sites and instants is a single call. Times
+are float seconds, or datetime64/timedelta64 arrays which are converted to
+seconds (datetime64 relative to the Unix epoch).
+
+The scalar functions in the physics module compute with `math`, which is
+quicker for one value, and hand array arguments on to these.
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Tuple, Union
+
+import numpy as np
+
+from astronomical.model import timescale
+from astronomical.service.logging import base_function
+
+ArrayLike = Union[float, np.ndarray]
+
+EPOCH: np.datetime64 = np.datetime64("1970-01-01T00:00:00", "us")
+ONE_SECOND: np.timedelta64 = np.timedelta64(1, "s")
+
+
+# Conversions
+@base_function
+def to_seconds(value: Any) -> ArrayLike:
+    """Convert times to float seconds.
+
+    Accepts floats, timedelta/timedelta64 (duration in seconds) and
+    datetime/datetime64 (seconds since the Unix epoch), or arrays of them.
+    """
+    if isinstance(value, (float, int)):
+        return float(value)
+    if isinstance(value, np.ndarray) and value.dtype.kind == "f":
+        return value
+    if isinstance(value, (datetime, timedelta)):
+        return timescale.seconds(value)
+    array = np.asarray(value)
+    if array.dtype.kind == "M":
+        return (array - EPOCH) / ONE_SECOND
+    if array.dtype.kind == "m":
+        return array / ONE_SECOND
+    return array.astype(float)
+
+
+@base_function
+def to_datetime64(seconds: ArrayLike) -> np.ndarray:
+    """Convert float seconds since the Unix epoch to datetime64[us].
+
+    NaN seconds become NaT.
+    """
+    seconds = np.asarray(seconds, dtype=float)
+    microseconds = np.round(np.nan_to_num(seconds) * 10**6)
+    instants = EPOCH + microseconds.astype("timedelta64[us]")
+    return np.where(np.isnan(seconds), np.datetime64("NaT"), instants)
+
+
+def any_array(*values: Any) -> bool:
+    """Check whether any of the values is an array."""
+    return any(isinstance(value, np.ndarray) for value in values)
+
+
+# Coordinate calculations for relative celestial bodies
+@base_function
+def right_ascension(time_since_vernal_equinox: ArrayLike,
+                    synodic_day: ArrayLike) -> ArrayLike:
+    """Calculate Right Ascension of parent body (s).
+
+    Returns seconds through the synodic day, a full circle being one day.
+    """
+    return np.mod(to_seconds(time_since_vernal_equinox),
+                  to_seconds(synodic_day))
+
+
+@base_function
+def declination(orbital_obliquity: ArrayLike,
+                sidereal_period: ArrayLike,
+                time_since_march_equinox: ArrayLike) -> ArrayLike:
+    """Calculate declination of the parent body above celestial equator."""
+    orbit_completed = to_seconds(time_since_march_equinox) \
+        / to_seconds(sidereal_period)
+    return orbital_obliquity * np.sin(orbit_completed * (2*np.pi))
+
+
+@base_function
+def solar_hour_angle(synodic_day: ArrayLike,
+                     time_since_midnight: ArrayLike) -> ArrayLike:
+    """Calculate solar hour angle."""
+    second_angle = 360 / to_seconds(synodic_day)
+    return to_seconds(time_since_midnight) * second_angle - 180
+
+
+@base_function
+def elevation(latitude: ArrayLike,
+              declination: ArrayLike,
+              hour_angle: ArrayLike) -> Tuple[ArrayLike, ArrayLike]:
+    """Calculate Azimuth/Altitude of body relative to local position."""
+    alt = altitude(latitude, declination, hour_angle)
+    az = azimuth(latitude, declination, hour_angle, alt)
+    return az, alt
+
+
+@base_function
+def azimuth(latitude: ArrayLike,
+            declination: ArrayLike,
+            hour_angle: ArrayLike,
+            altitude: ArrayLike) -> ArrayLike:
+    """Calculate Azimuth of body from local position.
+
+    North is defined as 0 degrees, with East at 90 degrees.
+    """
+    lat = np.radians(latitude)
+    dec = np.radians(declination)
+    ha = np.radians(hour_angle)
+    alt = np.radians(altitude)
+
+    s_az = (np.cos(lat)*np.sin(dec) - np.sin(lat)*np.cos(dec)*np.cos(ha)) \
+        / np.cos(alt)
+    az = np.degrees(np.arccos(np.clip(s_az, -1, 1)))
+    return np.where(np.asarray(hour_angle) < 0.0, az, 360 - az)
+
+
+@base_function
+def altitude(latitude: ArrayLike,
+             declination: ArrayLike,
+             hour_angle: ArrayLike) -> ArrayLike:
+    """Calculate Altitude from of local position.
+
+    0 degrees is the horizon, 90 degrees is directly over head.
+    """
+    lat = np.radians(latitude)
+    dec = np.radians(declination)
+    ha = np.radians(hour_angle)
+
+    s_alt = np.sin(lat)*np.sin(dec) + np.cos(lat)*np.cos(dec)*np.cos(ha)
+    return np.degrees(np.arcsin(s_alt))
+
+
+@base_function
+def horizon_hour_angle(latitude: ArrayLike,
+                       declination: ArrayLike) -> ArrayLike:
+    """Calculate the hour angle at which a body crosses the horizon.
+
+    Clamped to 0 degrees (never rises) and 180 degrees (never sets).
+    """
+    c_h0 = -np.tan(np.radians(latitude)) * np.tan(np.radians(declination))
+    return np.degrees(np.arccos(np.clip(c_h0, -1, 1)))
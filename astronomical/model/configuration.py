@@ -1,14 +1,20 @@
 """Model module for providing sensible defaults."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime, time, timedelta
+from typing import Optional
 
 from astronomical.model.custom_types import (eccentricity, mass, radius,
                                              real_time)
+from astronomical.model.ephemeris import Ephemeris
+from astronomical.model.kepler import KEPLER
 from astronomical.model.real_world_calculations import State
-from astronomical.model.solar_system import Planet, PlanetaryLocation, Star
+from astronomical.model.solar_system import (Moon, Planet, PlanetaryLocation,
+                                             Star)
 from astronomical.service.logging import logger
 
+TABLE_DAYS: int = 400  # days of sun positions tabulated from the instant
+
 sun = Star(name="The Sun",
            mass=mass(1.9885*10**30),
            radius=radius(696340000))
@@ -30,7 +36,38 @@ earth = Planet(name="Earth",
                                           minute=37),
                ref_midnight=datetime(year=1970,
                                      month=1,
-                                     day=1))
+                                     day=1),
+               ref_perihelion=datetime(year=2021,
+                                       month=1,
+                                       day=2,
+                                       hour=13,
+                                       minute=51))
+
+moon = Moon(name="The Moon",
+            mass=mass(7.342*10**22),
+            radius=radius(1737400),
+            semimajor_axis=radius(384.399*10**6),
+            eccentricity=eccentricity(0.0549),
+            orbital_obliquity=6.68,
+            parent=earth,
+            sidereal_day=real_time(days=27,
+                                   hours=7,
+                                   minutes=43,
+                                   seconds=12),
+            ref_new_moon=datetime(year=2021,
+                                  month=1,
+                                  day=13,
+                                  hour=5,
+                                  minute=0),
+            ref_perigee=datetime(year=2021,
+                                 month=1,
+                                 day=9,
+                                 hour=15,
+                                 minute=39),
+            inclination=5.145,
+            node_longitude=78.2,
+            nodal_period=real_time(days=6798.38),
+            apsidal_period=real_time(days=3232.6))
 
 
 @dataclass
@@ -54,12 +91,16 @@ class Defaults:
     locale (PlanetaryLocation)  localized location to a planet
     state (State)               time dependent PlanetaryLocation
     sleep (SleepRequirements)   sleeping pattern requirements
+    moon (Moon)                 the planet's moon; None if it has none
     """
 
     def __init__(self, sleep: SleepRequirements = SleepRequirements(),
                  location: str = "London", longitude: float = 0.1276,
                  latitude: float = 51.5072, planet: Planet = earth,
-                 instant: datetime = datetime.now()) -> None:
+                 instant: Optional[datetime] = None,
+                 table_days: int = TABLE_DAYS,
+                 ephemeris: Optional[str] = None,
+                 moon: Optional[Moon] = moon) -> None:
         """Initialise with sensible defaults.
 
         Parameters
@@ -70,17 +111,44 @@ class Defaults:
         latitude (float)            positional latitude (51.5072)
         planet (Planet)             localized planet (earth)
         instant (datetime)          required for parent (now)
+        table_days (int)            days of sun positions to tabulate for a
+                                    Keplerian orbit on a copy of the
+                                    planet; 0 for none (400)
+        ephemeris (str)             path to Chebyshev segments fitted for
+                                    the planet, used in place of a table on
+                                    a copy of the planet (None)
+        moon (Moon)                 moon of the planet of the same name
+                                    (moon)
 
         Returns
         -------
         None
         """
+        instant = instant if instant else datetime.now()
+        # segments and tables go on this configuration's own copy of the
+        # planet, so the planet passed in is left as it was
+        if ephemeris:
+            planet = replace(planet)
+            with open(ephemeris, "rb") as segments:
+                planet.use_ephemeris(Ephemeris.load(segments))
+        elif planet.orbit == KEPLER and table_days > 0:
+            # a uniform orbit's declination is one sine, cheaper than
+            # interpolating it
+            planet = replace(planet)
+            planet.tabulate(instant - timedelta(days=1),
+                            instant + timedelta(days=table_days))
         self.location: str = location.title()
         self.longitude: float = longitude
         self.latitude: float = latitude
         self.locale: PlanetaryLocation\
             = PlanetaryLocation(name=location, longitude=longitude,
-                                latitude=latitude, planet=planet)
+                                latitude=latitude, planet=planet,
+                                instant=instant)
         self.state: State = State(instant=instant, location=self.locale)
         self.sleep_requirements = sleep
+        # a configured planet takes the moon of the planet it names
+        self.moon: Optional[Moon] = None
+        if moon is not None and moon.parent.name == planet.name:
+            self.moon = moon if moon.parent is planet \
+                else replace(moon, parent=planet)
         logger.trace(f"CLASS: \"{self.__class__.__name__}\" instantiated.")
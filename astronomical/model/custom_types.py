@@ -1,18 +1,29 @@
-"""Create custom types for astronomical."""
+"""Create custom types for astronomical.
+
+Each type is its base type validated on construction. They declare empty
+slots, so an instance is no bigger than the float or timedelta it wraps.
+"""
 
 
 from datetime import timedelta
+from typing import Any
 
 
 class mass(float):
     """Custom type: mass (kg)."""
 
-    def __init__(self, *args, **kwargs):
-        """Initialise eccentricity."""
-        super(mass, self).__init__()
-        if args[0] <= 0.0:
+    __slots__ = ()
+
+    def __new__(cls, value: Any) -> "mass":
+        """Initialise mass."""
+        if value <= 0.0:
             raise TypeError("Mass cannot be 0 or negative")
-        self.value = args[0]
+        return super().__new__(cls, value)
+
+    @property
+    def value(self) -> float:
+        """Return mass as a float."""
+        return float(self)
 
     def __str__(self):
         """Return mass representation."""
@@ -22,12 +33,18 @@ class mass(float):
 class radius(float):
     """Custom type: radius (m)."""
 
-    def __init__(self, *args, **kwargs):
+    __slots__ = ()
+
+    def __new__(cls, value: Any) -> "radius":
         """Initialise radius."""
-        super(radius, self).__init__()
-        if args[0] <= 0.0:
+        if value <= 0.0:
             raise TypeError("Radius cannot be 0 or negative")
-        self.value = args[0]
+        return super().__new__(cls, value)
+
+    @property
+    def value(self) -> float:
+        """Return radius as a float."""
+        return float(self)
 
     def __str__(self):
         """Return radius representation."""
@@ -37,13 +54,19 @@ class radius(float):
 class eccentricity(float):
     """Custom type: eccentricity."""
 
-    def __init__(self, *args, **kwargs):
+    __slots__ = ()
+
+    def __new__(cls, value: Any) -> "eccentricity":
         """Initialise eccentricity."""
-        super(eccentricity, self).__init__()
-        if not 0.0 < args[0] < 1.0:
+        if not 0.0 < value < 1.0:
             raise TypeError("Elliptic eccentricity can only take values "
                             "between 0 and 1")
-        self.value = args[0]
+        return super().__new__(cls, value)
+
+    @property
+    def value(self) -> float:
+        """Return eccentricity as a float."""
+        return float(self)
 
     def __str__(self):
         """Return eccentricity representation."""
@@ -53,21 +76,19 @@ class eccentricity(float):
 class real_time(timedelta):
     """Custom type: real_time."""
 
-    def __new__(self, *args, **kwargs):
+    __slots__ = ()
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> "real_time":
         """Initialise real time."""
-        if "seconds" in kwargs:
-            if kwargs["seconds"] <= 0:
-                raise TypeError("Real time must not be 0s")
-            self.value = kwargs["seconds"]
-        elif "minutes" in kwargs:
-            if kwargs["minutes"] <= 0:
-                raise TypeError("Real time must not be 0s")
-            self.value = kwargs["minutes"] * 60
-        elif "hours" in kwargs:
-            if kwargs["hours"] <= 0:
-                raise TypeError("Real time must not be 0s")
-            self.value = kwargs["hours"] * 60 * 60
-        return super().__new__(self, *args, **kwargs)
+        instance = super().__new__(cls, *args, **kwargs)
+        if instance <= timedelta(0):
+            raise TypeError("Real time must not be 0s")
+        return instance
+
+    @property
+    def value(self) -> float:
+        """Return real time in seconds."""
+        return self.total_seconds()
 
     def __str__(self):
         """Return real time representation."""
@@ -77,11 +98,13 @@ class real_time(timedelta):
 class angle(float):
     """Custom type: angle."""
 
-    def __init__(self, *args, **kwargs):
-        """Initialise eccentricity."""
-        super(angle, self).__init__()
-        self.value = args[0]
+    __slots__ = ()
+
+    @property
+    def value(self) -> float:
+        """Return angle as a float."""
+        return float(self)
 
     def __str__(self):
-        """Return eccentricity representation."""
+        """Return angle representation."""
         return f"{self.value}"+u"\N{DEGREE SIGN}"
@@ -0,0 +1,281 @@
+"""This module compresses the sun's path into Chebyshev ephemeris segments.
+
+The sun's declination, right ascension and hour angle offset are fitted
+with a Chebyshev series over each of a run of fixed-length segments, as
+published ephemerides are. Finding an instant's segment is one division and
+evaluating it a fixed number of multiplications, so a lookup takes constant
+time whatever the orbit model, and the fit's largest error is measured and
+kept with it.
+
+Segments are saved to a compact binary file: a header followed by the
+coefficients as little-endian doubles. The header records the planet the
+segments were fitted for, so they are only used with the same planet.
+"""
+
+import math
+import struct
+from datetime import datetime, timedelta
+from typing import Any, BinaryIO, List, Optional, Tuple
+
+import numpy as np
+
+from astronomical.model import timescale
+from astronomical.model.array_physics import ArrayLike
+from astronomical.model.event_cache import orbit_key
+from astronomical.model.kepler import SunPosition
+from astronomical.service.logging import logger
+
+SEGMENT_DAYS: int = 32
+DEGREE: int = 10  # highest order of each segment's series
+COMPONENTS: int = 3  # declination, right ascension, hour angle offset
+MAGIC: bytes = b"ASTEPH01"
+HEADER: struct.Struct = struct.Struct("<8sIIdddI")
+
+
+def planet_fingerprint(planet: Any) -> str:
+    """Return the text identifying the planet segments are fitted for."""
+    return repr(orbit_key(planet))
+
+
+def chebyshev_nodes(degree: int) -> np.ndarray:
+    """Return the Chebyshev nodes of a series, ascending from -1 to 1."""
+    count: int = degree + 1
+    return -np.cos(np.pi * (np.arange(count) + 0.5) / count)
+
+
+def clenshaw(series: np.ndarray, index: np.ndarray, x: np.ndarray
+             ) -> np.ndarray:
+    """Sum the Chebyshev series of segments at x in [-1, 1].
+
+    Series are laid out (order, segment), so each order's coefficients are
+    gathered contiguously.
+    """
+    b1 = np.zeros(np.shape(x))
+    b2 = np.zeros(np.shape(x))
+    for order in range(len(series) - 1, 0, -1):
+        b1, b2 = series[order][index] + 2 * x * b1 - b2, b1
+    return series[0][index] + x * b1 - b2
+
+
+class Ephemeris:
+    """The sun's path as Chebyshev segments.
+
+    Times are seconds since the planet's reference March equinox. An
+    ephemeris answers the same questions as the SunPosition it was fitted
+    to; once given to a planet with `Planet.use_ephemeris`, instants outside
+    the segments fall back to the exact calculation.
+
+    Attributes
+    ----------
+    start (float)           start of the first segment (s since equinox)
+    segment (float)         length of each segment (s)
+    coefficients (ndarray)  series of each segment, (segments, 3, degree+1)
+    error (float)           largest error of the fit (degrees)
+    fingerprint (str)       the planet the segments were fitted for
+    position (SunPosition)  exact calculation outside the segments (None)
+    """
+
+    __slots__ = ("start", "segment", "coefficients", "error", "fingerprint",
+                 "position", "synodic_day", "_end", "_series", "_orders")
+
+    def __init__(self, start: float, segment: float,
+                 coefficients: np.ndarray, error: float, fingerprint: str,
+                 synodic_day: float) -> None:
+        """Initialise variables."""
+        self.start: float = start
+        self.segment: float = segment
+        self.coefficients: np.ndarray = coefficients
+        self.error: float = error
+        self.fingerprint: str = fingerprint
+        self.synodic_day: float = synodic_day
+        self.position: Optional[SunPosition] = None
+        self._end: float = start + segment * len(coefficients)
+        # plain floats, as indexing arrays one value at a time is slow
+        self._series: List[List[List[float]]] = coefficients.tolist()
+        self._orders: np.ndarray = np.ascontiguousarray(
+            coefficients.transpose(1, 2, 0))
+
+    @property
+    def approximation(self) -> Tuple[Any, ...]:
+        """Identify the segments, so results from them are cached apart."""
+        segments, _, count = self.coefficients.shape
+        return ("ephemeris", self.start, self.segment, segments, count - 1,
+                self.error)
+
+    def covers(self, since_march_equinox: ArrayLike) -> ArrayLike:
+        """Check whether instants fall within the segments."""
+        return (self.start <= since_march_equinox) \
+            & (since_march_equinox < self._end)
+
+    def declination(self, since_march_equinox: ArrayLike) -> ArrayLike:
+        """Evaluate how far the sun is north of the equator (degrees)."""
+        return self._evaluate(0, since_march_equinox)
+
+    def right_ascension(self, since_march_equinox: ArrayLike) -> ArrayLike:
+        """Evaluate the sun's right ascension (degrees, 0 to 360)."""
+        return self._evaluate(1, since_march_equinox) % 360
+
+    def equation_of_time(self, since_march_equinox: ArrayLike) -> ArrayLike:
+        """Evaluate the equation of time (s); apparent less mean time."""
+        return self._evaluate(2, since_march_equinox) / 360 \
+            * self.synodic_day
+
+    def __call__(self, since_march_equinox: ArrayLike
+                 ) -> Tuple[ArrayLike, ArrayLike]:
+        """Evaluate the declination and hour angle offset (degrees)."""
+        if isinstance(since_march_equinox, float) \
+                and self.start <= since_march_equinox < self._end:
+            x: float = (since_march_equinox - self.start) / self.segment
+            index: int = int(x)
+            series: List[List[float]] = self._series[index]
+            x = 2 * (x - index) - 1
+            return _sum(series[0], x), _sum(series[2], x)
+        return self.declination(since_march_equinox), \
+            self._evaluate(2, since_march_equinox)
+
+    def save(self, destination: BinaryIO) -> None:
+        """Write the segments to a binary file."""
+        fingerprint: bytes = self.fingerprint.encode()
+        segments, _, count = self.coefficients.shape
+        destination.write(HEADER.pack(MAGIC, segments, count - 1, self.start,
+                                      self.segment, self.error,
+                                      len(fingerprint)))
+        destination.write(struct.pack("<d", self.synodic_day))
+        destination.write(fingerprint)
+        destination.write(self.coefficients.astype("<f8").tobytes())
+
+    @classmethod
+    def load(cls, source: BinaryIO) -> "Ephemeris":
+        """Read segments written by `save`."""
+        magic, segments, degree, start, segment, error, length = \
+            HEADER.unpack(source.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError("Not an ephemeris file")
+        synodic_day: float = struct.unpack("<d", source.read(8))[0]
+        fingerprint: str = source.read(length).decode()
+        shape: Tuple[int, int, int] = (segments, COMPONENTS, degree + 1)
+        coefficients: np.ndarray = np.frombuffer(
+            source.read(8 * math.prod(shape)), dtype="<f8").reshape(shape)
+        return cls(start, segment, coefficients.astype(float), error,
+                   fingerprint, synodic_day)
+
+    def _evaluate(self, component: int, since_march_equinox: ArrayLike
+                  ) -> ArrayLike:
+        """Evaluate one component, calculating outside exactly."""
+        t = np.asarray(since_march_equinox, dtype=float)
+        inside = self.covers(t)
+        if not np.all(inside) and self.position is None:
+            raise ValueError("Instant outside the ephemeris")
+        x = (np.where(inside, t, self.start) - self.start) / self.segment
+        index = np.minimum(np.floor(x).astype(int),
+                           len(self.coefficients) - 1)
+        result = clenshaw(self._orders[component], index,
+                          2 * (x - index) - 1)
+        if not np.all(inside) and self.position is not None:
+            result = np.where(inside, result,
+                              _exact(self.position, component, t))
+        return result[()]
+
+
+def _sum(series: List[float], x: float) -> float:
+    """Sum one Chebyshev series at x in [-1, 1]."""
+    b1: float = 0.0
+    b2: float = 0.0
+    for order in range(len(series) - 1, 0, -1):
+        b1, b2 = series[order] + 2 * x * b1 - b2, b1
+    return series[0] + x * b1 - b2
+
+
+def _exact(position: SunPosition, component: int,
+           since_march_equinox: ArrayLike) -> np.ndarray:
+    """Calculate one of the components fitted (degrees)."""
+    if component == 0:
+        return np.asarray(position.declination(since_march_equinox))
+    if component == 1:
+        return np.asarray(position.right_ascension(since_march_equinox))
+    # the uniform model's offset is a plain nought
+    return np.broadcast_to(position(since_march_equinox)[1],
+                           np.shape(since_march_equinox)).astype(float)
+
+
+def fit(position: SunPosition, start: float, segments: int,
+        fingerprint: str, segment: float, degree: int = DEGREE
+        ) -> Ephemeris:
+    """Fit Chebyshev segments to the sun's path.
+
+    Parameters
+    ----------
+    position (SunPosition)  the exact calculation to fit
+    start (float)           start of the first segment (s since equinox)
+    segments (int)          number of segments
+    fingerprint (str)       the planet the segments are for
+    segment (float)         length of each segment (s)
+    degree (int)            highest order of each series (10)
+
+    Returns
+    -------
+    ephemeris (Ephemeris)   the segments, with the largest error found
+                            between the nodes
+    """
+    if segments < 1 or degree < 1:
+        raise ValueError("Ephemerides need a segment and a degree")
+    nodes: np.ndarray = chebyshev_nodes(degree)
+    count: int = degree + 1
+    # coefficients from samples at the nodes; the constant term is halved
+    orders = np.arange(count)
+    transform = 2 / count * np.cos(np.outer(orders, np.arccos(nodes)))
+    transform[0] /= 2
+
+    offsets = start + segment * np.arange(segments)
+    times = (offsets[:, None] + segment * (nodes + 1) / 2).ravel()
+    coefficients = np.empty((segments, COMPONENTS, count))
+    for component in range(COMPONENTS):
+        # angles are unwrapped so each series is smooth
+        samples = _exact(position, component, times)
+        if component:
+            samples = np.unwrap(samples, period=360)
+        coefficients[:, component] = \
+            samples.reshape(segments, count) @ transform.T
+
+    ephemeris = Ephemeris(start, segment, coefficients, 0.0, fingerprint,
+                          position.synodic_day)
+    # largest error midway between the nodes
+    checks = (offsets[:, None]
+              + segment * ((nodes[1:] + nodes[:-1]) / 2 + 1) / 2).ravel()
+    ephemeris.error = max(
+        float(np.abs((ephemeris._evaluate(component, checks)
+                      - _exact(position, component, checks) + 180)
+                     % 360 - 180).max())
+        for component in range(COMPONENTS))
+    return ephemeris
+
+
+def fit_planet(planet: Any, start: datetime, end: datetime,
+               segment_days: int = SEGMENT_DAYS, degree: int = DEGREE
+               ) -> Ephemeris:
+    """Fit Chebyshev segments to a planet's sun from start to end.
+
+    Parameters
+    ----------
+    planet (Planet)         the planet, as configured
+    start (datetime)        start of the first segment
+    end (datetime)          the last segment ends on or after this
+    segment_days (int)      length of each segment (32 days)
+    degree (int)            highest order of each series (10)
+
+    Returns
+    -------
+    ephemeris (Ephemeris)   the segments
+    """
+    segment: float = timedelta(days=segment_days).total_seconds()
+    first: float = timescale.seconds(start) \
+        - timescale.seconds(planet.ref_march_equinox)
+    segments: int = max(1, math.ceil(
+        (timescale.seconds(end) - timescale.seconds(start)) / segment))
+    ephemeris: Ephemeris = fit(planet._calculate_exact_sun_position(), first,
+                               segments, planet_fingerprint(planet), segment,
+                               degree)
+    logger.debug(f"FUNCTION \"fit_planet\": "
+                 f"returns \"{segments}\" segments within "
+                 f"\"{ephemeris.error}\" degrees.")
+    return ephemeris
@@ -0,0 +1,166 @@
+"""This module remembers per-day events across the whole process.
+
+Sun times only change from one synodic day to the next, so they are cached
+by planet, site and day. Every PlanetaryLocation, and so every State and Time
+built on one, reads through the shared cache; a site's sunrise and sunset
+are solved once per day however often they are asked for.
+
+A cache may be backed by a store, such as one on disk, which is consulted
+before calculating and given every newly calculated value.
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import (Any, Callable, Hashable, NamedTuple, Optional, Protocol,
+                    Tuple)
+
+from astronomical.service.logging import logger
+
+DEFAULT_MAXSIZE: int = 4096  # days x sites held before evicting
+SITE_DECIMALS: int = 4  # degrees are rounded to ~11m when keying sites
+EXACT: Tuple[str, ...] = ("exact",)  # sun placed without approximation
+
+
+class CacheStats(NamedTuple):
+    """Cache statistics.
+
+    Attributes
+    ----------
+    hits (int)          lookups answered from the cache
+    misses (int)        lookups that had to be calculated
+    size (int)          entries currently held
+    maxsize (int)       entries held before evicting
+    """
+
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+
+class EventStore(Protocol):
+    """Somewhere beyond the process to keep calculated events."""
+
+    def load(self, key: Hashable) -> Optional[Any]:
+        """Return the value stored for key, or None."""
+        ...
+
+    def save(self, key: Hashable, value: Any) -> None:
+        """Store value for key."""
+        ...
+
+
+class EventCache:
+    """Bounded least-recently-used cache of calculated events.
+
+    Attributes
+    ----------
+    maxsize (int)           entries held before evicting
+    hits (int)              lookups answered from memory
+    misses (int)            lookups not answered from memory
+    store (EventStore)      optional backing store consulted on a miss
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE,
+                 store: Optional[EventStore] = None) -> None:
+        """Initialise an empty cache.
+
+        Parameters
+        ----------
+        maxsize (int)           entries held before evicting (4096)
+        store (EventStore)      optional backing store (None)
+        """
+        if maxsize < 1:
+            raise ValueError("Cache size must be at least 1")
+        self.maxsize: int = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self.store: Optional[EventStore] = store
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock: Lock = Lock()
+        logger.trace(f"CLASS: \"{self.__class__.__name__}\" instantiated.")
+
+    def __len__(self) -> int:
+        """Return the number of entries held."""
+        return len(self._entries)
+
+    def get(self, key: Hashable, calculate: Callable[[], Any]) -> Any:
+        """Return the cached value for key, calculating it on a miss.
+
+        On a miss the store, if any, is tried before calculating, and a
+        newly calculated value is saved to it.
+        """
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            self.misses += 1
+        value = self.store.load(key) if self.store is not None else None
+        if value is None:
+            value = calculate()
+            if self.store is not None:
+                self.store.save(key, value)
+        self.put(key, value)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used if full."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def resize(self, maxsize: int) -> None:
+        """Change the size cap, evicting entries if it shrinks."""
+        if maxsize < 1:
+            raise ValueError("Cache size must be at least 1")
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Forget every entry and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> CacheStats:
+        """Return hit, miss and size statistics."""
+        return CacheStats(self.hits, self.misses, len(self._entries),
+                          self.maxsize)
+
+
+def planet_key(planet: Any) -> Tuple[Any, ...]:
+    """Return the parameters identifying a planet's sun times.
+
+    These are the planet's orbit and rotation and how the sun is placed on
+    it: exactly, or from the table or ephemeris the planet is using.
+    """
+    return orbit_key(planet) + approximation_key(planet)
+
+
+def approximation_key(planet: Any) -> Tuple[Any, ...]:
+    """Return how a planet's sun is placed; tables and ephemerides say."""
+    return getattr(planet._calculate_sun_position(), "approximation",
+                   EXACT)
+
+
+def orbit_key(planet: Any) -> Tuple[Any, ...]:
+    """Return the parameters identifying a planet's orbit and rotation."""
+    return (planet.name, float(planet.mass), float(planet.parent.mass),
+            float(planet.semimajor_axis), float(planet.orbital_obliquity),
+            planet.sidereal_day, planet.ref_march_equinox,
+            planet.ref_midnight, planet.orbit, float(planet.eccentricity),
+            planet.ref_perihelion)
+
+
+def site_key(latitude: float, longitude: float) -> Tuple[float, float]:
+    """Return a site's rounded latitude and longitude."""
+    return round(latitude, SITE_DECIMALS), round(longitude, SITE_DECIMALS)
+
+
+sun_events_cache: EventCache = EventCache()
@@ -0,0 +1,160 @@
+"""Collection of event solvers for finding when things happen.
+
+An event, such as a sunrise or sunset, is the moment a continuous function of
+time (in this case the altitude of the sun) crosses zero. Rather than stepping
+through the day at a fixed resolution, the interval is split into a fixed
+number of coarse brackets and each bracket containing a change of sign is
+narrowed by bisection. The cost therefore depends on the number of samples
+and the tolerance, not on the length of the interval being searched.
+"""
+
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Callable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from astronomical.service.logging import base_function
+
+DEFAULT_SAMPLES: int = 24  # coarse brackets per interval
+DEFAULT_TOLERANCE: timedelta = timedelta(seconds=1)
+
+# sun times engines
+NUMERICAL: str = "numerical"  # bracketed root-finding; any altitude model
+ANALYTIC: str = "analytic"  # closed-form horizon hour angle
+ENGINES: Tuple[str, ...] = (NUMERICAL, ANALYTIC)
+
+
+class Daylight(Enum):
+    """Whether the sun rises and sets on a given day."""
+
+    NORMAL = "normal"
+    POLAR_DAY = "polar day"
+    POLAR_NIGHT = "polar night"
+
+
+class SunEvents(NamedTuple):
+    """Sunrise and sunset for a day.
+
+    Attributes
+    ----------
+    rise (datetime)         sunrise; None if the sun does not rise
+    set (datetime)          sunset; None if the sun does not set
+    daylight (Daylight)     normal, polar day or polar night
+    """
+
+    rise: Optional[datetime]
+    set: Optional[datetime]
+    daylight: Daylight
+
+
+@base_function
+def bisect(function: Callable[[float], float], low: float, high: float,
+           tolerance: float, f_low: Optional[float] = None) -> float:
+    """Narrow a bracketed change of sign down to the tolerance.
+
+    Where:
+    function = continuous function changing sign between low and high
+    low = start of the bracket
+    high = end of the bracket
+    tolerance = maximum width of the final bracket
+    f_low = function(low) if already known
+    """
+    if f_low is None:
+        f_low = function(low)
+    while high - low > tolerance:
+        mid: float = (low + high) / 2
+        f_mid: float = function(mid)
+        if (f_mid < 0.0) == (f_low < 0.0):
+            low, f_low = mid, f_mid
+        else:
+            high = mid
+    return (low + high) / 2
+
+
+@base_function
+def find_crossings(function: Callable[[float], float], start: float,
+                   end: float, tolerance: float,
+                   samples: int = DEFAULT_SAMPLES
+                   ) -> List[Tuple[float, bool]]:
+    """Find every zero crossing of a function between start and end.
+
+    The interval is sampled at samples + 1 evenly spaced points to bracket
+    each change of sign, then each bracket is bisected. Two crossings falling
+    within the same coarse bracket cannot be told apart and are not reported.
+
+    Returns a chronological list of (crossing, rising) pairs, where rising is
+    True when the function goes from negative to positive.
+    """
+    step: float = (end - start) / samples
+    crossings: List[Tuple[float, bool]] = []
+    low: float = start
+    f_low: float = function(low)
+    for sample in range(1, samples + 1):
+        high: float = start + sample * step
+        f_high: float = function(high)
+        if (f_low < 0.0) != (f_high < 0.0):
+            crossing: float = bisect(function, low, high, tolerance, f_low)
+            crossings.append((crossing, f_high > f_low))
+        low, f_low = high, f_high
+    return crossings
+
+
+@base_function
+def bisect_array(function: Callable[[np.ndarray], np.ndarray],
+                 low: np.ndarray, high: np.ndarray,
+                 tolerance: float) -> np.ndarray:
+    """Narrow many bracketed changes of sign down to the tolerance at once.
+
+    Every bracket is halved in lock-step, for as many steps as the widest
+    bracket needs. Brackets given as NaN come back as NaN.
+    """
+    widths = np.asarray(high - low)
+    widest: float = float(np.nanmax(widths)) \
+        if np.isfinite(widths).any() else 0.0
+    steps: int = int(np.ceil(np.log2(widest / tolerance))) \
+        if widest > tolerance else 0
+
+    f_low = function(low)
+    for _ in range(steps):
+        mid = (low + high) / 2
+        f_mid = function(mid)
+        same = (f_mid < 0.0) == (f_low < 0.0)
+        low = np.where(same, mid, low)
+        f_low = np.where(same, f_mid, f_low)
+        high = np.where(same, high, mid)
+    return (low + high) / 2
+
+
+@base_function
+def crossing_brackets(function: Callable[[np.ndarray], np.ndarray],
+                      start: float, end: float,
+                      samples: int = DEFAULT_SAMPLES
+                      ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Bracket the first rising and setting crossing of many functions.
+
+    The function is sampled at samples + 1 evenly spaced points, passed as a
+    column so that it broadcasts against whatever the function varies over.
+
+    Returns rising and setting brackets, each an array of (low, high) pairs
+    with NaN where there is no such crossing, and whether each function was
+    positive at start.
+    """
+    points = np.linspace(start, end, samples + 1)
+    values = function(points[:, np.newaxis])
+    points = np.broadcast_to(points[:, np.newaxis], values.shape)
+    negative = values < 0.0
+    changes = negative[:-1] != negative[1:]
+    rising_changes = changes & negative[:-1]
+    setting_changes = changes & ~negative[:-1]
+
+    def first(found: np.ndarray) -> np.ndarray:
+        """Bracket the first change found in each column."""
+        index = np.argmax(found, axis=0)
+        columns = np.arange(found.shape[1])
+        missing = ~found.any(axis=0)
+        low = np.where(missing, np.nan, points[index, columns])
+        high = np.where(missing, np.nan, points[index + 1, columns])
+        return np.stack([low, high])
+
+    return first(rising_changes), first(setting_changes), ~negative[0]
@@ -0,0 +1,258 @@
+"""This module places the sun by solving Kepler's equation.
+
+The uniform model moves the sun round the ecliptic at a constant rate. On an
+eccentric orbit it moves faster near perihelion (Kepler's second law), which
+shifts its declination and right ascension and makes noon wander either side
+of the clock: the equation of time. Here the mean anomaly is turned into the
+eccentric anomaly by solving Kepler's equation,
+
+    M = E - e sin(E)
+
+with Halley's method, and from that into the true anomaly and the sun's
+ecliptic longitude. Every function takes scalars or arrays.
+"""
+
+import math
+import threading
+from typing import Optional, Tuple
+
+import numpy as np
+
+from astronomical.model import array_physics
+from astronomical.model.array_physics import ArrayLike
+from astronomical.service.logging import base_function
+
+UNIFORM: str = "uniform"
+KEPLER: str = "kepler"
+ORBITS: Tuple[str, ...] = (UNIFORM, KEPLER)
+
+TOLERANCE: float = 1e-12  # radians, relative beyond a turn
+MAX_ITERATIONS: int = 16
+
+
+@base_function
+def eccentric_anomaly(mean_anomaly: ArrayLike, eccentricity: float,
+                      guess: Optional[ArrayLike] = None) -> ArrayLike:
+    """Solve Kepler's equation for the eccentric anomaly (radians).
+
+    Halley's method converges cubically; from the default starting guess,
+    a planet's orbit needs two or three iterations, and from a warm start
+    (see KeplerSolver) usually one. A guess that does not converge is
+    dropped for the default one.
+    """
+    e: float = float(eccentricity)
+    M = np.asarray(mean_anomaly, dtype=float)
+    if M.ndim == 0:
+        return _scalar(float(M), e, None if guess is None else float(guess))
+    E = _cold_start(M, e) if guess is None else np.asarray(guess, dtype=float)
+    E, converged = _halley(M, e, E)
+    if not converged and guess is not None:
+        E, converged = _halley(M, e, _cold_start(M, e))
+    if not converged:
+        raise ArithmeticError("Kepler's equation did not converge")
+    return E[()]
+
+
+def _scalar(M: float, e: float, guess: Optional[float]) -> float:
+    """Solve Kepler's equation for one mean anomaly without NumPy."""
+    limit: float = TOLERANCE * max(1.0, abs(M))
+    cold: float = M + e * math.sin(M) * (1 + e * math.cos(M))
+    for E in ([cold] if guess is None else [guess, cold]):
+        for _ in range(MAX_ITERATIONS):
+            e_sin_E: float = e * math.sin(E)
+            f: float = E - e_sin_E - M
+            f1: float = 1 - e * math.cos(E)
+            step: float = f / (f1 - f * e_sin_E / (2 * f1))
+            E -= step
+            if abs(step) <= limit:
+                return E
+    raise ArithmeticError("Kepler's equation did not converge")
+
+
+def _cold_start(M: np.ndarray, e: float) -> np.ndarray:
+    """Guess the eccentric anomaly from the mean anomaly alone."""
+    return M + e * np.sin(M) * (1 + e * np.cos(M))
+
+
+def _halley(M: np.ndarray, e: float, E: np.ndarray
+            ) -> Tuple[np.ndarray, bool]:
+    """Refine eccentric anomalies with Halley's method.
+
+    Kepler's equation has a single root, so once the steps are within the
+    tolerance the anomalies are solved; returns whether they were. NaN
+    anomalies stay NaN and do not hold up the rest.
+    """
+    # a whole number of turns limits how closely large anomalies resolve
+    limit = TOLERANCE * np.maximum(1.0, np.abs(M))
+    for _ in range(MAX_ITERATIONS):
+        e_sin_E = e * np.sin(E)
+        f = E - e_sin_E - M
+        f1 = 1 - e * np.cos(E)
+        step = f / (f1 - f * e_sin_E / (2 * f1))
+        E = E - step
+        if not np.any(np.abs(step) > limit):
+            return E, True
+    return E, False
+
+
+@base_function
+def true_anomaly(eccentric_anomaly: ArrayLike,
+                 eccentricity: float) -> ArrayLike:
+    """Calculate the true anomaly (radians) from the eccentric anomaly."""
+    e: float = float(eccentricity)
+    half = np.asarray(eccentric_anomaly) / 2
+    return 2 * np.arctan2(math.sqrt(1 + e) * np.sin(half),
+                          math.sqrt(1 - e) * np.cos(half))
+
+
+class KeplerSolver:
+    """Solve Kepler's equation, warm starting from the previous call.
+
+    Consecutive calls with the same shape of mean anomalies (the next step
+    of a search or the next day of a calendar) start from the last answer
+    moved on by the first-order change, E + dM / (1 - e cos E), with whole
+    turns of dM carried over exactly. Solvers are shared between threads
+    through the remembered sun position, so the last answer is read and
+    replaced under a lock.
+    """
+
+    __slots__ = ("eccentricity", "_last", "_lock")
+
+    def __init__(self, eccentricity: float) -> None:
+        """Initialise variables."""
+        self.eccentricity: float = float(eccentricity)
+        self._last: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._lock: threading.Lock = threading.Lock()
+
+    def solve(self, mean_anomaly: ArrayLike) -> ArrayLike:
+        """Return the eccentric anomaly (radians)."""
+        M = np.asarray(mean_anomaly, dtype=float)
+        with self._lock:
+            last: Optional[Tuple[np.ndarray, np.ndarray]] = self._last
+        guess: Optional[np.ndarray] = None
+        if last is not None and last[0].shape == M.shape:
+            last_M, last_E = last
+            change = M - last_M
+            turns = 2 * np.pi * np.round(change / (2 * np.pi))
+            guess = last_E + turns + (change - turns) \
+                / (1 - self.eccentricity * np.cos(last_E))
+        E = eccentric_anomaly(M, self.eccentricity, guess)
+        with self._lock:
+            self._last = (M, np.asarray(E))
+        return E
+
+
+class SunPosition:
+    """The sun's position through a planet's year.
+
+    Times are seconds since the planet's reference March equinox. With the
+    uniform model the equation of time is nil and the declination is that of
+    `array_physics.declination`.
+    """
+
+    __slots__ = ("model", "obliquity", "eccentricity", "period",
+                 "synodic_day", "equinox_anomaly", "equinox_longitude",
+                 "_solver")
+
+    def __init__(self, model: str, obliquity: float, eccentricity: float,
+                 period: float, synodic_day: float,
+                 since_perihelion: Optional[float] = None) -> None:
+        """Initialise variables.
+
+        Parameters
+        ----------
+        model (str)                 "uniform" or "kepler"
+        obliquity (float)           axial tilt relative to orbit (degrees)
+        eccentricity (float)        eccentricity of the orbit
+        period (float)              sidereal period (s)
+        synodic_day (float)         synodic day (s)
+        since_perihelion (float)    time from a perihelion to the reference
+                                    March equinox (s); needed for "kepler"
+        """
+        if model not in ORBITS:
+            raise ValueError(f"Orbit model must be one of {ORBITS}")
+        if model == KEPLER and since_perihelion is None:
+            raise ValueError("Keplerian orbits need a reference perihelion")
+        self.model: str = model
+        self.obliquity: float = obliquity
+        self.eccentricity: float = float(eccentricity)
+        self.period: float = period
+        self.synodic_day: float = synodic_day
+        self._solver: KeplerSolver = KeplerSolver(eccentricity)
+
+        # anomalies at the March equinox, where the ecliptic longitude is 0
+        self.equinox_anomaly: float = 2 * math.pi * (
+            (since_perihelion or 0.0) / period)
+        self.equinox_longitude: float = -float(true_anomaly(
+            eccentric_anomaly(self.equinox_anomaly, eccentricity),
+            eccentricity))
+
+    def longitudes(self, since_march_equinox: ArrayLike
+                   ) -> Tuple[ArrayLike, ArrayLike]:
+        """Calculate the sun's true and mean ecliptic longitude (radians).
+
+        With the uniform model the two are the same.
+        """
+        orbit_completed = array_physics.to_seconds(since_march_equinox) \
+            / self.period
+        if self.model == UNIFORM:
+            return 2 * math.pi * orbit_completed, \
+                2 * math.pi * orbit_completed
+        M = self.equinox_anomaly + 2 * math.pi * orbit_completed
+        E = self._solver.solve(M)
+        return true_anomaly(E, self.eccentricity) + self.equinox_longitude, \
+            M + self.equinox_longitude
+
+    def right_ascension(self, since_march_equinox: ArrayLike) -> ArrayLike:
+        """Calculate the sun's right ascension (degrees, 0 to 360)."""
+        true_longitude, _ = self.longitudes(since_march_equinox)
+        return self._right_ascension(true_longitude) % 360
+
+    def declination(self, since_march_equinox: ArrayLike) -> ArrayLike:
+        """Calculate how far the sun is north of the equator (degrees)."""
+        if self.model == UNIFORM:
+            return array_physics.declination(self.obliquity, self.period,
+                                             since_march_equinox)
+        true_longitude, _ = self.longitudes(since_march_equinox)
+        return self._declination(true_longitude)
+
+    def equation_of_time(self, since_march_equinox: ArrayLike) -> ArrayLike:
+        """Calculate the equation of time (s); apparent less mean time."""
+        if self.model == UNIFORM:
+            return np.zeros_like(array_physics.to_seconds(
+                since_march_equinox), dtype=float)[()]
+        true_longitude, mean_longitude = self.longitudes(since_march_equinox)
+        return self._hour_angle_offset(true_longitude, mean_longitude) \
+            / 360 * self.synodic_day
+
+    def __call__(self, since_march_equinox: ArrayLike
+                 ) -> Tuple[ArrayLike, ArrayLike]:
+        """Calculate the declination and hour angle offset (degrees).
+
+        The offset is the equation of time as an angle, to be added to the
+        mean solar hour angle.
+        """
+        if self.model == UNIFORM:
+            return array_physics.declination(self.obliquity, self.period,
+                                             since_march_equinox), 0.0
+        true_longitude, mean_longitude = self.longitudes(since_march_equinox)
+        return self._declination(true_longitude), \
+            self._hour_angle_offset(true_longitude, mean_longitude)
+
+    def _declination(self, true_longitude: ArrayLike) -> ArrayLike:
+        """Convert ecliptic longitude to declination (degrees)."""
+        return np.degrees(np.arcsin(np.sin(np.radians(self.obliquity))
+                                    * np.sin(true_longitude)))
+
+    def _right_ascension(self, true_longitude: ArrayLike) -> ArrayLike:
+        """Convert ecliptic longitude to right ascension (degrees)."""
+        return np.degrees(np.arctan2(np.cos(np.radians(self.obliquity))
+                                     * np.sin(true_longitude),
+                                     np.cos(true_longitude)))
+
+    def _hour_angle_offset(self, true_longitude: ArrayLike,
+                           mean_longitude: ArrayLike) -> ArrayLike:
+        """Calculate the mean less the true right ascension (degrees)."""
+        offset = np.degrees(mean_longitude) \
+            - self._right_ascension(true_longitude)
+        return (offset + 180) % 360 - 180
@@ -0,0 +1,157 @@
+"""This module provides many locations on a planet, held as arrays.
+
+A LocationSet is the struct-of-arrays counterpart of PlanetaryLocation:
+names, latitudes and longitudes are contiguous arrays bound to one Planet,
+and every query answers for all sites at once.
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Iterable, Optional, Tuple
+
+import numpy as np
+
+from astronomical.model import array_physics
+from astronomical.model.almanac import (SunTimesTable, day_starts,
+                                        solve_sun_times)
+from astronomical.model.events import DEFAULT_TOLERANCE
+from astronomical.model.kepler import KEPLER
+from astronomical.model.solar_system import Planet, PlanetaryLocation
+from astronomical.service.logging import logger
+
+
+class LocationSet:
+    """Locations situated on a planet, held as arrays.
+
+    Attributes
+    ----------
+    names (ndarray)         name of each location
+    longitudes (ndarray)    positional longitude of each location
+    latitudes (ndarray)     positional latitude of each location
+    planet (Planet)         planet every location is on
+    """
+
+    __slots__ = ("names", "longitudes", "latitudes", "planet")
+
+    def __init__(self, names: Iterable[str], longitudes: Iterable[float],
+                 latitudes: Iterable[float], planet: Planet) -> None:
+        """Initialise variables.
+
+        Parameters
+        ----------
+        names (Iterable[str])           name of each location
+        longitudes (Iterable[float])    positional longitude of each location
+        latitudes (Iterable[float])     positional latitude of each location
+        planet (Planet)                 planet every location is on
+        """
+        self.names: np.ndarray = np.asarray(list(names), dtype=str)
+        self.longitudes: np.ndarray = np.asarray(longitudes, dtype=float)
+        self.latitudes: np.ndarray = np.asarray(latitudes, dtype=float)
+        self.planet: Planet = planet
+        if not len(self.names) == len(self.longitudes) \
+                == len(self.latitudes):
+            raise ValueError("Names, longitudes and latitudes must be the "
+                             "same length")
+        logger.trace(f"CLASS: \"{self.__class__.__name__}\" instantiated.")
+
+    @classmethod
+    def from_locations(cls, locations: Iterable[PlanetaryLocation]
+                       ) -> "LocationSet":
+        """Gather PlanetaryLocations on the same planet into a set."""
+        locations = list(locations)
+        planets = {id(location.planet) for location in locations}
+        if len(planets) > 1:
+            raise ValueError("Locations must all be on the same planet")
+        return cls([location.name for location in locations],
+                   [location.longitude for location in locations],
+                   [location.latitude for location in locations],
+                   locations[0].planet)
+
+    def __len__(self) -> int:
+        """Return the number of locations."""
+        return len(self.names)
+
+    def __getitem__(self, index: int) -> PlanetaryLocation:
+        """Return a single location as a PlanetaryLocation."""
+        return PlanetaryLocation(name=str(self.names[index]),
+                                 longitude=float(self.longitudes[index]),
+                                 latitude=float(self.latitudes[index]),
+                                 planet=self.planet)
+
+    def sun_times(self, start: datetime, end: Optional[datetime] = None,
+                  tolerance: timedelta = DEFAULT_TOLERANCE
+                  ) -> SunTimesTable:
+        """Calculate sunrise and sunset at every location.
+
+        Parameters
+        ----------
+        start (datetime)        the first day is the one containing this
+        end (datetime)          end of the range, exclusive (just start's day)
+        tolerance (timedelta)   sunrise/sunset precision (1s)
+
+        Returns
+        -------
+        table (SunTimesTable)   rise, set and daylight shaped (days, sites)
+        """
+        starts: np.ndarray = day_starts(self.planet, start,
+                                        end if end else start)
+        rises, sets, daylight = solve_sun_times(self.planet, self.latitudes,
+                                                self.longitudes, starts,
+                                                tolerance)
+        table = SunTimesTable(array_physics.to_datetime64(starts),
+                              array_physics.to_datetime64(rises),
+                              array_physics.to_datetime64(sets),
+                              daylight.astype(str))
+        logger.debug(f"METHOD \"sun_times\": returns \"{len(starts)}\" "
+                     f"days for \"{len(self)}\" locations.")
+        return table
+
+    def _calculate_sites_shape(self, instants: Any
+                               ) -> Tuple[np.ndarray, Tuple[int, ...]]:
+        """Convert instants to seconds, with the shape of results."""
+        seconds = np.asarray(array_physics.to_seconds(instants))
+        return seconds[..., np.newaxis], seconds.shape + (len(self),)
+
+    def equatorial_coords(self, instants: Any
+                          ) -> Tuple[np.ndarray, np.ndarray]:
+        """Calculate the right ascension and declination.
+
+        Instants may be a datetime or an array of datetime64; results are
+        shaped instants by sites.
+        """
+        seconds, shape = self._calculate_sites_shape(instants)
+        since_march_equinox = seconds \
+            - array_physics.to_seconds(self.planet.ref_march_equinox)
+        if self.planet.orbit == KEPLER:
+            position = self.planet._calculate_sun_position()
+            ra_calc = position.right_ascension(since_march_equinox)
+            dec_calc = position.declination(since_march_equinox)
+        else:
+            ra_calc = 360 * (array_physics.right_ascension(
+                since_march_equinox,
+                self.planet._calculate_synodic_day().total_seconds())
+                / 86400)
+            dec_calc = array_physics.declination(
+                self.planet.orbital_obliquity,
+                self.planet._calculate_orbital_period().total_seconds(),
+                since_march_equinox)
+        ra = np.broadcast_to(ra_calc, shape)
+        dec = np.broadcast_to(dec_calc, shape)
+        return ra, dec
+
+    def elevation(self, instants: Any) -> Tuple[np.ndarray, np.ndarray]:
+        """Calculate the azimuth and altitude.
+
+        Instants may be a datetime or an array of datetime64; results are
+        shaped instants by sites.
+        """
+        seconds, shape = self._calculate_sites_shape(instants)
+        syn_day: float = self.planet._calculate_synodic_day().total_seconds()
+        since_midnight = np.mod(
+            seconds - array_physics.to_seconds(self.planet.ref_midnight),
+            syn_day)
+        dec, offset = self.planet._calculate_sun_position()(
+            seconds - array_physics.to_seconds(self.planet.ref_march_equinox))
+        ha = array_physics.solar_hour_angle(syn_day, since_midnight) \
+            - self.longitudes + offset
+        az, alt = array_physics.elevation(self.latitudes, dec, ha)
+        return np.broadcast_to(az, shape), np.broadcast_to(alt, shape)
@@ -0,0 +1,317 @@
+"""This module calculates the moon's phase, position, moonrise and moonset.
+
+The moon is placed from its orbital elements relative to its planet. Its
+mean longitude runs a synodic month ahead of the sun's from a reference new
+moon; the equation of centre adds its eccentricity, measured from a
+reference perigee along the apsides as they precess; and its latitude
+follows its inclination about the nodes as they regress. The larger
+perturbations of a real moon by its star, such as evection, are left out,
+which leaves the moon's longitude within a degree or two.
+
+Moonrise and moonset are when the centre of the moon crosses the horizon
+as seen from the surface, so the moon's horizontal parallax is allowed for
+but, as for the sun, refraction is not. A moon's day is longer than its
+planet's, so each day has at most one of each; days are solved together
+with the same bracketing and bisection as sun times.
+"""
+
+import math
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Any, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from astronomical.model import array_physics, timescale
+from astronomical.model.almanac import day_starts
+from astronomical.model.array_physics import ArrayLike
+from astronomical.model.event_cache import orbit_key
+from astronomical.model.events import (DEFAULT_TOLERANCE, bisect_array,
+                                       crossing_brackets)
+from astronomical.model.physics import synodic_day
+from astronomical.model.solar_system import Moon, PlanetaryLocation
+from astronomical.service.logging import logger
+
+LUNAR_SAMPLES: int = 24  # coarse brackets per day
+
+
+class Phase(Enum):
+    """The moon's phase, by the angle between it and the sun."""
+
+    NEW = "new moon"
+    WAXING_CRESCENT = "waxing crescent"
+    FIRST_QUARTER = "first quarter"
+    WAXING_GIBBOUS = "waxing gibbous"
+    FULL = "full moon"
+    WANING_GIBBOUS = "waning gibbous"
+    LAST_QUARTER = "last quarter"
+    WANING_CRESCENT = "waning crescent"
+
+
+PHASES: Tuple[Phase, ...] = tuple(Phase)
+
+
+class MoonPosition(NamedTuple):
+    """The moon's position and phase at an instant.
+
+    Attributes
+    ----------
+    ra (float)              right ascension (degrees)
+    dec (float)             declination (degrees)
+    az (float)              azimuth (degrees)
+    alt (float)             altitude (degrees)
+    illumination (float)    fraction of the disc lit
+    phase (Phase)           the phase it is nearest
+    """
+
+    ra: float
+    dec: float
+    az: float
+    alt: float
+    illumination: float
+    phase: Phase
+
+
+class MoonEvents(NamedTuple):
+    """Moonrise and moonset for a day.
+
+    Attributes
+    ----------
+    rise (datetime)         moonrise; None if the moon does not rise
+    set (datetime)          moonset; None if the moon does not set
+    """
+
+    rise: Optional[datetime]
+    set: Optional[datetime]
+
+
+class MoonTimesTable(NamedTuple):
+    """Columnar moon times, one row per synodic day.
+
+    Attributes
+    ----------
+    day (ndarray)           midnight starting each synodic day (datetime64)
+    rise (ndarray)          moonrise (datetime64); NaT if it does not rise
+    set (ndarray)           moonset (datetime64); NaT if it does not set
+    """
+
+    day: np.ndarray
+    rise: np.ndarray
+    set: np.ndarray
+
+
+class LunarOrbit:
+    """A moon's orbit about its planet.
+
+    Times are seconds since the Unix epoch and every method takes scalars
+    or arrays.
+    """
+
+    __slots__ = ("sun", "ref_march_equinox", "ref_midnight", "synodic_day",
+                 "obliquity", "synodic_month", "anomalistic_month",
+                 "nodal_rate", "eccentricity", "inclination", "node",
+                 "new_moon", "perigee", "parallax", "alignment")
+
+    def __init__(self, moon: Moon) -> None:
+        """Derive the orbit from the moon's elements."""
+        if moon.ref_new_moon is None:
+            raise ValueError("Moons need a reference new moon")
+        planet = moon.parent
+        year: float = planet._calculate_orbital_period().total_seconds()
+        month: float = moon.sidereal_day.total_seconds()  # tidally locked
+
+        self.sun = planet._calculate_exact_sun_position()
+        self.ref_march_equinox: float = \
+            timescale.seconds(planet.ref_march_equinox)
+        self.ref_midnight: float = timescale.seconds(planet.ref_midnight)
+        self.synodic_day: float = \
+            planet._calculate_synodic_day().total_seconds()
+        self.obliquity: float = math.radians(planet.orbital_obliquity)
+
+        self.synodic_month: float = synodic_day(year, month).total_seconds()
+        self.anomalistic_month: float = month if moon.apsidal_period is None \
+            else 1 / (1 / month - 1 / moon.apsidal_period.total_seconds())
+        self.nodal_rate: float = 0.0 if moon.nodal_period is None \
+            else -2 * math.pi / moon.nodal_period.total_seconds()
+        self.eccentricity: float = 0.0 if moon.ref_perigee is None \
+            else float(moon.eccentricity)
+        self.inclination: float = math.radians(moon.inclination)
+        self.node: float = math.radians(moon.node_longitude)
+        self.new_moon: float = timescale.seconds(moon.ref_new_moon)
+        self.perigee: float = self.new_moon if moon.ref_perigee is None \
+            else timescale.seconds(moon.ref_perigee)
+        self.parallax: float = math.degrees(
+            math.asin(planet.radius / moon.semimajor_axis))
+
+        # the moon and sun share a true longitude at the reference new moon
+        self.alignment: float = 0.0
+        sun_true, _, moon_longitude, _ = self.longitudes(self.new_moon)
+        self.alignment = float(sun_true - moon_longitude)
+
+    def longitudes(self, instant: ArrayLike
+                   ) -> Tuple[ArrayLike, ArrayLike, ArrayLike, ArrayLike]:
+        """Calculate the ecliptic coordinates of the sun and moon (radians).
+
+        Returns the sun's true and mean longitude and the moon's longitude
+        and latitude.
+        """
+        sun_true, sun_mean = self.sun.longitudes(
+            np.asarray(instant) - self.ref_march_equinox)
+        elapsed = np.asarray(instant) - self.new_moon
+        anomaly = 2 * np.pi * (np.asarray(instant) - self.perigee) \
+            / self.anomalistic_month
+        e: float = self.eccentricity
+        longitude = sun_mean + 2 * np.pi * elapsed / self.synodic_month \
+            + self.alignment + 2 * e * np.sin(anomaly) \
+            + 1.25 * e ** 2 * np.sin(2 * anomaly)
+        node = self.node + self.nodal_rate * elapsed
+        latitude = np.arcsin(math.sin(self.inclination)
+                             * np.sin(longitude - node))
+        return sun_true, sun_mean, longitude, latitude
+
+    def equatorial(self, instant: ArrayLike) -> Tuple[ArrayLike, ArrayLike]:
+        """Calculate right ascension (0 to 360) and declination (degrees)."""
+        _, _, longitude, latitude = self.longitudes(instant)
+        return self._equatorial(longitude, latitude)
+
+    def horizontal(self, latitude: ArrayLike, longitude: ArrayLike,
+                   instant: ArrayLike) -> Tuple[ArrayLike, ArrayLike]:
+        """Calculate azimuth and altitude (degrees) from a site."""
+        _, sun_mean, moon_longitude, moon_latitude = self.longitudes(instant)
+        ra, dec = self._equatorial(moon_longitude, moon_latitude)
+        return array_physics.elevation(
+            latitude, dec,
+            self._hour_angle(longitude, instant, sun_mean, ra))
+
+    def altitude(self, latitude: ArrayLike, longitude: ArrayLike,
+                 instant: ArrayLike) -> ArrayLike:
+        """Calculate how high the moon stands (degrees) from a site."""
+        _, sun_mean, moon_longitude, moon_latitude = self.longitudes(instant)
+        ra, dec = self._equatorial(moon_longitude, moon_latitude)
+        return array_physics.altitude(
+            latitude, dec,
+            self._hour_angle(longitude, instant, sun_mean, ra))
+
+    def elongation(self, instant: ArrayLike) -> ArrayLike:
+        """Calculate the moon's longitude less the sun's (radians, 0-2pi)."""
+        sun_true, _, longitude, _ = self.longitudes(instant)
+        return (longitude - sun_true) % (2 * np.pi)
+
+    def illumination(self, instant: ArrayLike) -> ArrayLike:
+        """Calculate the fraction of the moon's disc lit."""
+        sun_true, _, longitude, latitude = self.longitudes(instant)
+        return (1 - np.cos(latitude) * np.cos(longitude - sun_true)) / 2
+
+    def phase(self, instant: float) -> Phase:
+        """Name the phase the moon is nearest."""
+        eighths: int = round(float(self.elongation(instant))
+                             / (np.pi / 4)) % len(PHASES)
+        return PHASES[eighths]
+
+    def _equatorial(self, longitude: ArrayLike, latitude: ArrayLike
+                    ) -> Tuple[ArrayLike, ArrayLike]:
+        """Convert ecliptic coordinates to equatorial (degrees)."""
+        sin_e: float = math.sin(self.obliquity)
+        cos_e: float = math.cos(self.obliquity)
+        dec = np.arcsin(np.sin(latitude) * cos_e
+                        + np.cos(latitude) * sin_e * np.sin(longitude))
+        ra = np.arctan2(np.sin(longitude) * cos_e - np.tan(latitude) * sin_e,
+                        np.cos(longitude))
+        return np.degrees(ra) % 360, np.degrees(dec)
+
+    def _hour_angle(self, longitude: ArrayLike, instant: ArrayLike,
+                    sun_mean: ArrayLike, ra: ArrayLike) -> ArrayLike:
+        """Calculate the moon's hour angle (degrees, -180 to 180).
+
+        That of the mean sun, as for sun times, moved on by the mean sun's
+        lead in right ascension. It is wrapped as the azimuth takes its
+        side of the meridian from the sign.
+        """
+        day_completed = (np.asarray(instant) - self.ref_midnight) \
+            / self.synodic_day % 1
+        return (360 * day_completed - longitude + np.degrees(sun_mean)
+                - ra) % 360 - 180
+
+
+def lunar_orbit(moon: Moon) -> LunarOrbit:
+    """Return the moon's orbit, remembered until its elements change."""
+    return moon._remember(
+        "lunar_orbit",
+        (orbit_key(moon.parent), float(moon.semimajor_axis),
+         float(moon.eccentricity), moon.sidereal_day, moon.ref_new_moon,
+         moon.ref_perigee, moon.inclination, moon.node_longitude,
+         moon.nodal_period, moon.apsidal_period),
+        lambda: LunarOrbit(moon))
+
+
+def _check_planet(moon: Moon, location: PlanetaryLocation) -> None:
+    """Check the location is on the planet the moon orbits."""
+    if location.planet != moon.parent:
+        raise ValueError(f"{moon.name} does not orbit "
+                         f"{location.planet.name}")
+
+
+def moon_position(moon: Moon, location: PlanetaryLocation,
+                  instant: datetime) -> MoonPosition:
+    """Calculate the moon's position and phase from a location."""
+    _check_planet(moon, location)
+    orbit: LunarOrbit = lunar_orbit(moon)
+    now: float = timescale.seconds(instant)
+    ra, dec = orbit.equatorial(now)
+    az, alt = orbit.horizontal(location.latitude, location.longitude, now)
+    result = MoonPosition(float(ra), float(dec), float(az), float(alt),
+                          float(orbit.illumination(now)), orbit.phase(now))
+    logger.debug(f"FUNCTION \"moon_position\": "
+                 f"returns \"{result}\".")
+    return result
+
+
+def moon_times(moon: Moon, location: PlanetaryLocation, start: datetime,
+               end: datetime, tolerance: timedelta = DEFAULT_TOLERANCE
+               ) -> MoonTimesTable:
+    """Calculate moonrise and moonset for each synodic day from start to end.
+
+    Parameters
+    ----------
+    moon (Moon)                     the moon to calculate for
+    location (PlanetaryLocation)    where to calculate for
+    start (datetime)                the first day is the one containing this
+    end (datetime)                  end of the range (exclusive)
+    tolerance (timedelta)           moonrise/set precision (1s)
+
+    Returns
+    -------
+    table (MoonTimesTable)          columnar arrays, one row per day
+    """
+    _check_planet(moon, location)
+    orbit: LunarOrbit = lunar_orbit(moon)
+    starts: np.ndarray = day_starts(location.planet, start, end)
+
+    def above_horizon(seconds_elapsed: Any) -> np.ndarray:
+        """Calculate the moon's altitude, less parallax, into each day."""
+        return np.asarray(orbit.altitude(
+            location.latitude, location.longitude,
+            starts + seconds_elapsed)) - orbit.parallax
+
+    rising, setting, _ = crossing_brackets(above_horizon, 0.0,
+                                           orbit.synodic_day, LUNAR_SAMPLES)
+    found = bisect_array(above_horizon,
+                         np.stack([rising[0], setting[0]]),
+                         np.stack([rising[1], setting[1]]),
+                         tolerance.total_seconds())
+    table = MoonTimesTable(array_physics.to_datetime64(starts),
+                           array_physics.to_datetime64(starts + found[0]),
+                           array_physics.to_datetime64(starts + found[1]))
+    logger.debug(f"FUNCTION \"moon_times\": "
+                 f"returns \"{len(starts)}\" days.")
+    return table
+
+
+def moon_events(moon: Moon, location: PlanetaryLocation,
+                instant: datetime) -> MoonEvents:
+    """Calculate moonrise and moonset for the day containing instant."""
+    table = moon_times(moon, location, instant, instant)
+    rise, fall = (None if np.isnat(event[0]) else
+                  event[0].astype("datetime64[us]").astype(datetime)
+                  for event in (table.rise, table.set))
+    return MoonEvents(rise, fall)
@@ -1,6 +1,7 @@
 """This module calculates the orbital mechanics."""
 
 from datetime import timedelta
+from typing import Any, Callable, Dict, Tuple
 
 from ..model.celestials import OrbitalBody, SpinningBody
 from ..model.custom_types import eccentricity, mass, radius, real_time
@@ -9,6 +10,28 @@ from ..model.physics import (angular_velocity, gravitational_force,
 from ..service.logging import logger
 
 
+class DerivedParameters:
+    """Remember derived parameters of a body.
+
+    Each parameter is stored with the inputs it was derived from and is
+    recalculated as soon as any of those inputs differ, so changing a body's
+    mass, semimajor axis or sidereal day (or its parent's mass) is always
+    reflected while repeated reads cost a comparison.
+    """
+
+    def _remember(self, name: str, inputs: Tuple[Any, ...],
+                  calculate: Callable[[], Any]) -> Any:
+        """Return the remembered parameter, recalculating if stale."""
+        derived: Dict[str, Tuple[Tuple[Any, ...], Any]] = \
+            self.__dict__.setdefault("_derived", {})
+        remembered = derived.get(name)
+        if remembered is not None and remembered[0] == inputs:
+            return remembered[1]
+        result = calculate()
+        derived[name] = (inputs, result)
+        return result
+
+
 class RotationalMechanicsService(SpinningBody):
     """Execute orbital calculations."""
 
@@ -23,7 +46,7 @@ class RotationalMechanicsService(SpinningBody):
         return result
 
 
-class OrbitalMechanicsService(OrbitalBody):
+class OrbitalMechanicsService(OrbitalBody, DerivedParameters):
     """Execute orbital calculations."""
 
     def _calculate_gravitational_force(self) -> float:
@@ -41,8 +64,16 @@ class OrbitalMechanicsService(OrbitalBody):
     def _calculate_orbital_period(self) -> real_time:
         """Apply Kepler's Law of Periods.
 
-        Returns period (timedelta); also known as the sidereal period.
+        Returns period (timedelta); also known as the sidereal period. The
+        result is remembered until the masses or semimajor axis change.
         """
+        return self._remember("orbital_period",
+                              (self.mass, self.parent.mass,
+                               self.semimajor_axis),
+                              self._derive_orbital_period)
+
+    def _derive_orbital_period(self) -> real_time:
+        """Calculate the orbital period afresh."""
         result = law_of_periods(self.mass,
                                 self.parent.mass,
                                 self.semimajor_axis)
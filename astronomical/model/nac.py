@@ -0,0 +1,326 @@
+"""This module converts between standard time and NAC time in bulk.
+
+NAC time gives each day and each night twelve hours, so converting an
+instant needs that day's sunrise and sunset. Converting a stream of instants
+one `Time` at a time would build a `State` for every record; here the sun
+events are fetched once per day and reused for every instant that falls in
+it.
+
+Both times share calendar midnight. Standard time is recovered from NAC time
+segment by segment: before 6am from midnight at the night rate, in the day
+from sunrise at the day rate and after 6pm from sunset at the night rate.
+The forward conversion counts whole NAC seconds, so a round trip is good to
+a second. Where sunrise is not in the middle of the night, the NACs before
+sunrise can run past 6am; those NAC times are read as the day's. Both
+directions take the sun events of the synodic day holding the calendar
+day's noon (see `day_noon`); a synodic day's start drifts from midnight, so
+the instant's own synodic day can be the next day's.
+"""
+
+from datetime import date, datetime, timedelta
+from typing import Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+
+from astronomical.model import almanac, array_physics, timescale
+from astronomical.model.events import DEFAULT_TOLERANCE, NUMERICAL, SunEvents
+from astronomical.model.solar_system import PlanetaryLocation
+from astronomical.model.timescale import SECONDS_PER_DAY
+
+NAC_PERIOD: int = 43200  # NACs in each day and each night
+NAC_SUNRISE: int = 21600  # 6am
+NAC_SUNSET: int = 64800  # 6pm
+NAC_HOUR: int = 3600
+
+
+def day_noon(std_time: float) -> float:
+    """Return noon (s since the epoch) of the calendar day of a time.
+
+    The sun events of the synodic day holding it are those NAC time keeps
+    to for the whole calendar day.
+    """
+    return timescale.period_start(std_time, 0.0, SECONDS_PER_DAY) \
+        + SECONDS_PER_DAY / 2
+
+
+def nac_seconds(std_time: float, sunrise: float, sunset: float,
+                sidereal_day: float) -> float:
+    """Calculate NAC time (s since the epoch) from standard time.
+
+    NAC is the calculated time (NACs is NAC seconds)
+    STD is the standard time (STDs is standard seconds)
+    """
+    midnight: float = timescale.period_start(std_time, 0.0, SECONDS_PER_DAY)
+    std_daylight: int = int(sunset - sunrise)
+    std_night: int = int(sidereal_day - std_daylight)
+
+    # Calculate time based on day/night window
+    if std_time < sunrise:
+        NACs: int = int(NAC_PERIOD / std_night * (std_time - midnight))
+    elif std_time < sunset:
+        NACs = int(NAC_PERIOD / std_daylight * (std_time - sunrise)) \
+            + NAC_SUNRISE
+    else:
+        NACs = int(NAC_PERIOD / std_night * (std_time - sunset)) \
+            + NAC_SUNSET
+    return midnight + NACs
+
+
+def nac_seconds_array(std_times: np.ndarray, sunrises: np.ndarray,
+                      sunsets: np.ndarray, sidereal_day: float
+                      ) -> np.ndarray:
+    """Calculate NAC times (s since the epoch) for arrays of standard times.
+
+    The array counterpart of `nac_seconds`; sunrises and sunsets broadcast
+    against std_times and NaN sun events give NaN.
+    """
+    midnight = np.floor(std_times / SECONDS_PER_DAY) * SECONDS_PER_DAY
+    std_daylight = np.trunc(sunsets - sunrises)
+    std_night = np.trunc(sidereal_day - std_daylight)
+    with np.errstate(invalid="ignore"):
+        NACs = np.where(
+            std_times < sunrises,
+            np.trunc(NAC_PERIOD / std_night * (std_times - midnight)),
+            np.where(std_times < sunsets,
+                     np.trunc(NAC_PERIOD / std_daylight
+                              * (std_times - sunrises)) + NAC_SUNRISE,
+                     np.trunc(NAC_PERIOD / std_night
+                              * (std_times - sunsets)) + NAC_SUNSET))
+    return np.where(np.isnan(sunrises + sunsets), np.nan, midnight + NACs)
+
+
+def std_seconds(nac_time: float, sunrise: float, sunset: float,
+                sidereal_day: float) -> float:
+    """Calculate standard time (s since the epoch) from NAC time.
+
+    The inverse of `nac_seconds` for the same day's sunrise and sunset.
+    """
+    midnight: float = timescale.period_start(nac_time, 0.0, SECONDS_PER_DAY)
+    std_daylight: int = int(sunset - sunrise)
+    std_night: int = int(sidereal_day - std_daylight)
+    NACs: float = nac_time - midnight
+
+    if NACs < NAC_SUNRISE:
+        return midnight + NACs * std_night / NAC_PERIOD
+    if NACs < NAC_SUNSET:
+        return sunrise + (NACs - NAC_SUNRISE) * std_daylight / NAC_PERIOD
+    return sunset + (NACs - NAC_SUNSET) * std_night / NAC_PERIOD
+
+
+def std_seconds_array(nac_times: np.ndarray, sunrises: np.ndarray,
+                      sunsets: np.ndarray, sidereal_day: float
+                      ) -> np.ndarray:
+    """Calculate standard times (s since the epoch) for arrays of NAC times.
+
+    The array counterpart of `std_seconds`; NaN sun events give NaN.
+    """
+    midnight = np.floor(nac_times / SECONDS_PER_DAY) * SECONDS_PER_DAY
+    std_daylight = np.trunc(sunsets - sunrises)
+    std_night = np.trunc(sidereal_day - std_daylight)
+    NACs = nac_times - midnight
+    return np.where(
+        NACs < NAC_SUNRISE, midnight + NACs * std_night / NAC_PERIOD,
+        np.where(NACs < NAC_SUNSET,
+                 sunrises + (NACs - NAC_SUNRISE) * std_daylight / NAC_PERIOD,
+                 sunsets + (NACs - NAC_SUNSET) * std_night / NAC_PERIOD))
+
+
+def _day_events(events: SunEvents) -> Tuple[float, float]:
+    """Return sunrise and sunset (s), refusing polar days and nights."""
+    if events.rise is None or events.set is None:
+        raise ValueError(f"NAC time is undefined during "
+                         f"{events.daylight.value}.")
+    return timescale.seconds(events.rise), timescale.seconds(events.set)
+
+
+def _daily_events(location: PlanetaryLocation, days: np.ndarray,
+                  tolerance: timedelta, engine: str
+                  ) -> Tuple[np.ndarray, np.ndarray]:
+    """Fetch sunrise and sunset (s; NaN when absent) for synodic days.
+
+    Days are indices from the planet's reference midnight. Numerical sun
+    times are solved for every day at once by the almanac; analytic ones
+    are closed-form and are looked up day by day through the sun events
+    cache.
+    """
+    planet = location.planet
+    syn_day: float = planet._calculate_synodic_day().total_seconds()
+    ref_midnight: float = timescale.seconds(planet.ref_midnight)
+    if engine == NUMERICAL:
+        solved = almanac.solve_sun_times(
+            planet, np.array([location.latitude]),
+            np.array([location.longitude]), ref_midnight + days * syn_day,
+            tolerance)
+        return solved[0][:, 0], solved[1][:, 0]
+    rises: np.ndarray = np.full(len(days), np.nan)
+    sets: np.ndarray = np.full(len(days), np.nan)
+    for index, day in enumerate(days):
+        # the middle of the day, clear of rounding at its edges
+        events = location.sun_events_at(
+            timescale.to_datetime(ref_midnight + (day + 0.5) * syn_day),
+            tolerance, engine)
+        if events.rise is not None and events.set is not None:
+            rises[index] = timescale.seconds(events.rise)
+            sets[index] = timescale.seconds(events.set)
+    return rises, sets
+
+
+def stream(instants: Iterable[datetime], location: PlanetaryLocation,
+           tolerance: timedelta = DEFAULT_TOLERANCE,
+           engine: str = NUMERICAL) -> Iterator[datetime]:
+    """Convert standard times to NAC times lazily, one per instant.
+
+    Sunrise and sunset are fetched when an instant falls in a different
+    calendar day to the one before, so instants in order cost one sun events
+    lookup per day. As with `Time`, a ValueError is raised on reaching an
+    instant in a polar day or night.
+
+    Parameters
+    ----------
+    instants (Iterable[datetime])   standard times, ideally in order
+    location (PlanetaryLocation)    where the times are kept
+    tolerance (timedelta)           sunrise/sunset precision (1s)
+    engine (str)                    "numerical" or "analytic" sun times
+
+    Yields
+    ------
+    nac (datetime)                  NAC time of each instant
+    """
+    sidereal_day: float = location.planet.sidereal_day.total_seconds()
+    current_noon: Optional[float] = None
+    sunrise: float = 0.0
+    sunset: float = 0.0
+    for instant in instants:
+        std_time: float = timescale.seconds(instant)
+        noon: float = day_noon(std_time)
+        if noon != current_noon:
+            sunrise, sunset = _day_events(location.sun_events_at(
+                timescale.to_datetime(noon), tolerance, engine))
+            current_noon = noon
+        yield timescale.to_datetime(
+            nac_seconds(std_time, sunrise, sunset, sidereal_day))
+
+
+def convert(instants: np.ndarray, location: PlanetaryLocation,
+            tolerance: timedelta = DEFAULT_TOLERANCE,
+            engine: str = NUMERICAL) -> np.ndarray:
+    """Convert an array of standard times to NAC times in one pass.
+
+    Sun events are fetched once for each distinct day in the array, in any
+    order. Instants in a polar day or night give NaT.
+
+    Parameters
+    ----------
+    instants (ndarray)              standard times (datetime64)
+    location (PlanetaryLocation)    where the times are kept
+    tolerance (timedelta)           sunrise/sunset precision (1s)
+    engine (str)                    "numerical" or "analytic" sun times
+
+    Returns
+    -------
+    nac (ndarray)                   NAC times (datetime64)
+    """
+    planet = location.planet
+    syn_day: float = planet._calculate_synodic_day().total_seconds()
+    ref_midnight: float = timescale.seconds(planet.ref_midnight)
+    std_times = np.asarray(array_physics.to_seconds(instants), dtype=float)
+
+    noons = np.floor(std_times / SECONDS_PER_DAY) * SECONDS_PER_DAY \
+        + SECONDS_PER_DAY / 2
+    days, positions = np.unique(np.floor((noons - ref_midnight) / syn_day),
+                                return_inverse=True)
+    rises, sets = _daily_events(location, days, tolerance, engine)
+
+    nacs = nac_seconds_array(std_times, rises[positions].reshape(
+        std_times.shape), sets[positions].reshape(std_times.shape),
+        planet.sidereal_day.total_seconds())
+    return array_physics.to_datetime64(nacs)
+
+
+def to_standard(nac_time: datetime, location: PlanetaryLocation,
+                tolerance: timedelta = DEFAULT_TOLERANCE,
+                engine: str = NUMERICAL) -> datetime:
+    """Convert a NAC time to standard time.
+
+    The sun events used are those of the synodic day holding noon of the
+    NAC time's calendar day, as in the forward conversion. As with `Time`,
+    a ValueError is raised in a polar day or night.
+
+    Parameters
+    ----------
+    nac_time (datetime)             NAC time to convert
+    location (PlanetaryLocation)    where the times are kept
+    tolerance (timedelta)           sunrise/sunset precision (1s)
+    engine (str)                    "numerical" or "analytic" sun times
+
+    Returns
+    -------
+    std (datetime)                  standard time
+    """
+    nac: float = timescale.seconds(nac_time)
+    sunrise, sunset = _day_events(location.sun_events_at(
+        timescale.to_datetime(day_noon(nac)), tolerance, engine))
+    return timescale.to_datetime(std_seconds(
+        nac, sunrise, sunset, location.planet.sidereal_day.total_seconds()))
+
+
+def to_standard_array(nac_times: np.ndarray, location: PlanetaryLocation,
+                      tolerance: timedelta = DEFAULT_TOLERANCE,
+                      engine: str = NUMERICAL) -> np.ndarray:
+    """Convert an array of NAC times to standard times in one pass.
+
+    Sun events are fetched for every distinct calendar day in the array in
+    one bulk solve. NAC times in a polar day or night give NaT.
+
+    Parameters
+    ----------
+    nac_times (ndarray)             NAC times (datetime64)
+    location (PlanetaryLocation)    where the times are kept
+    tolerance (timedelta)           sunrise/sunset precision (1s)
+    engine (str)                    "numerical" or "analytic" sun times
+
+    Returns
+    -------
+    std (ndarray)                   standard times (datetime64)
+    """
+    planet = location.planet
+    syn_day: float = planet._calculate_synodic_day().total_seconds()
+    ref_midnight: float = timescale.seconds(planet.ref_midnight)
+    nacs = np.asarray(array_physics.to_seconds(nac_times), dtype=float)
+
+    noons = np.floor(nacs / SECONDS_PER_DAY) * SECONDS_PER_DAY \
+        + SECONDS_PER_DAY / 2
+    days, positions = np.unique(np.floor((noons - ref_midnight) / syn_day),
+                                return_inverse=True)
+    rises, sets = _daily_events(location, days, tolerance, engine)
+
+    std_times = std_seconds_array(
+        nacs, rises[positions].reshape(nacs.shape),
+        sets[positions].reshape(nacs.shape),
+        planet.sidereal_day.total_seconds())
+    return array_physics.to_datetime64(std_times)
+
+
+def hour_boundaries(location: PlanetaryLocation, start: date, end: date,
+                    tolerance: timedelta = DEFAULT_TOLERANCE,
+                    engine: str = NUMERICAL) -> np.ndarray:
+    """Calculate the standard time at which each NAC hour begins.
+
+    Parameters
+    ----------
+    location (PlanetaryLocation)    where the times are kept
+    start (date)                    first day
+    end (date)                      end of the range (exclusive)
+    tolerance (timedelta)           sunrise/sunset precision (1s)
+    engine (str)                    "numerical" or "analytic" sun times
+
+    Returns
+    -------
+    boundaries (ndarray)            standard times (datetime64) shaped
+                                    (days, 24); row d, column h is NAC
+                                    hour h of day d
+    """
+    days = np.arange(np.datetime64(start, "D"), np.datetime64(end, "D"))
+    nac_times = days[:, np.newaxis].astype("datetime64[us]") \
+        + np.arange(0, SECONDS_PER_DAY, NAC_HOUR).astype("timedelta64[s]")
+    return to_standard_array(nac_times, location, tolerance, engine)
@@ -0,0 +1,343 @@
+"""This module propagates stars, planets and moons as an N-body system.
+
+The rest of the model treats each orbit as a two-body problem. Here every
+body pulls on every other: all pairwise accelerations are worked out
+together with NumPy, and the system is stepped with a symplectic
+integrator, either leapfrog (second order, one force evaluation a step) or
+Yoshida's fourth order composition of it (three), so energy does not drift
+over long integrations.
+
+A system starts from each body's orbital elements at an epoch, relative to
+its parent, and is moved to its barycentre. Integrations are generators
+that yield the state as often as asked, so the states can be streamed to
+disk (see `write_states`), and they can save checkpoints to resume from.
+
+Positions are in metres, velocities in metres per second and times in
+seconds since the Unix epoch.
+"""
+
+import math
+import os
+import struct
+from datetime import datetime, timedelta
+from typing import (BinaryIO, Dict, Iterable, Iterator, List, NamedTuple,
+                    Optional, Sequence, Tuple, Union)
+
+import numpy as np
+
+from astronomical.model import timescale
+from astronomical.model.celestials import Body, OrbitalBody
+from astronomical.model.kepler import eccentric_anomaly, true_anomaly
+from astronomical.model.lunar import lunar_orbit
+from astronomical.model.physics import G
+from astronomical.model.solar_system import Moon, Planet
+from astronomical.service.logging import logger
+
+LEAPFROG: str = "leapfrog"
+YOSHIDA: str = "yoshida"
+METHODS: Tuple[str, ...] = (LEAPFROG, YOSHIDA)
+
+# drift and kick weights of each method's stages
+_W1: float = 1 / (2 - 2 ** (1 / 3))
+_W0: float = 1 - 2 * _W1
+STAGES: Dict[str, Tuple[Tuple[float, ...], Tuple[float, ...]]] = {
+    LEAPFROG: ((0.5, 0.5), (1.0,)),
+    YOSHIDA: ((_W1 / 2, (_W0 + _W1) / 2, (_W0 + _W1) / 2, _W1 / 2),
+              (_W1, _W0, _W1)),
+}
+
+MAGIC: bytes = b"ASTNBD01"
+
+
+class NBodyState(NamedTuple):
+    """The bodies' positions and velocities at an instant.
+
+    Attributes
+    ----------
+    time (float)            instant (s since the Unix epoch)
+    positions (ndarray)     barycentric positions (m), one row per body
+    velocities (ndarray)    barycentric velocities (m/s), one row per body
+    """
+
+    time: float
+    positions: np.ndarray
+    velocities: np.ndarray
+
+
+class NBodySystem:
+    """Bodies moving under their mutual gravity.
+
+    Attributes
+    ----------
+    names (List[str])       name of each body
+    masses (ndarray)        mass of each body (kg)
+    state (NBodyState)      the latest state
+    """
+
+    __slots__ = ("names", "masses", "state", "_gm")
+
+    def __init__(self, names: Sequence[str],
+                 masses: Union[Sequence[float], np.ndarray],
+                 state: NBodyState) -> None:
+        """Initialise variables."""
+        self.names: List[str] = list(names)
+        self.masses: np.ndarray = np.asarray(masses, dtype=float)
+        self.state: NBodyState = state
+        self._gm: np.ndarray = G * self.masses
+
+    @classmethod
+    def from_bodies(cls, bodies: Sequence[Body], epoch: datetime
+                    ) -> "NBodySystem":
+        """Place bodies on their orbits at an epoch.
+
+        Each orbiting body's parent must be among the bodies. Bodies
+        without a parent, such as stars, start at rest at the origin before
+        the whole system is moved to its barycentre.
+        """
+        now: float = timescale.seconds(epoch)
+        index: Dict[int, int] = {id(body): row
+                                 for row, body in enumerate(bodies)}
+        positions = np.zeros((len(bodies), 3))
+        velocities = np.zeros((len(bodies), 3))
+        placed: List[bool] = [False] * len(bodies)
+
+        def place(row: int) -> None:
+            """Place a body after its parent."""
+            body = bodies[row]
+            if placed[row]:
+                return
+            if isinstance(body, OrbitalBody):
+                parent: int = index.get(id(body.parent), -1)
+                if parent < 0:
+                    raise ValueError(f"The parent of {body.name} is not "
+                                     f"in the system")
+                place(parent)
+                offset, speed = _relative_state(body, now)
+                positions[row] = positions[parent] + offset
+                velocities[row] = velocities[parent] + speed
+            placed[row] = True
+
+        for row in range(len(bodies)):
+            place(row)
+        masses = np.array([float(body.mass) for body in bodies])
+        positions -= masses @ positions / masses.sum()
+        velocities -= masses @ velocities / masses.sum()
+        return cls([body.name for body in bodies], masses,
+                   NBodyState(now, positions, velocities))
+
+    def accelerations(self, positions: np.ndarray) -> np.ndarray:
+        """Calculate every body's acceleration from all the others."""
+        separations = positions[np.newaxis, :, :] \
+            - positions[:, np.newaxis, :]
+        distances = np.einsum("ijk,ijk->ij", separations, separations)
+        np.fill_diagonal(distances, np.inf)
+        weights = self._gm / (distances * np.sqrt(distances))
+        return np.einsum("ij,ijk->ik", weights, separations)
+
+    def energy(self, state: Optional[NBodyState] = None) -> float:
+        """Sum a state's kinetic and potential energy, in joules."""
+        state = state or self.state
+        kinetic: float = 0.5 * float(
+            self.masses @ np.einsum("ij,ij->i", state.velocities,
+                                    state.velocities))
+        separations = state.positions[np.newaxis, :, :] \
+            - state.positions[:, np.newaxis, :]
+        distances = np.sqrt(np.einsum("ijk,ijk->ij", separations,
+                                      separations))
+        upper = np.triu_indices(len(self.masses), 1)
+        potential: float = -G * float(np.sum(
+            np.outer(self.masses, self.masses)[upper] / distances[upper]))
+        return kinetic + potential
+
+
+def _relative_state(body: OrbitalBody, now: float
+                    ) -> Tuple[np.ndarray, np.ndarray]:
+    """Calculate a body's position and velocity relative to its parent.
+
+    Planets orbit in the plane of the ecliptic, with the perihelion placed
+    so that the parent star is at the March equinox on the reference date.
+    Moons orbit inclined about their nodes, with the perigee where the
+    lunar engine puts it.
+    """
+    e: float = float(body.eccentricity)
+    a: float = float(body.semimajor_axis)
+    mu: float = G * (float(body.parent.mass) + float(body.mass))
+    period: float = 2 * math.pi * math.sqrt(a ** 3 / mu)
+    inclination: float = 0.0
+    node: float = 0.0
+    if isinstance(body, Planet):
+        reference: float = timescale.seconds(
+            body.ref_perihelion or body.ref_march_equinox)
+        equinox_anomaly: float = 2 * math.pi * (
+            timescale.seconds(body.ref_march_equinox) - reference) / period
+        # the planet is opposite its star's March equinox point then
+        longitude: float = math.pi - float(true_anomaly(
+            eccentric_anomaly(equinox_anomaly, e), e))
+    elif isinstance(body, Moon):
+        orbit = lunar_orbit(body)
+        e = orbit.eccentricity
+        # the perigee turns, so take the latest before the epoch
+        reference = orbit.perigee + orbit.anomalistic_month * math.floor(
+            (now - orbit.perigee) / orbit.anomalistic_month)
+        inclination = orbit.inclination
+        node = orbit.node + orbit.nodal_rate * (now - orbit.new_moon)
+        longitude = float(orbit.longitudes(reference)[2])
+    else:
+        reference, longitude = 0.0, 0.0
+    anomaly: float = float(eccentric_anomaly(
+        2 * math.pi * ((now - reference) / period % 1), e))
+
+    # in the orbit's plane, with the periapsis along the first axis
+    rate: float = math.sqrt(mu / a ** 3) / (1 - e * math.cos(anomaly))
+    plane_position = np.array([a * (math.cos(anomaly) - e),
+                               a * math.sqrt(1 - e ** 2) * math.sin(anomaly),
+                               0.0])
+    plane_velocity = np.array([-a * rate * math.sin(anomaly),
+                               a * rate * math.sqrt(1 - e ** 2)
+                               * math.cos(anomaly), 0.0])
+    rotation = _rotation(node, inclination, longitude - node)
+    return rotation @ plane_position, rotation @ plane_velocity
+
+
+def _rotation(node: float, inclination: float, argument: float
+              ) -> np.ndarray:
+    """Rotate an orbit's plane into the ecliptic frame."""
+    def about_z(angle: float) -> np.ndarray:
+        """Rotate about the third axis."""
+        return np.array([[math.cos(angle), -math.sin(angle), 0.0],
+                         [math.sin(angle), math.cos(angle), 0.0],
+                         [0.0, 0.0, 1.0]])
+    tilt = np.array([[1.0, 0.0, 0.0],
+                     [0.0, math.cos(inclination), -math.sin(inclination)],
+                     [0.0, math.sin(inclination), math.cos(inclination)]])
+    return about_z(node) @ tilt @ about_z(argument)
+
+
+def propagate(system: NBodySystem, step: timedelta, steps: int,
+              method: str = YOSHIDA, every: int = 1,
+              checkpoint: Optional[str] = None,
+              checkpoint_every: int = 0) -> Iterator[NBodyState]:
+    """Step the system on, yielding its state as it goes.
+
+    Parameters
+    ----------
+    system (NBodySystem)    the system; its state is kept up to date
+    step (timedelta)        step size; negative to integrate backwards
+    steps (int)             number of steps
+    method (str)            "leapfrog" or "yoshida" ("yoshida")
+    every (int)             steps between the states yielded (1)
+    checkpoint (str)        path to save checkpoints to (None)
+    checkpoint_every (int)  steps between checkpoints; 0 for only the last
+                            (0)
+
+    Yields
+    ------
+    state (NBodyState)      the state after every `every` steps
+    """
+    if method not in METHODS:
+        raise ValueError(f"Integration method must be one of {METHODS}")
+    if every < 1:
+        raise ValueError("States must be yielded at least every step")
+    dt: float = step.total_seconds()
+    drifts, kicks = STAGES[method]
+    drift_steps = [weight * dt for weight in drifts]
+    kick_steps = [weight * dt for weight in kicks]
+    time: float = system.state.time
+    positions = system.state.positions.copy()
+    velocities = system.state.velocities.copy()
+
+    for done in range(1, steps + 1):
+        positions += drift_steps[0] * velocities
+        for kick, drift in zip(kick_steps, drift_steps[1:]):
+            velocities += kick * system.accelerations(positions)
+            positions += drift * velocities
+        time += dt
+        yielding: bool = done % every == 0
+        saving: bool = checkpoint is not None and (
+            done == steps
+            or (checkpoint_every > 0 and done % checkpoint_every == 0))
+        if yielding or saving or done == steps:
+            system.state = NBodyState(time, positions.copy(),
+                                      velocities.copy())
+        if saving:
+            save_checkpoint(system, str(checkpoint))
+        if yielding:
+            yield system.state
+    logger.debug(f"FUNCTION \"propagate\": "
+                 f"finished \"{steps}\" steps.")
+
+
+def save_checkpoint(system: NBodySystem, path: str) -> None:
+    """Save the system so an integration can resume from it.
+
+    The checkpoint is written beside the path and moved into place, so an
+    interrupted save leaves the last checkpoint whole.
+    """
+    partial: str = f"{path}.partial"
+    with open(partial, "wb") as checkpoint_file:
+        np.savez(checkpoint_file, names=np.array(system.names),
+                 masses=system.masses, time=system.state.time,
+                 positions=system.state.positions,
+                 velocities=system.state.velocities)
+    os.replace(partial, path)
+
+
+def load_checkpoint(path: str) -> NBodySystem:
+    """Load a system saved by `save_checkpoint`."""
+    with np.load(path, allow_pickle=False) as saved:
+        return NBodySystem(saved["names"].tolist(), saved["masses"],
+                           NBodyState(float(saved["time"]),
+                                      saved["positions"],
+                                      saved["velocities"]))
+
+
+def write_states(destination: BinaryIO, system: NBodySystem,
+                 states: Iterable[NBodyState]) -> int:
+    """Stream states to a binary file as they are calculated.
+
+    The file starts with the bodies' names and masses; each state follows
+    as little-endian doubles: the time, then positions and velocities.
+    Returns the number of states written.
+    """
+    names: List[bytes] = [name.encode() for name in system.names]
+    destination.write(MAGIC + struct.pack("<I", len(names)))
+    for name in names:
+        destination.write(struct.pack("<I", len(name)) + name)
+    destination.write(system.masses.astype("<f8").tobytes())
+    written: int = 0
+    for state in states:
+        destination.write(np.concatenate(
+            ([state.time], state.positions.ravel(),
+             state.velocities.ravel())).astype("<f8").tobytes())
+        written += 1
+    return written
+
+
+def read_states(source: BinaryIO
+                ) -> Tuple[List[str], np.ndarray, Iterator[NBodyState]]:
+    """Read a file written by `write_states`.
+
+    Returns the names and masses, and an iterator reading the states one
+    at a time.
+    """
+    if source.read(len(MAGIC)) != MAGIC:
+        raise ValueError("Not an N-body state file")
+    count: int = struct.unpack("<I", source.read(4))[0]
+    names: List[str] = [
+        source.read(struct.unpack("<I", source.read(4))[0]).decode()
+        for _ in range(count)]
+    masses: np.ndarray = np.frombuffer(source.read(8 * count), dtype="<f8")
+    size: int = 8 * (1 + 6 * count)
+
+    def states() -> Iterator[NBodyState]:
+        """Read each state in turn."""
+        while True:
+            record: bytes = source.read(size)
+            if len(record) < size:
+                return
+            values = np.frombuffer(record, dtype="<f8")
+            yield NBodyState(float(values[0]),
+                             values[1:1 + 3 * count].reshape(count, 3),
+                             values[1 + 3 * count:].reshape(count, 3))
+
+    return names, masses.astype(float), states()
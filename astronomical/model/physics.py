@@ -4,16 +4,18 @@ import math
 from datetime import timedelta
 from typing import Tuple
 
+from astronomical.model import array_physics, timescale
 from astronomical.model.custom_types import (eccentricity, mass, radius,
                                              real_time)
-from astronomical.service.logging import logger
+from astronomical.model.timescale import Duration
+from astronomical.service.logging import base_function
 
 # Constants
 G: float = 6.67408*10**-11
 
 
 # Conversions
-@logger.catch
+@base_function
 def angular_velocity(T: real_time) -> float:
     """Calculate angular velocity.
 
@@ -21,12 +23,11 @@ def angular_velocity(T: real_time) -> float:
     w = Angular velocity
     T = Period of rotation (orbit)
     """
-    logger.trace(f"BASE FUNCTION: \"angular_velocity\" invoked.")
     w: float = 360 / T.total_seconds()
     return w
 
 
-@logger.catch
+@base_function
 def a_sin_theta(a: float, theta: float) -> float:
     """Calculate sin curve of function f(a, theta) = a sin(theta).
 
@@ -34,13 +35,12 @@ def a_sin_theta(a: float, theta: float) -> float:
     a -> magnitude
     theta -> fractional revolution
     """
-    logger.trace(f"BASE FUNCTION: \"a_sin_theta\" invoked.")
     result: float = a * math.sin(theta * (2*math.pi))
     return result
 
 
 # Laws
-@logger.catch
+@base_function
 def gravitational_force(M: mass, m: mass, r: radius) -> float:
     """Calculate force between two bodies.
 
@@ -51,12 +51,11 @@ def gravitational_force(M: mass, m: mass, r: radius) -> float:
     m = Mass of (minor) body
     r = Body displacement
     """
-    logger.trace(f"BASE FUNCTION: \"gravitational_force\" invoked.")
     F: float = G * (M*m) / r**2
     return F
 
 
-@logger.catch
+@base_function
 def law_of_orbits_aphelion(a: radius, e: eccentricity) -> radius:
     """Calculate aphelion from Kepler's Law or Orbits.
 
@@ -65,12 +64,11 @@ def law_of_orbits_aphelion(a: radius, e: eccentricity) -> radius:
     a = Semi-major axis
     e = eccentricity
     """
-    logger.trace(f"BASE FUNCTION: \"law_of_orbits_aphelion\" invoked.")
     R: radius = radius(a * (1+e))
     return R
 
 
-@logger.catch
+@base_function
 def law_of_orbits_perihelion(a: radius, e: eccentricity) -> radius:
     """Calculate aphelion from Kepler's Law or Orbits.
 
@@ -79,12 +77,11 @@ def law_of_orbits_perihelion(a: radius, e: eccentricity) -> radius:
     a = Semimajor axis
     e = eccentricity
     """
-    logger.trace(f"BASE FUNCTION: \"law_of_orbits_perihelion\" invoked.")
     R: radius = radius(a * (1-e))
     return R
 
 
-@logger.catch
+@base_function
 def law_of_orbits(a: radius, e: eccentricity) -> Tuple[radius, radius]:
     """Calculate Kepler's Law of Orbits.
 
@@ -92,11 +89,10 @@ def law_of_orbits(a: radius, e: eccentricity) -> Tuple[radius, radius]:
     a = Semimajor axis
     e = eccentricity
     """
-    logger.trace(f"BASE FUNCTION: \"law_of_orbits\" invoked.")
     return law_of_orbits_aphelion(a, e), law_of_orbits_perihelion(a, e)
 
 
-@logger.catch
+@base_function
 def law_of_periods(M: mass, m: mass, a: radius) -> real_time:
     """Calculate Kepler's Law of Orbits.
 
@@ -107,7 +103,6 @@ def law_of_periods(M: mass, m: mass, a: radius) -> real_time:
     m = Mass of (minor) body
     a = Semimajor axis
     """
-    logger.trace(f"BASE FUNCTION: \"law_of_periods\" invoked.")
     T_sqrd: float = ((4*math.pi**2) / (G * (M+m))) * a**3
     seconds: float = math.sqrt(T_sqrd)
     T: real_time = real_time(seconds=seconds)
@@ -115,15 +110,17 @@ def law_of_periods(M: mass, m: mass, a: radius) -> real_time:
 
 
 # Coordinate calculations for relative celestial bodies
-@logger.catch
-def equatorial_coordinates(time_since_vernal_equinox: timedelta,
-                           synodic_day: real_time,
+@base_function
+def equatorial_coordinates(time_since_vernal_equinox: Duration,
+                           synodic_day: Duration,
                            orbital_obliquity: float,
-                           sidereal_period: real_time,
-                           time_since_march_equinox: timedelta
+                           sidereal_period: Duration,
+                           time_since_march_equinox: Duration
                            ) -> Tuple[timedelta, float]:
-    """Calculate Right Ascension/Declination relative to equator."""
-    logger.trace(f"BASE FUNCTION: \"equatorial_coordinates\" invoked.")
+    """Calculate Right Ascension/Declination relative to equator.
+
+    Durations may be timedeltas or float seconds.
+    """
     return right_ascension(time_since_vernal_equinox,
                            synodic_day), \
         declination(orbital_obliquity,
@@ -131,9 +128,9 @@ def equatorial_coordinates(time_since_vernal_equinox: timedelta,
                     time_since_march_equinox)
 
 
-@logger.catch
-def right_ascension(time_since_vernal_equinox: timedelta,
-                    synodic_day: real_time) -> timedelta:
+@base_function
+def right_ascension(time_since_vernal_equinox: Duration,
+                    synodic_day: Duration) -> timedelta:
     """Calculate Right Ascension of parent body.
 
     Resembles longitude in the equatorial coordinate system. It is the angular
@@ -144,53 +141,56 @@ def right_ascension(time_since_vernal_equinox: timedelta,
     the time since the vernal equinox.
 
     The return is a timedelta object with 24 hours being a full circle.
+    Durations may be timedeltas or float seconds.
     """
-    logger.trace(f"BASE FUNCTION: \"right_ascension\" invoked.")
-    time_through_day: timedelta = time_since_vernal_equinox % synodic_day
-    ra_sun: timedelta = time_through_day  # since the sun is at ra at noon
+    # since the sun is at ra at noon
+    ra_sun: timedelta = timedelta(
+        seconds=timescale.seconds(time_since_vernal_equinox)
+        % timescale.seconds(synodic_day))
     return ra_sun
 
 
-@logger.catch
+@base_function
 def declination(orbital_obliquity: float,
-                sidereal_period: real_time,
-                time_since_march_equinox: timedelta) -> float:
+                sidereal_period: Duration,
+                time_since_march_equinox: Duration) -> float:
     """Calculate declination of the parent body above celestial equator.
 
     The celestial equator is the projection of the equator into space. This
     assumes that the orbiting body processes round its orbit in a uniform
     manner and not according to KII (equal areas swept in equal times).
+    Durations may be timedeltas or float seconds.
     """
-    logger.trace(f"BASE FUNCTION: \"declination\" invoked.")
-    orbit_completed: float = (time_since_march_equinox / sidereal_period)
-    dec: float = a_sin_theta(orbital_obliquity, orbit_completed)
+    orbit_completed: float = timescale.seconds(time_since_march_equinox) \
+        / timescale.seconds(sidereal_period)
+    dec: float = orbital_obliquity * math.sin(orbit_completed * (2*math.pi))
     return dec
 
 
-@logger.catch
-def solar_hour_angle(synodic_day: real_time,
-                     time_since_midnight: timedelta) -> float:
-    """Calculate solar hour angle."""
-    logger.trace(f"BASE FUNCTION: \"solar_hour_angle\" invoked.")
-    second_angle: float = 360 / synodic_day.total_seconds()
-    elapsed_angle: float = time_since_midnight.total_seconds() * second_angle
-    solar_hour_angle: float = elapsed_angle - 180
+@base_function
+def solar_hour_angle(synodic_day: Duration,
+                     time_since_midnight: Duration) -> float:
+    """Calculate solar hour angle.
+
+    Durations may be timedeltas or float seconds.
+    """
+    second_angle: float = 360 / timescale.seconds(synodic_day)
+    solar_hour_angle: float = \
+        timescale.seconds(time_since_midnight) * second_angle - 180
     return solar_hour_angle
 
 
-@logger.catch
+@base_function
 def elevation(latitude: float,
               declination: float,
               hour_angle: float) -> Tuple[float, float]:
     """Calculate Azimuth/Altitude of body relative to local position."""
-    logger.trace(f"BASE FUNCTION: \"elevation\" invoked.")
-
     alt: float = altitude(latitude, declination, hour_angle)
     az: float = azimuth(latitude, declination, hour_angle, alt)
     return az, alt
 
 
-@logger.catch
+@base_function
 def azimuth(latitude: float,
             declination: float,
             hour_angle: float,
@@ -200,33 +200,21 @@ def azimuth(latitude: float,
     Azimuth is the angle round the horizon where a relative body is. North is
     defined as 0 degrees, with East at 90 degrees.
     """
-    logger.trace(f"BASE FUNCTION: \"azimuth\" invoked.")
-
-    lat: float = ((2*math.pi)/360) * latitude
-    dec: float = ((2*math.pi)/360) * declination
-    ha: float = ((2*math.pi)/360) * hour_angle
-    alt: float = ((2*math.pi)/360) * altitude
+    if array_physics.any_array(latitude, declination, hour_angle, altitude):
+        return array_physics.azimuth(  # type: ignore
+            latitude, declination, hour_angle, altitude)
+    lat: float = math.radians(latitude)
+    dec: float = math.radians(declination)
+    ha: float = math.radians(hour_angle)
+    alt: float = math.radians(altitude)
 
     s_az: float = (math.cos(lat)*math.sin(dec)
-                   - math.sin(lat)*math.cos(dec)*math.cos(ha)) \
-        / math.cos(alt)
-
-    # correct for Python3 rounding errors
-    if s_az < -1:
-        s_az = -1
-    elif s_az > 1:
-        s_az = 1
+                   - math.sin(lat)*math.cos(dec)*math.cos(ha)) / math.cos(alt)
+    az: float = math.degrees(math.acos(min(max(s_az, -1.0), 1.0)))
+    return az if hour_angle < 0.0 else 360 - az
 
-    az: float
-    if hour_angle < 0.0:
-        az = (360/(2*math.pi)) * math.acos(s_az)
-    else:
-        az = 360 - ((360/(2*math.pi)) * math.acos(s_az))
 
-    return az
-
-
-@logger.catch
+@base_function
 def altitude(latitude: float,
              declination: float,
              hour_angle: float) -> float:
@@ -235,22 +223,40 @@ def altitude(latitude: float,
     Altitude is the angle of the body above the horizon where 0 degrees is the
     horizon, 90 degrees is directly over head, and -90 is directly beneath.
     """
-    logger.trace(f"BASE FUNCTION: \"altitude\" invoked.")
-
-    lat: float = ((2*math.pi)/360) * latitude
-    dec: float = ((2*math.pi)/360) * declination
-    ha: float = ((2*math.pi)/360) * hour_angle
+    if array_physics.any_array(latitude, declination, hour_angle):
+        return array_physics.altitude(  # type: ignore
+            latitude, declination, hour_angle)
+    lat: float = math.radians(latitude)
+    dec: float = math.radians(declination)
+    ha: float = math.radians(hour_angle)
 
     s_alt: float = math.sin(lat)*math.sin(dec) \
         + math.cos(lat)*math.cos(dec)*math.cos(ha)
-    alt: float = (360/(2*math.pi)) * math.asin(s_alt)
+    alt: float = math.degrees(math.asin(s_alt))
     return alt
 
 
-@logger.catch
+@base_function
+def horizon_hour_angle(latitude: float, declination: float) -> float:
+    """Calculate the hour angle at which a body crosses the horizon.
+
+    Solves altitude = 0 through cos(H0) = -tan(latitude)tan(declination). When
+    the body never crosses the horizon the result is clamped, so 0 degrees
+    means it never rises (polar night) and 180 degrees means it never sets
+    (polar day).
+    """
+    if array_physics.any_array(latitude, declination):
+        return array_physics.horizon_hour_angle(  # type: ignore
+            latitude, declination)
+    c_h0: float = -math.tan(math.radians(latitude)) \
+        * math.tan(math.radians(declination))
+    h0: float = math.degrees(math.acos(min(max(c_h0, -1.0), 1.0)))
+    return h0
+
+
+@base_function
 def synodic_day(year: float, day: float) -> real_time:
     """Calculate synodic day from sidereal day and period."""
-    logger.trace(f"BASE FUNCTION: \"synodic_day\" invoked.")
     synodic_seconds: float = (year*day) / (year - day)
     synodic_day = real_time(seconds=synodic_seconds)
 
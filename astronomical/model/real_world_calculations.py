@@ -1,131 +1,79 @@
 """This module calculates sunrise etc."""
 
-import math
 from datetime import date, datetime, time, timedelta
-from typing import List, Tuple
+from typing import Optional, Tuple
 
-from astronomical.model.custom_types import angle, real_time
-from astronomical.model.physics import (altitude, declination, elevation,
-                                        equatorial_coordinates,
-                                        solar_hour_angle)
+from astronomical.model import schedule, timescale
+from astronomical.model.custom_types import angle
+from astronomical.model.events import (DEFAULT_TOLERANCE, ENGINES, NUMERICAL,
+                                       Daylight, SunEvents)
+from astronomical.model.nac import day_noon, nac_seconds
 from astronomical.model.solar_system import PlanetaryLocation
 from astronomical.service.logging import logger
 
 
 class State:
-    """Planetary Location State Object."""
+    """Planetary Location State Object.
 
-    def __init__(self, instant: datetime, location: PlanetaryLocation) -> None:
-        """Initialise variables."""
-        self.instant: datetime = instant
-        self.locale: PlanetaryLocation = location
-        self.suntimes: Tuple[datetime, datetime] \
-            = self._calculate_sun_times(instant)
-        self.equatorial_coords: Tuple[angle, angle] =\
-            self._calculate_equatorial_coords(instant)
-        self.elevation: Tuple[angle, angle] \
-            = self._calculate_elevation(instant)
-
-    def _calculate_sun_times(self, instant: datetime
-                             ) -> Tuple[datetime, datetime]:
-        """Calculate the sunrise.
+    Nothing is calculated on construction; each property is calculated when
+    first read and shared with the location's remembered results.
+    """
 
-        For a given day, start at midnight and iterate through,
-        minute-by-minute. Capture the changes in |altitude| when closest to 0
-        which will correspond to sunrise and sunset (in that order).
+    def __init__(self, instant: datetime, location: PlanetaryLocation,
+                 tolerance: timedelta = DEFAULT_TOLERANCE,
+                 engine: str = NUMERICAL) -> None:
+        """Initialise variables.
+
+        Parameters
+        ----------
+        instant (datetime)              moment the state describes
+        location (PlanetaryLocation)    where the state describes
+        tolerance (timedelta)           sunrise/sunset precision (1s)
+        engine (str)                    "numerical" or "analytic" sun times
         """
-        # redeclare or calculate variables with simpler names
-        lat = self.locale.latitude
-        lon = self.locale.longitude
-        year: real_time = self.locale.planet._calculate_orbital_period()
-        syn_day: real_time = self.locale.planet._calculate_synodic_day()
-
-        # setup variables to aid with iterating through the day
-        start = ((((instant - self.locale.planet.ref_midnight) // syn_day)
-                  * syn_day)
-                 + self.locale.planet.ref_midnight)
-        current_min_altitude: float = 0.0
-        improving: bool = False
-        previously_was_improving: bool = False
-        horizon_crossing: List[datetime] = []
-
-        for minute_elapsed in range(0, int(syn_day.total_seconds()/60)):
-            calc_time = start + timedelta(minutes=minute_elapsed)
-
-            # calculate altitude arguments for this iteration
-            time_since_march_equinox: timedelta = calc_time \
-                - self.locale.planet.ref_march_equinox
-            ha = (solar_hour_angle(syn_day, timedelta(minutes=minute_elapsed))
-                  - lon)
-            dec = declination(self.locale.planet.orbital_obliquity,
-                              year,
-                              time_since_march_equinox)
-
-            calculated_altitude = abs(altitude(lat, dec, ha))
+        if engine not in ENGINES:
+            raise ValueError(f"Sun times engine must be one of {ENGINES}")
+        self.instant: datetime = instant
+        self.tolerance: timedelta = tolerance
+        self.engine: str = engine
+        self.locale: PlanetaryLocation = location
 
-            # detect whether there is an improvement in the altitude
-            if calculated_altitude < current_min_altitude:
-                current_min_altitude = calculated_altitude
-                improving = True
-            else:
-                improving = False
-            # detect minimum which indicates sunrise/set
-            if not improving and previously_was_improving:
-                horizon_crossing.append(calc_time)
-            if not improving and not previously_was_improving:
-                current_min_altitude = calculated_altitude
+    @property
+    def suntimes(self) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """Sunrise and sunset on the day of the instant."""
+        sun_events: SunEvents = self._calculate_sun_times(self.instant)
+        return sun_events.rise, sun_events.set
 
-            previously_was_improving = improving
+    @property
+    def daylight(self) -> Daylight:
+        """Whether the sun rises and sets on the day of the instant."""
+        return self._calculate_sun_times(self.instant).daylight
 
-        sunrise, sunset = horizon_crossing[0], horizon_crossing[1]
-        logger.debug(f"METHOD \"_calculate_sun_times\": "
-                     f"returns \"{sunrise}, {sunset}\".")
-        return sunrise, sunset
+    @property
+    def equatorial_coords(self) -> Tuple[angle, angle]:
+        """Right ascension and declination at the instant."""
+        return self.locale.equatorial_coords_at(self.instant)
 
-    def _calculate_equatorial_coords(self, instant) -> Tuple[angle, angle]:
-        """Calculate the right ascension and declination."""
-        time_since_vernal_equinox: timedelta = instant \
-            - self.locale.planet.ref_march_equinox
-        time_since_march_equinox: timedelta = instant \
-            - self.locale.planet.ref_march_equinox
-        syn_day: real_time = self.locale.planet._calculate_synodic_day()
-        o_period: real_time = self.locale.planet._calculate_orbital_period()
-        eqc = equatorial_coordinates(time_since_vernal_equinox,
-                                     syn_day,
-                                     self.locale.planet.orbital_obliquity,
-                                     o_period,
-                                     time_since_march_equinox)
-        ra_calc, dec_calc = eqc
-        ra: angle = angle(360 * (ra_calc / timedelta(hours=24)))
-        dec = angle(dec_calc)
-        logger.debug(f"METHOD \"_calculate_equatorial_coords\": "
-                     f"returns \"{ra}, {dec}\".")
-        return ra, dec
+    @property
+    def elevation(self) -> Tuple[angle, angle]:
+        """Azimuth and altitude at the instant."""
+        return self.locale.elevation_at(self.instant)
 
-    def _calculate_elevation(self, instant) -> Tuple[angle, angle]:
-        """Calculate the azimuth and altitude."""
-        syn_day: real_time = self.locale.planet._calculate_synodic_day()
-        start = ((((instant - self.locale.planet.ref_midnight) // syn_day)
-                  * syn_day)
-                 + self.locale.planet.ref_midnight)
-        time_since_midnight = instant - start
-        time_since_march_equinox: timedelta = instant \
-            - self.locale.planet.ref_march_equinox
-        dec = declination(self.locale.planet.orbital_obliquity,
-                          self.locale.planet._calculate_orbital_period(),
-                          time_since_march_equinox)
-        ha = solar_hour_angle(syn_day, time_since_midnight)
+    def _calculate_sun_times(self, instant: datetime) -> SunEvents:
+        """Calculate the sunrise and sunset for the day containing instant.
 
-        az_calc, alt_calc = elevation(self.locale.latitude, dec, ha)
-        az: angle = angle(az_calc)
-        alt: angle = angle(alt_calc)
-        logger.debug(f"METHOD \"_calculate_elevation\": "
-                     f"returns \"{az}, {alt}\".")
-        return az, alt
+        Delegates to the location using the selected engine; the tolerance
+        only applies to the numerical engine.
+        """
+        return self.locale.sun_events_at(instant, self.tolerance, self.engine)
 
 
 class Alarms:
-    """Alarms object."""
+    """Alarms object.
+
+    Calculated in float seconds (see timescale); the alarms themselves are
+    datetimes.
+    """
 
     def __init__(self, duration: timedelta, latest: time, earliest: time,
                  ablutions: timedelta,
@@ -139,67 +87,64 @@ class Alarms:
 
         now: datetime = datetime.now()
         tomorrow: date = (now + self.locale.planet.sidereal_day).date()
-        year: real_time = self.locale.planet._calculate_orbital_period()
-        ref_vernal_equinox: datetime = self.locale.planet.ref_march_equinox
-        latest_vernal_equinox: datetime = \
-            self._calculate_latest_vernal_equinox(now, ref_vernal_equinox,
-                                                  year)
+        year: float = \
+            self.locale.planet._calculate_orbital_period().total_seconds()
+        ref_vernal_equinox: float = \
+            timescale.seconds(self.locale.planet.ref_march_equinox)
+        latest_vernal_equinox: float = \
+            self._calculate_latest_vernal_equinox(timescale.seconds(now),
+                                                  ref_vernal_equinox, year)
         annual_progress =\
-            self._calculate_annual_progress(now, year, latest_vernal_equinox)
-        margin: timedelta = datetime.combine(tomorrow,
-                                             self.latest) \
-            - datetime.combine(tomorrow, self.earliest)
-        final_wake_up: datetime = datetime.combine(tomorrow,
-                                                   self.latest)
-        standard_duration: timedelta = self.duration
+            self._calculate_annual_progress(timescale.seconds(now), year,
+                                            latest_vernal_equinox)
+        final_wake_up: float = \
+            timescale.seconds(datetime.combine(tomorrow, self.latest))
+        margin: float = final_wake_up \
+            - timescale.seconds(datetime.combine(tomorrow, self.earliest))
+        standard_duration: float = self.duration.total_seconds()
         sleep_duration = self._calculate_sleep_time(annual_progress,
                                                     margin, standard_duration)
+        wake: float = self._calculate_wake(annual_progress, margin,
+                                           final_wake_up)
 
-        self.wake: datetime = self._calculate_wake(annual_progress,
-                                                   margin,
-                                                   final_wake_up)
-        self.sleep: datetime = self.wake - sleep_duration
+        self.wake: datetime = timescale.to_datetime(wake)
+        self.sleep: datetime = timescale.to_datetime(wake - sleep_duration)
 
         self.work: datetime = self.wake + self.ablutions
 
-    def _calculate_latest_vernal_equinox(self, now: datetime,
-                                         ref_vernal_equinox: datetime,
-                                         year_length: timedelta) -> datetime:
-        """Calculate latest vernal equinox."""
-        years_since_ref: float = (now - ref_vernal_equinox).total_seconds() \
-            // year_length.total_seconds()
-        latest: datetime = ref_vernal_equinox + (years_since_ref * year_length)
+    def _calculate_latest_vernal_equinox(self, now: float,
+                                         ref_vernal_equinox: float,
+                                         year_length: float) -> float:
+        """Calculate latest vernal equinox (s)."""
+        latest: float = float(schedule.latest_vernal_equinox(
+            now, ref_vernal_equinox, year_length))
         logger.debug(f"METHOD \"_calculate_latest_vernal_equinox\": "
                      f"returns \"{latest}\".")
         return latest
 
-    def _calculate_annual_progress(self, now: datetime,
-                                   year_length: timedelta,
-                                   vernal_equinox: datetime) -> float:
-        """Calculate annual progress: break this out."""
-        midnight: datetime = datetime.combine(now, time()) \
-            + timedelta(hours=24)
-        annual_progress: float = (2 * math.pi) * ((midnight - vernal_equinox)
-                                                  / year_length)
+    def _calculate_annual_progress(self, now: float, year_length: float,
+                                   vernal_equinox: float) -> float:
+        """Calculate annual progress (radians)."""
+        annual_progress: float = float(schedule.annual_progress(
+            now, year_length, vernal_equinox))
         logger.debug(f"METHOD \"_calculate_annual_progress\": "
                      f"returns \"{annual_progress}\".")
         return annual_progress
 
-    def _calculate_sleep_time(self, annual_progress: float, margin: timedelta,
-                              normal_length: timedelta):
-        """Calculate sleep duration."""
-        calc_length: timedelta = normal_length - (margin *
-                                                  math.sin(annual_progress))
+    def _calculate_sleep_time(self, annual_progress: float, margin: float,
+                              normal_length: float) -> float:
+        """Calculate sleep duration (s)."""
+        calc_length: float = float(schedule.sleep_duration(
+            annual_progress, margin, normal_length))
         logger.debug(f"METHOD \"_calculate_sleep_time\": "
                      f"returns \"{calc_length}\".")
         return calc_length
 
-    def _calculate_wake(self, annual_progress: float, margin: timedelta,
-                        final_wake_up: datetime) -> datetime:
-        """Calculate wake-up time."""
-        offset: timedelta = ((margin * math.sin(annual_progress)) / 2) \
-            + (margin / 2)
-        alarm: datetime = final_wake_up - offset
+    def _calculate_wake(self, annual_progress: float, margin: float,
+                        final_wake_up: float) -> float:
+        """Calculate wake-up time (s)."""
+        alarm: float = float(schedule.wake_time(annual_progress, margin,
+                                                final_wake_up))
         logger.debug(f"METHOD \"_calculate_wake\": "
                      f"returns \"{alarm}\".")
         return alarm
@@ -216,45 +161,34 @@ class Time:
     """
 
     def __init__(self, state: State, std_time: datetime) -> None:
-        """Initialise object."""
-        sunrise, sunset = state.suntimes
-        day_length: timedelta = state.locale.planet.sidereal_day
-        self.nac: datetime = \
-            self._calculate_nac_time(std_time, sunrise, sunset, day_length)
+        """Initialise object.
 
-    def _calculate_nac_time(self, std_time: datetime, sunrise: datetime,
-                            sunset: datetime, sidereal_day: timedelta
-                            ) -> datetime:
-        """Calculate NAC time.
+        The sun events are those of std_time's calendar day, as in the `nac`
+        conversions (see `nac.day_noon`).
+        """
+        events: SunEvents = state.locale.sun_events_at(
+            timescale.to_datetime(day_noon(timescale.seconds(std_time))),
+            state.tolerance, state.engine)
+        sunrise, sunset = events.rise, events.set
+        if sunrise is None or sunset is None:
+            raise ValueError(f"NAC time is undefined during "
+                             f"{events.daylight.value}.")
+        day_length: float = \
+            state.locale.planet.sidereal_day.total_seconds()
+        self.nac: datetime = timescale.to_datetime(
+            self._calculate_nac_time(timescale.seconds(std_time),
+                                     timescale.seconds(sunrise),
+                                     timescale.seconds(sunset), day_length))
+
+    def _calculate_nac_time(self, std_time: float, sunrise: float,
+                            sunset: float, sidereal_day: float) -> float:
+        """Calculate NAC time (s since the epoch).
 
         NAC is the calculated time (NACs is NAC seconds)
         STD is the standard time (STDs is standard seconds)
         """
-        midnight: datetime = datetime.combine(std_time.date(), time())
-        nac_daylight: int = 43200
-        nac_night: int = 43200
-        std_daylight: int = int((sunset - sunrise).total_seconds())
-        std_night: int = int(sidereal_day.total_seconds() - std_daylight)
-
-        # Calculate day and night NACs/STDs
-        day_NACpSTD: float = nac_daylight / std_daylight
-        night_NACpSTD: float = nac_night / std_night
-
-        # Calculate time based on day/night window
-        if std_time < sunrise:
-            s_since_midnight: float = (std_time - midnight).total_seconds()
-            NACs_elapsed: int = int(night_NACpSTD * s_since_midnight)
-            NACs: timedelta = timedelta(seconds=NACs_elapsed)
-        elif std_time >= sunrise and std_time < sunset:
-            s_since_sunrise: float = (std_time - sunrise).total_seconds()
-            NACs_elapsed = int(day_NACpSTD * s_since_sunrise)
-            NACs = timedelta(seconds=NACs_elapsed) + timedelta(seconds=21600)
-        elif std_time >= sunset:
-            s_since_sunset: float = (std_time - sunset).total_seconds()
-            NACs_elapsed = int(night_NACpSTD * s_since_sunset)
-            NACs = timedelta(seconds=NACs_elapsed) + timedelta(seconds=64800)
-
-        NAC_time: datetime = midnight + NACs
+        NAC_time: float = nac_seconds(std_time, sunrise, sunset,
+                                      sidereal_day)
         logger.debug(f"METHOD \"_calculate_nac_time\": "
                      f"returns \"{NAC_time}\".")
         return NAC_time
@@ -0,0 +1,208 @@
+"""This module calculates annually cycling alarms over a range of days.
+
+`Alarms` works out one night's alarms for tomorrow. Here the same equations
+are array functions, so a year of nights is a handful of NumPy operations
+rather than a year of `Alarms` objects. Many people's requirements can be
+solved together too, as columns of a `SleepProfiles` table. Times are float
+seconds (see timescale) until the schedule is returned as datetime64 arrays.
+"""
+
+import math
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, Iterable, List, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+from astronomical.model import array_physics, timescale
+from astronomical.model.array_physics import ArrayLike
+from astronomical.model.event_cache import planet_key
+from astronomical.model.solar_system import Planet, PlanetaryLocation
+from astronomical.model.timescale import SECONDS_PER_DAY
+from astronomical.service.logging import base_function, logger
+
+
+class AlarmSchedule(NamedTuple):
+    """Columnar alarms, one row per day woken on.
+
+    Alarms are shaped (days,) for one person or (days, people) for many.
+
+    Attributes
+    ----------
+    day (ndarray)           midnight starting each day (datetime64)
+    sleep (ndarray)         time to go to sleep the night before (datetime64)
+    wake (ndarray)          time to wake up (datetime64)
+    work (ndarray)          time to start work (datetime64)
+    """
+
+    day: np.ndarray
+    sleep: np.ndarray
+    wake: np.ndarray
+    work: np.ndarray
+
+
+class SleepProfiles(NamedTuple):
+    """Columnar sleep requirements, one entry per person.
+
+    Each is in seconds, the times of day from midnight, and named as the
+    arguments of `Alarms`.
+
+    Attributes
+    ----------
+    duration (ndarray)      standard sleep duration
+    latest (ndarray)        as `Alarms`
+    earliest (ndarray)      as `Alarms`
+    ablutions (ndarray)     time from waking to starting work
+    """
+
+    duration: np.ndarray
+    latest: np.ndarray
+    earliest: np.ndarray
+    ablutions: np.ndarray
+
+    @classmethod
+    def from_requirements(cls, requirements: Iterable[Any]
+                          ) -> "SleepProfiles":
+        """Tabulate SleepRequirements, passed on as the services do."""
+        rows: List[Tuple[float, float, float, float]] = [
+            (requirement.sleep.total_seconds(),
+             _time_of_day(requirement.earliest_wake_up),
+             _time_of_day(requirement.latest_wake_up),
+             requirement.ablutions.total_seconds())
+            for requirement in requirements]
+        return cls(*np.array(rows, dtype=float).reshape(-1, 4).T)
+
+
+def _time_of_day(clock: time) -> float:
+    """Return the seconds from midnight to a time of day."""
+    return timescale.seconds(datetime.combine(timescale.EPOCH.date(), clock))
+
+
+@base_function
+def latest_vernal_equinox(now: ArrayLike, ref_vernal_equinox: float,
+                          year_length: float) -> ArrayLike:
+    """Calculate the vernal equinox (s) most recently before now (s)."""
+    return ref_vernal_equinox + year_length * np.floor(
+        (now - ref_vernal_equinox) / year_length)
+
+
+@base_function
+def annual_progress(now: ArrayLike, year_length: float,
+                    vernal_equinox: ArrayLike) -> ArrayLike:
+    """Calculate annual progress (radians) at the midnight following now.
+
+    Progress is measured from the vernal equinox, a full turn per year.
+    """
+    midnight = np.floor(now / SECONDS_PER_DAY) * SECONDS_PER_DAY \
+        + SECONDS_PER_DAY
+    return (2 * math.pi) * ((midnight - vernal_equinox) / year_length)
+
+
+@base_function
+def sleep_duration(annual_progress: ArrayLike, margin: ArrayLike,
+                   normal_length: ArrayLike) -> ArrayLike:
+    """Calculate sleep duration (s), shortest at the summer solstice."""
+    return normal_length - margin * np.sin(annual_progress)
+
+
+@base_function
+def wake_time(annual_progress: ArrayLike, margin: ArrayLike,
+              final_wake_up: ArrayLike) -> ArrayLike:
+    """Calculate wake-up time (s), a margin before the final wake-up."""
+    return final_wake_up - (margin * np.sin(annual_progress) / 2
+                            + margin / 2)
+
+
+def alarm_schedule(duration: timedelta, latest: time, earliest: time,
+                   ablutions: timedelta, planet: Planet, start: date,
+                   end: date) -> AlarmSchedule:
+    """Calculate the alarms for each day woken on from start to end.
+
+    Each day's alarms are those `Alarms` gives when made the day before.
+
+    Parameters
+    ----------
+    duration (timedelta)        standard sleep duration
+    latest (time)               as `Alarms`
+    earliest (time)             as `Alarms`
+    ablutions (timedelta)       time from waking to starting work
+    planet (Planet)             planet whose year the alarms follow
+    start (date)                first day woken on
+    end (date)                  end of the range (exclusive)
+
+    Returns
+    -------
+    schedule (AlarmSchedule)    columnar arrays, one row per day
+    """
+    profile = SleepProfiles(np.array([duration.total_seconds()]),
+                            np.array([_time_of_day(latest)]),
+                            np.array([_time_of_day(earliest)]),
+                            np.array([ablutions.total_seconds()]))
+    day, sleep, wake, work = _solve(profile, [planet], start, end)
+    return AlarmSchedule(day, sleep[:, 0], wake[:, 0], work[:, 0])
+
+
+def batch_schedule(profiles: SleepProfiles,
+                   locations: Sequence[PlanetaryLocation], start: date,
+                   end: date) -> AlarmSchedule:
+    """Calculate the alarms of many people for each day from start to end.
+
+    Alarms follow the year of the planet each person is on, not where on
+    it they are, so the annual progress is calculated once per planet and
+    shared by everyone there.
+
+    Parameters
+    ----------
+    profiles (SleepProfiles)            everyone's sleep requirements
+    locations (Sequence[PlanetaryLocation])
+                                        where each person is
+    start (date)                        first day woken on
+    end (date)                          end of the range (exclusive)
+
+    Returns
+    -------
+    schedule (AlarmSchedule)            columnar arrays, shaped
+                                        (days, people)
+    """
+    if len(locations) != len(profiles.duration):
+        raise ValueError("There must be one location per sleep profile")
+    return _solve(profiles, [location.planet for location in locations],
+                  start, end)
+
+
+def _solve(profiles: SleepProfiles, planets: Sequence[Planet], start: date,
+           end: date) -> AlarmSchedule:
+    """Calculate alarms shaped (days, people) for people on planets."""
+    days = np.arange(np.datetime64(start, "D"), np.datetime64(end, "D"))
+    midnights = np.asarray(array_physics.to_seconds(
+        days.astype("datetime64[us]")), dtype=float)
+    evenings = midnights - SECONDS_PER_DAY  # when Alarms would be made
+
+    groups: Dict[Tuple[Any, ...], Tuple[Planet, List[int]]] = {}
+    for person, planet in enumerate(planets):
+        groups.setdefault(planet_key(planet), (planet, []))[1].append(person)
+
+    shape: Tuple[int, int] = (len(days), len(planets))
+    sleep: np.ndarray = np.empty(shape)
+    wake: np.ndarray = np.empty(shape)
+    for planet, people in groups.values():
+        year: float = planet._calculate_orbital_period().total_seconds()
+        progress = np.asarray(annual_progress(
+            evenings, year,
+            latest_vernal_equinox(
+                evenings, timescale.seconds(planet.ref_march_equinox),
+                year)))[:, np.newaxis]
+        margin = profiles.latest[people] - profiles.earliest[people]
+        wake[:, people] = wake_time(
+            progress, margin,
+            midnights[:, np.newaxis] + profiles.latest[people])
+        sleep[:, people] = wake[:, people] - sleep_duration(
+            progress, margin, profiles.duration[people])
+
+    schedule = AlarmSchedule(array_physics.to_datetime64(midnights),
+                             array_physics.to_datetime64(sleep),
+                             array_physics.to_datetime64(wake),
+                             array_physics.to_datetime64(
+                                 wake + profiles.ablutions))
+    logger.debug(f"FUNCTION \"_solve\": returns \"{len(days)}\" days for "
+                 f"\"{len(planets)}\" people.")
+    return schedule
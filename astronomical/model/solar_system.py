@@ -1,19 +1,31 @@
 """This module calculates solar system mechanics."""
 
+import math
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from astronomical.model import timescale
 from astronomical.model.celestials import Body
 from astronomical.model.custom_types import angle, real_time
+from astronomical.model.ephemeris import Ephemeris, planet_fingerprint
+from astronomical.model.event_cache import (planet_key, site_key,
+                                            sun_events_cache)
+from astronomical.model.events import (ANALYTIC, DEFAULT_TOLERANCE, NUMERICAL,
+                                       Daylight, SunEvents, find_crossings)
+from astronomical.model.kepler import KEPLER, UNIFORM, SunPosition
 from astronomical.model.location import Location
 from astronomical.model.mechanics import (OrbitalMechanicsService,
                                           RotationalMechanicsService)
-from astronomical.model.physics import (altitude, declination, elevation,
+from astronomical.model.physics import (altitude, elevation,
                                         equatorial_coordinates,
-                                        solar_hour_angle, synodic_day)
+                                        horizon_hour_angle, solar_hour_angle,
+                                        synodic_day)
+from astronomical.model.tables import CUBIC, SolarTable, SunModel, SunTable
 from astronomical.service.logging import logger
 
+MEMO_SIZE: int = 64  # remembered results per PlanetaryLocation
+
 
 @dataclass
 class Star(Body):
@@ -29,11 +41,101 @@ class Planet(RotationalMechanicsService, OrbitalMechanicsService):
     parent: Star
     ref_march_equinox: datetime  # orbital obliquity spring equinox
     ref_midnight: datetime  # any old midnight
+    ref_perihelion: Optional[datetime] = None  # any perihelion
+    orbit: str = UNIFORM  # motion of the sun; "uniform" or "kepler"
+
+    def tabulate(self, start: datetime, end: datetime,
+                 interpolation: str = CUBIC) -> SolarTable:
+        """Tabulate the sun's daily parameters from start to end.
+
+        Until the orbit changes, sun positions within the window are then
+        interpolated from the table by every location on this planet.
+
+        Parameters
+        ----------
+        start (datetime)        the first day is the one containing this
+        end (datetime)          end of the window
+        interpolation (str)     "linear" or "cubic" ("cubic")
+
+        Returns
+        -------
+        table (SolarTable)      the daily parameters
+        """
+        syn_day: float = self._calculate_synodic_day().total_seconds()
+        first: float = timescale.period_start(
+            timescale.seconds(start), timescale.seconds(self.ref_midnight),
+            syn_day)
+        days: int = max(1, math.ceil(
+            (timescale.seconds(end) - first) / syn_day))
+        table: SolarTable = SolarTable(
+            self._calculate_exact_sun_position(),
+            first - timescale.seconds(self.ref_march_equinox), days,
+            interpolation)
+        self.__dict__["_table"] = table
+        logger.debug(f"METHOD \"tabulate\": "
+                     f"returns \"{days}\" days.")
+        return table
+
+    def use_ephemeris(self, ephemeris: Ephemeris) -> None:
+        """Read the sun's position from Chebyshev segments.
+
+        Until the orbit changes, sun positions within the segments are then
+        evaluated from them by every location on this planet.
+
+        Parameters
+        ----------
+        ephemeris (Ephemeris)   segments fitted for this planet
+        """
+        if ephemeris.fingerprint != planet_fingerprint(self):
+            raise ValueError("Ephemeris was fitted for another planet")
+        ephemeris.position = self._calculate_exact_sun_position()
+        self.__dict__["_table"] = ephemeris
+
+    def _calculate_sun_position(self) -> SunModel:
+        """Calculate the sun's position through the year.
+
+        The planet's table or ephemeris, if it has one for the current
+        orbit, otherwise the exact calculation.
+        """
+        position: SunPosition = self._calculate_exact_sun_position()
+        table: Optional[SunTable] = self.__dict__.get("_table")
+        if table is not None and table.position is position:
+            return table
+        return position
+
+    def _calculate_exact_sun_position(self) -> SunPosition:
+        """Calculate the sun's position without a table.
+
+        The result is remembered until the orbit or the parameters it
+        derives from change.
+        """
+        sidereal_period: timedelta = self._calculate_orbital_period()
+        syn_day: real_time = self._calculate_synodic_day()
+        return self._remember(
+            "sun_position",
+            (self.orbit, self.orbital_obliquity, self.eccentricity,
+             sidereal_period, syn_day, self.ref_march_equinox,
+             self.ref_perihelion),
+            lambda: SunPosition(
+                self.orbit, self.orbital_obliquity, self.eccentricity,
+                sidereal_period.total_seconds(), syn_day.total_seconds(),
+                None if self.ref_perihelion is None else
+                timescale.seconds(self.ref_march_equinox)
+                - timescale.seconds(self.ref_perihelion)))
 
     def _calculate_synodic_day(self) -> real_time:
-        """Calculate synodic day from sidereal day and period."""
-        sidereal_period: timedelta = \
-            self._calculate_orbital_period()
+        """Calculate synodic day from sidereal day and period.
+
+        The result is remembered until the sidereal day or period change.
+        """
+        sidereal_period: timedelta = self._calculate_orbital_period()
+        return self._remember("synodic_day",
+                              (self.sidereal_day, sidereal_period),
+                              lambda: self._derive_synodic_day(
+                                  sidereal_period))
+
+    def _derive_synodic_day(self, sidereal_period: timedelta) -> real_time:
+        """Calculate synodic day afresh."""
         year: float = sidereal_period.total_seconds()
         day: float = self.sidereal_day.total_seconds()
 
@@ -46,115 +148,279 @@ class Planet(RotationalMechanicsService, OrbitalMechanicsService):
 
 @dataclass
 class Moon(RotationalMechanicsService, OrbitalMechanicsService):
-    """Solar system structure; the orbiter of an orbiting object."""
+    """Solar system structure; the orbiter of an orbiting object.
+
+    A tidally locked moon's sidereal day is also its sidereal month.
+    """
 
     parent: Planet
+    ref_new_moon: Optional[datetime] = None  # any new moon
+    ref_perigee: Optional[datetime] = None  # any perigee
+    inclination: float = 0.0  # orbit relative to the planet's orbit
+    node_longitude: float = 0.0  # ascending node at ref_new_moon (degrees)
+    nodal_period: Optional[real_time] = None  # regression of the nodes
+    apsidal_period: Optional[real_time] = None  # precession of the apsides
 
 
 class PlanetaryLocation(Location):
-    """Location situated on a planet."""
+    """Location situated on a planet.
+
+    Sun times, equatorial coordinates and elevation are only calculated when
+    first read. Sun times are cached per day for the whole process; the
+    others are remembered per instant, so that a State at the same instant
+    shares them, and are not recalculated if the location or its planet is
+    changed afterwards.
+    """
 
     planet: Planet
 
     def __init__(self, name: str, longitude: float, latitude: float,
-                 planet: Planet) -> None:
-        """Initialise variables."""
+                 planet: Planet, instant: Optional[datetime] = None) -> None:
+        """Initialise variables.
+
+        Parameters
+        ----------
+        name (str)              name of the location
+        longitude (float)       positional longitude
+        latitude (float)        positional latitude
+        planet (Planet)         planet the location is on
+        instant (datetime)      moment for the properties (now)
+        """
         super(PlanetaryLocation, self).__init__(name, longitude, latitude)
         self.planet: Planet = planet
-        self.suntimes: Tuple[datetime, datetime] = self._calculate_sun_times()
-        self.equatorial_coords: Tuple[angle, angle] =\
-            self._calculate_equatorial_coords()
-        self.elevation: Tuple[angle, angle] = self._calculate_elevation()
-
-    def _calculate_sun_times(self, instant: datetime = datetime.now()
-                             ) -> Tuple[datetime, datetime]:
-        """Calculate the sunrise.
-
-        For a given day, start at midnight and iterate through,
-        minute-by-minute. Capture the changes in |altitude| when closest to 0
-        which will correspond to sunrise and sunset (in that order).
+        self.instant: datetime = instant if instant else datetime.now()
+        self._memo: Dict[Tuple[Any, ...], Any] = {}
+
+    @property
+    def suntimes(self) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """Sunrise and sunset on the day of the location's instant."""
+        sun_events: SunEvents = self.sun_events_at(self.instant)
+        return sun_events.rise, sun_events.set
+
+    @property
+    def daylight(self) -> Daylight:
+        """Whether the sun rises and sets on the day of the instant."""
+        return self.sun_events_at(self.instant).daylight
+
+    @property
+    def equatorial_coords(self) -> Tuple[angle, angle]:
+        """Right ascension and declination at the location's instant."""
+        return self.equatorial_coords_at(self.instant)
+
+    @property
+    def elevation(self) -> Tuple[angle, angle]:
+        """Azimuth and altitude at the location's instant."""
+        return self.elevation_at(self.instant)
+
+    def _memoise(self, key: Tuple[Any, ...],
+                 calculate: Callable[[], Any]) -> Any:
+        """Return a remembered result, calculating it on first use.
+
+        The key is extended with the planet's key, so a result is not reused
+        once the planet, or the sun table or ephemeris it uses, changes.
+        """
+        key = (planet_key(self.planet),) + key
+        if key not in self._memo:
+            if len(self._memo) >= MEMO_SIZE:
+                self._memo.pop(next(iter(self._memo)))
+            self._memo[key] = calculate()
+        return self._memo[key]
+
+    def sun_events_at(self, instant: datetime,
+                      tolerance: timedelta = DEFAULT_TOLERANCE,
+                      engine: str = NUMERICAL) -> SunEvents:
+        """Return sunrise and sunset for the day containing instant.
+
+        Results are shared process-wide through the sun events cache, keyed
+        by planet, rounded site, engine and, last, the synodic day.
+        """
+        syn_day: float = self.planet._calculate_synodic_day().total_seconds()
+        ref_midnight: float = timescale.seconds(self.planet.ref_midnight)
+        day_index: int = timescale.periods_since(timescale.seconds(instant),
+                                                 ref_midnight, syn_day)
+        calculation: Tuple[Any, ...] = (
+            planet_key(self.planet), site_key(self.latitude, self.longitude),
+            engine)
+        if engine == ANALYTIC:
+            return sun_events_cache.get(
+                calculation + (day_index,),
+                lambda: self._calculate_analytic_sun_times(instant))
+        return sun_events_cache.get(
+            calculation + (tolerance, day_index),
+            lambda: self._calculate_sun_times(instant, tolerance))
+
+    def equatorial_coords_at(self, instant: datetime) -> Tuple[angle, angle]:
+        """Return the right ascension and declination at instant."""
+        return self._memoise(
+            ("equatorial_coords", instant),
+            lambda: self._calculate_equatorial_coords(instant))
+
+    def elevation_at(self, instant: datetime) -> Tuple[angle, angle]:
+        """Return the azimuth and altitude at instant."""
+        return self._memoise(("elevation", instant),
+                             lambda: self._calculate_elevation(instant))
+
+    def _calculate_day_start(self, instant: float) -> float:
+        """Calculate the midnight (s) starting the synodic day of instant."""
+        return timescale.period_start(
+            instant, timescale.seconds(self.planet.ref_midnight),
+            self.planet._calculate_synodic_day().total_seconds())
+
+    def _calculate_noon(self, start: float) -> float:
+        """Calculate the local noon (s into the day) of the day from start.
+
+        Noon is when the sun's hour angle is zero, with the equation of time
+        taken at the middle of the day. Each day's sunrise and sunset are the
+        pair either side of its noon, whichever engine finds them.
+        """
+        syn_day: float = self.planet._calculate_synodic_day().total_seconds()
+        offset: float = float(self.planet._calculate_sun_position()(
+            start - timescale.seconds(self.planet.ref_march_equinox)
+            + syn_day / 2)[1])
+        return syn_day * (((180 + self.longitude - offset) / 360) % 1)
+
+    def _calculate_sun_times(self, instant: timescale.Instant,
+                             tolerance: timedelta = DEFAULT_TOLERANCE
+                             ) -> SunEvents:
+        """Calculate the sunrise and sunset numerically.
+
+        For a given day, bracket the changes in sign of the sun's altitude
+        over the half a day either side of local noon and narrow each down to
+        the tolerance. The last rising crossing before noon is the sunrise and
+        the first setting crossing after it is the sunset, so either may fall
+        just outside the day. Without both, the sign of the altitude at noon
+        decides between polar day and night. Times are float seconds
+        throughout; only the result is datetimes.
         """
         # redeclare or calculate variables with simpler names
         lat = self.latitude
         lon = self.longitude
-        year: real_time = self.planet._calculate_orbital_period()
-        syn_day: real_time = self.planet._calculate_synodic_day()
+        position: SunModel = self.planet._calculate_sun_position()
+        syn_day: float = self.planet._calculate_synodic_day().total_seconds()
+
+        # setup variables to aid with searching through the day
+        start: float = self._calculate_day_start(timescale.seconds(instant))
+        start_since_march_equinox: float = start \
+            - timescale.seconds(self.planet.ref_march_equinox)
+        noon: float = self._calculate_noon(start)
+
+        def sun_altitude(seconds_elapsed: float) -> float:
+            """Calculate the sun's altitude seconds into the day."""
+            dec, offset = position(start_since_march_equinox
+                                   + seconds_elapsed)
+            ha = solar_hour_angle(syn_day, seconds_elapsed) - lon \
+                + float(offset)
+            return altitude(lat, float(dec), ha)
+
+        crossings: List[Tuple[float, bool]] = find_crossings(
+            sun_altitude, noon - syn_day / 2, noon + syn_day / 2,
+            tolerance.total_seconds())
+        rises = [timescale.to_datetime(start + seconds)
+                 for seconds, rising in crossings if rising and seconds < noon]
+        sets = [timescale.to_datetime(start + seconds)
+                for seconds, rising in crossings
+                if not rising and seconds > noon]
 
-        # setup variables to aid with iterating through the day
-        start = ((((instant - self.planet.ref_midnight) // syn_day) * syn_day)
-                 + self.planet.ref_midnight)
-        current_min_altitude: float = 0.0
-        improving: bool = False
-        previously_was_improving: bool = False
-        horizon_crossing: List[datetime] = []
-
-        for minute_elapsed in range(0, int(syn_day.total_seconds()/60)):
-            calc_time = start + timedelta(minutes=minute_elapsed)
-
-            # calculate altitude arguments for this iteration
-            time_since_march_equinox: timedelta = calc_time \
-                - self.planet.ref_march_equinox
-            ha = (solar_hour_angle(syn_day, timedelta(minutes=minute_elapsed))
-                  - lon)
-            dec = declination(self.planet.orbital_obliquity,
-                              year,
-                              time_since_march_equinox)
-
-            calculated_altitude = abs(altitude(lat, dec, ha))
-
-            # detect whether there is an improvement in the altitude
-            if calculated_altitude < current_min_altitude:
-                current_min_altitude = calculated_altitude
-                improving = True
-            else:
-                improving = False
-            # detect minimum which indicates sunrise/set
-            if not improving and previously_was_improving:
-                horizon_crossing.append(calc_time)
-            if not improving and not previously_was_improving:
-                current_min_altitude = calculated_altitude
-
-            previously_was_improving = improving
-
-        sunrise, sunset = horizon_crossing[0], horizon_crossing[1]
+        result: SunEvents
+        if rises and sets:
+            result = SunEvents(rises[-1], sets[0], Daylight.NORMAL)
+        elif sun_altitude(noon) > 0.0:
+            result = SunEvents(None, None, Daylight.POLAR_DAY)
+        else:
+            result = SunEvents(None, None, Daylight.POLAR_NIGHT)
         logger.debug(f"METHOD \"_calculate_sun_times\": "
-                     f"returns \"{sunrise}, {sunset}\".")
-        return sunrise, sunset
+                     f"returns \"{result}\".")
+        return result
 
-    def _calculate_equatorial_coords(self, instant: datetime = datetime.now()
+    def _calculate_analytic_sun_times(self, instant: timescale.Instant
+                                      ) -> SunEvents:
+        """Calculate the sunrise and sunset in closed form.
+
+        The hour angle is linear in time, so sunrise and sunset sit at minus
+        and plus the horizon hour angle either side of the same local noon,
+        the one `_calculate_sun_times` searches about. Declination is first
+        taken at noon and then once more at each event, so the cost is a
+        fixed handful of trigonometric calls per day. A sun that is above or
+        below the horizon all day at noon, or at either event, gives a polar
+        day or night as the numerical engine reports it.
+        """
+        lat = self.latitude
+        position: SunModel = self.planet._calculate_sun_position()
+        day: float = self.planet._calculate_synodic_day().total_seconds()
+
+        start: float = self._calculate_day_start(timescale.seconds(instant))
+        start_since_march_equinox: float = start \
+            - timescale.seconds(self.planet.ref_march_equinox)
+        noon: float = self._calculate_noon(start)
+
+        def event_time(hour_angle: float) -> float:
+            """Calculate seconds into the day at which hour angle occurs."""
+            return noon + day * hour_angle / 360
+
+        def sun_declination(seconds_elapsed: float) -> float:
+            """Calculate the sun's declination seconds into the day."""
+            return float(position.declination(start_since_march_equinox
+                                              + seconds_elapsed))
+
+        h0: float = horizon_hour_angle(lat, sun_declination(noon))
+        rise_h0: float = horizon_hour_angle(
+            lat, sun_declination(event_time(-h0)))
+        set_h0: float = horizon_hour_angle(
+            lat, sun_declination(event_time(h0)))
+        result: SunEvents
+        if h0 == 0.0:
+            result = SunEvents(None, None, Daylight.POLAR_NIGHT)
+        elif 180.0 in (h0, rise_h0, set_h0):
+            result = SunEvents(None, None, Daylight.POLAR_DAY)
+        elif 0.0 in (rise_h0, set_h0):
+            result = SunEvents(None, None, Daylight.POLAR_NIGHT)
+        else:
+            result = SunEvents(
+                timescale.to_datetime(start + event_time(-rise_h0)),
+                timescale.to_datetime(start + event_time(set_h0)),
+                Daylight.NORMAL)
+        logger.debug(f"METHOD \"_calculate_analytic_sun_times\": "
+                     f"returns \"{result}\".")
+        return result
+
+    def _calculate_equatorial_coords(self, instant: datetime
                                      ) -> Tuple[angle, angle]:
         """Calculate the right ascension and declination."""
-        time_since_vernal_equinox: timedelta = instant \
-            - self.planet.ref_march_equinox
-        time_since_march_equinox: timedelta = instant \
-            - self.planet.ref_march_equinox
-        eqc = equatorial_coordinates(time_since_vernal_equinox,
-                                     self.planet._calculate_synodic_day(),
-                                     self.planet.orbital_obliquity,
-                                     self.planet._calculate_orbital_period(),
-                                     time_since_march_equinox)
-        ra_calc, dec_calc = eqc
-        ra: angle = angle(360 * (ra_calc / timedelta(hours=24)))
-        dec = angle(dec_calc)
+        time_since_march_equinox: float = timescale.seconds(instant) \
+            - timescale.seconds(self.planet.ref_march_equinox)
+        ra: angle
+        dec: angle
+        if self.planet.orbit == KEPLER:
+            position: SunModel = self.planet._calculate_sun_position()
+            ra = angle(position.right_ascension(time_since_march_equinox))
+            dec = angle(position.declination(time_since_march_equinox))
+        else:
+            ra_calc, dec_calc = equatorial_coordinates(
+                time_since_march_equinox,
+                self.planet._calculate_synodic_day(),
+                self.planet.orbital_obliquity,
+                self.planet._calculate_orbital_period(),
+                time_since_march_equinox)
+            ra = angle(360 * (ra_calc / timedelta(hours=24)))
+            dec = angle(dec_calc)
         logger.debug(f"METHOD \"_calculate_equatorial_coords\": "
                      f"returns \"{ra}, {dec}\".")
         return ra, dec
 
-    def _calculate_elevation(self, instant: datetime = datetime.now()
+    def _calculate_elevation(self, instant: datetime
                              ) -> Tuple[angle, angle]:
         """Calculate the azimuth and altitude."""
         syn_day: real_time = self.planet._calculate_synodic_day()
-        start = ((((instant - self.planet.ref_midnight) // syn_day) * syn_day)
-                 + self.planet.ref_midnight)
-        time_since_midnight = instant - start
-        time_since_march_equinox: timedelta = instant \
-            - self.planet.ref_march_equinox
-        dec = declination(self.planet.orbital_obliquity,
-                          self.planet._calculate_orbital_period(),
-                          time_since_march_equinox)
-        ha = solar_hour_angle(syn_day, time_since_midnight)
-
-        az_calc, alt_calc = elevation(self.latitude, dec, ha)
+        now: float = timescale.seconds(instant)
+        time_since_midnight: float = now - self._calculate_day_start(now)
+        time_since_march_equinox: float = now \
+            - timescale.seconds(self.planet.ref_march_equinox)
+        dec, offset = self.planet._calculate_sun_position()(
+            time_since_march_equinox)
+        ha = solar_hour_angle(syn_day, time_since_midnight) \
+            - self.longitude + float(offset)
+
+        az_calc, alt_calc = elevation(self.latitude, float(dec), ha)
         az: angle = angle(az_calc)
         alt: angle = angle(alt_calc)
         logger.debug(f"METHOD \"_calculate_elevation\": "
@@ -0,0 +1,178 @@
+"""This module tabulates the sun's daily parameters for interpolation.
+
+The sun's declination and the equation of time drift slowly through a day,
+yet every step of a sunrise search works them out afresh (on a Keplerian
+orbit, by solving Kepler's equation). A SolarTable samples them once per
+synodic day over a window of days and interpolates between the samples;
+instants outside the window are passed to the exact calculation. A table is
+built for a planet with `Planet.tabulate` and is then shared by every
+location on that planet.
+
+Cubic (Catmull-Rom) interpolation agrees with the exact calculation to
+about 2e-6 degrees; linear interpolation to about 1e-3 degrees, well within
+a second of sunrise.
+"""
+
+from typing import Any, Callable, List, Tuple, Union
+
+import numpy as np
+
+from astronomical.model.array_physics import ArrayLike
+from astronomical.model.ephemeris import Ephemeris
+from astronomical.model.kepler import SunPosition
+
+LINEAR: str = "linear"
+CUBIC: str = "cubic"
+INTERPOLATIONS: Tuple[str, ...] = (LINEAR, CUBIC)
+
+
+def cubic(y0: ArrayLike, y1: ArrayLike, y2: ArrayLike, y3: ArrayLike,
+          fraction: ArrayLike) -> ArrayLike:
+    """Interpolate between y1 and y2 through a Catmull-Rom spline."""
+    return y1 + 0.5 * fraction * (
+        y2 - y0 + fraction * (2 * y0 - 5 * y1 + 4 * y2 - y3
+                              + fraction * (3 * (y1 - y2) + y3 - y0)))
+
+
+class SolarTable:
+    """The sun's daily parameters over a window of days.
+
+    Times are seconds since the planet's reference March equinox and rows
+    are taken at synodic midnights, so an instant's row and its synodic
+    phase come from one division. The table answers the same questions as
+    the SunPosition it samples.
+
+    Attributes
+    ----------
+    position (SunPosition)  the exact calculation sampled
+    interpolation (str)     "linear" or "cubic"
+    start (float)           the first midnight (s since March equinox)
+    step (float)            synodic day (s)
+    declination_column (ndarray)
+                            declination at each midnight (degrees)
+    offset_column (ndarray) hour angle offset at each midnight (degrees)
+    """
+
+    __slots__ = ("position", "interpolation", "start", "step",
+                 "declination_column", "offset_column", "_first", "_last",
+                 "_rows")
+
+    def __init__(self, position: SunPosition, start: float, days: int,
+                 interpolation: str = CUBIC) -> None:
+        """Initialise variables.
+
+        Parameters
+        ----------
+        position (SunPosition)  the exact calculation to sample
+        start (float)           first midnight (s since March equinox)
+        days (int)              number of days covered
+        interpolation (str)     "linear" or "cubic" ("cubic")
+        """
+        if interpolation not in INTERPOLATIONS:
+            raise ValueError(
+                f"Interpolation must be one of {INTERPOLATIONS}")
+        if days < 1:
+            raise ValueError("Tables cover at least one day")
+        self.position: SunPosition = position
+        self.interpolation: str = interpolation
+        self.step: float = position.synodic_day
+
+        # a row before the window and two after for the cubic's samples
+        self.start: float = start - self.step
+        times = self.start + self.step * np.arange(days + 4)
+        declination, offset = position(times)
+        self.declination_column: np.ndarray = \
+            np.broadcast_to(declination, times.shape).astype(float)
+        self.offset_column: np.ndarray = np.unwrap(
+            np.broadcast_to(offset, times.shape).astype(float), period=360)
+        self._first: float = start
+        self._last: float = start + days * self.step
+        # plain floats, as indexing arrays one value at a time is slow
+        self._rows: List[Tuple[float, float]] = list(zip(
+            self.declination_column.tolist(), self.offset_column.tolist()))
+
+    @property
+    def approximation(self) -> Tuple[Any, ...]:
+        """Identify the table, so results from it are cached apart."""
+        return ("table", self.interpolation, self._first, self.step,
+                len(self._rows))
+
+    def covers(self, since_march_equinox: ArrayLike) -> ArrayLike:
+        """Check whether instants fall within the window."""
+        return (self._first <= since_march_equinox) \
+            & (since_march_equinox < self._last)
+
+    def phase(self, since_march_equinox: ArrayLike) -> ArrayLike:
+        """Calculate the fraction of the synodic day elapsed."""
+        return ((np.asarray(since_march_equinox) - self.start)
+                / self.step % 1)[()]
+
+    def declination(self, since_march_equinox: ArrayLike) -> ArrayLike:
+        """Interpolate how far the sun is north of the equator (degrees)."""
+        return self._lookup(self.declination_column, since_march_equinox,
+                            self.position.declination)
+
+    def right_ascension(self, since_march_equinox: ArrayLike) -> ArrayLike:
+        """Calculate the sun's right ascension (degrees, 0 to 360).
+
+        Right ascension turns through a full circle each year, so it is
+        not tabulated.
+        """
+        return self.position.right_ascension(since_march_equinox)
+
+    def equation_of_time(self, since_march_equinox: ArrayLike) -> ArrayLike:
+        """Interpolate the equation of time (s)."""
+        return self._lookup(self.offset_column, since_march_equinox,
+                            self._exact_offset) / 360 * self.step
+
+    def __call__(self, since_march_equinox: ArrayLike
+                 ) -> Tuple[ArrayLike, ArrayLike]:
+        """Interpolate the declination and hour angle offset (degrees)."""
+        if isinstance(since_march_equinox, float):
+            if not self._first <= since_march_equinox < self._last:
+                return self.position(since_march_equinox)
+            x: float = (since_march_equinox - self.start) / self.step
+            row: int = int(x)
+            return self._scalar(row, x - row)
+        return self.declination(since_march_equinox), \
+            self._lookup(self.offset_column, since_march_equinox,
+                         self._exact_offset)
+
+    def _exact_offset(self, since_march_equinox: ArrayLike) -> ArrayLike:
+        """Calculate the hour angle offset exactly (degrees)."""
+        return self.position(since_march_equinox)[1]
+
+    def _scalar(self, row: int, fraction: float
+                ) -> Tuple[ArrayLike, ArrayLike]:
+        """Interpolate the declination and offset at one instant."""
+        d1, o1 = self._rows[row]
+        d2, o2 = self._rows[row + 1]
+        if self.interpolation == LINEAR:
+            return d1 + fraction * (d2 - d1), o1 + fraction * (o2 - o1)
+        d0, o0 = self._rows[row - 1]
+        d3, o3 = self._rows[row + 2]
+        return (cubic(d0, d1, d2, d3, fraction),
+                cubic(o0, o1, o2, o3, fraction))
+
+    def _lookup(self, column: np.ndarray, since_march_equinox: ArrayLike,
+                exact: Callable[[ArrayLike], ArrayLike]) -> ArrayLike:
+        """Interpolate a column, calculating outside the window exactly."""
+        t = np.asarray(since_march_equinox, dtype=float)
+        inside = self.covers(t)
+        x = (np.where(inside, t, self._first) - self.start) / self.step
+        row = np.floor(x).astype(int)
+        fraction = x - row
+        y1 = column[row]
+        y2 = column[row + 1]
+        if self.interpolation == LINEAR:
+            result = y1 + fraction * (y2 - y1)
+        else:
+            result = cubic(column[row - 1], y1, y2, column[row + 2],
+                           fraction)
+        if not np.all(inside):
+            result = np.where(inside, result, exact(t))
+        return result[()]
+
+
+SunTable = Union[SolarTable, Ephemeris]
+SunModel = Union[SunPosition, SunTable]
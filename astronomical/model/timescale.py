@@ -0,0 +1,55 @@
+"""The model's internal representation of time.
+
+Calculations work in float seconds: instants are seconds since the Unix
+epoch and durations are plain seconds. Datetimes and timedeltas are only
+made at the API boundary, so iterative calculations do not allocate an
+object for every step. Instants are naive, like the rest of the package;
+aware datetimes are converted through their UTC timestamp.
+"""
+
+import math
+from datetime import datetime, timedelta
+from typing import Union
+
+Duration = Union[timedelta, float]
+Instant = Union[datetime, float]
+
+EPOCH: datetime = datetime(1970, 1, 1)
+SECONDS_PER_DAY: float = 86400.0  # calendar day
+
+
+def seconds(value: Union[datetime, timedelta, float]) -> float:
+    """Convert an instant or duration to float seconds.
+
+    Datetimes become seconds since the epoch, timedeltas their length in
+    seconds, and numbers are returned as they are.
+    """
+    if type(value) is float:  # already seconds; the common case
+        return value
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            return value.timestamp()
+        return (value - EPOCH).total_seconds()
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    return float(value)
+
+
+def to_datetime(instant: float) -> datetime:
+    """Convert seconds since the epoch to a datetime."""
+    return EPOCH + timedelta(seconds=instant)
+
+
+def to_timedelta(duration: float) -> timedelta:
+    """Convert seconds to a timedelta."""
+    return timedelta(seconds=duration)
+
+
+def periods_since(instant: float, reference: float, period: float) -> int:
+    """Count the whole periods from reference to instant (floored)."""
+    return math.floor((instant - reference) / period)
+
+
+def period_start(instant: float, reference: float, period: float) -> float:
+    """Return the start of the period, counted from reference, at instant."""
+    return reference + periods_since(instant, reference, period) * period
@@ -1,12 +1,23 @@
-"""Utility module for initalising logging."""
+"""Utility module for initalising logging.
 
+Logging is set up when this module is first imported, which the model and
+service layers do; the package itself imports nothing so that the command
+line script can start quickly.
+"""
+
+import functools
 import os
 import sys
 from os.path import expanduser
-from typing import List
+from typing import Any, Callable, List, TypeVar
 
 from loguru import logger
 
+Function = TypeVar("Function", bound=Callable[..., Any])
+
+# whether base functions are instrumented; decided by setup_logging
+trace_base_functions: bool = False
+
 
 def setup_logging():
     """Initialise logging and return logger."""
@@ -18,9 +29,11 @@ def setup_logging():
         "ERROR",  # something has broken
         "CRITICAL"  # everything is on fire
     ]
+    global trace_base_functions
     logger.remove()
     logger.add(f"{expanduser('~')}/.local/astronomical.log", level="INFO")
     log_level = os.getenv("LOG_LEVEL")
+    trace_base_functions = log_level == "TRACE"
     if not log_level:
         logger.add(sys.stdout, level="ERROR")
     elif log_level in (log_levels):
@@ -31,3 +44,26 @@ def setup_logging():
                        f"\ttry one of {log_levels}\n"
                        f"\teg. `export LOG_LEVEL=DEBUG`.\n"
                        f"\tLog level will be set to \"DEBUG\".")
+
+
+def base_function(function: Function) -> Function:
+    """Instrument a base function with TRACE and ERROR logging.
+
+    The choice is made once, as the function is defined: unless TRACE is
+    being logged the function is returned untouched, so hot paths pay
+    nothing for messages that would be discarded. Instrumented, errors are
+    logged and re-raised; either way they propagate to the caller.
+    """
+    if not trace_base_functions:
+        return function
+    message: str = f"BASE FUNCTION: \"{function.__name__}\" invoked."
+
+    @functools.wraps(function)
+    def traced(*args: Any, **kwargs: Any) -> Any:
+        logger.trace(message)
+        return function(*args, **kwargs)
+
+    return logger.catch(reraise=True)(traced)  # type: ignore
+
+
+setup_logging()
@@ -0,0 +1,206 @@
+"""Service module for keeping calculated events on disk between runs.
+
+Each run of the command line script is a fresh process, so the in-memory
+sun events cache starts out empty every time. A PersistentCache keeps daily
+results in a small SQLite database under the user's cache directory, keyed
+by a hash of the configuration they were calculated for and by the day.
+SQLite's write-ahead log lets several invocations read and write at once.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+from dataclasses import astuple
+from datetime import date, datetime
+from os.path import expanduser
+from typing import Any, Dict, Hashable, NamedTuple, Optional, Tuple
+
+from astronomical.model.configuration import SleepRequirements
+from astronomical.model.event_cache import planet_key, site_key
+from astronomical.model.events import Daylight, SunEvents
+from astronomical.model.real_world_calculations import Alarms
+from astronomical.model.solar_system import PlanetaryLocation
+from astronomical.service.logging import logger
+
+BUSY_TIMEOUT: float = 5.0  # seconds to wait on another invocation's write
+SUN_EVENTS: str = "sun events"
+ALARMS: str = "alarms"
+
+
+class AlarmTimes(NamedTuple):
+    """Alarm times as remembered on disk.
+
+    Attributes
+    ----------
+    sleep (datetime)    bedtime
+    wake (datetime)     time to get up
+    work (datetime)     time to start work
+    """
+
+    sleep: datetime
+    wake: datetime
+    work: datetime
+
+
+def default_cache_path() -> str:
+    """Return the database path under the user's cache directory."""
+    cache_home: str = os.getenv("XDG_CACHE_HOME") \
+        or f"{expanduser('~')}/.cache"
+    return f"{cache_home}/astronomical/events.sqlite3"
+
+
+def configuration_hash(configuration: Tuple[Any, ...]) -> str:
+    """Return a short, stable hash of the parameters behind a result."""
+    return hashlib.sha256(repr(configuration).encode()).hexdigest()[:16]
+
+
+class PersistentCache:
+    """SQLite store of daily results shared between invocations.
+
+    Attributes
+    ----------
+    path (str)          location of the database file
+
+    Public Methods
+    --------------
+    get                 return a stored value, or None
+    put                 store a value, replacing any already there
+    clear               forget every stored value
+    close               close the database connection
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        """Open, creating if needed, the database.
+
+        Parameters
+        ----------
+        path (str)          location of the database (user cache directory)
+        """
+        self.path: str = path if path else default_cache_path()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._connection: sqlite3.Connection = sqlite3.connect(
+            self.path, timeout=BUSY_TIMEOUT, isolation_level=None,
+            check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "kind TEXT NOT NULL, configuration TEXT NOT NULL, "
+            "day TEXT NOT NULL, value TEXT NOT NULL, "
+            "PRIMARY KEY (kind, configuration, day))")
+        logger.trace(f"CLASS: \"{self.__class__.__name__}\" instantiated.")
+
+    def get(self, kind: str, configuration: str, day: str
+            ) -> Optional[Dict[str, Any]]:
+        """Return the value stored for a configuration and day, or None."""
+        row = self._connection.execute(
+            "SELECT value FROM results "
+            "WHERE kind = ? AND configuration = ? AND day = ?",
+            (kind, configuration, day)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, kind: str, configuration: str, day: str,
+            value: Dict[str, Any]) -> None:
+        """Store the value for a configuration and day."""
+        self._connection.execute(
+            "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+            (kind, configuration, day, json.dumps(value)))
+
+    def clear(self) -> None:
+        """Forget every stored value."""
+        self._connection.execute("DELETE FROM results")
+        logger.info(f"METHOD: \"clear\" emptied \"{self.path}\".")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+
+def _encode_instant(instant: Optional[datetime]) -> Optional[str]:
+    """Convert an optional datetime to ISO format."""
+    return instant.isoformat() if instant else None
+
+
+def _decode_instant(text: Optional[str]) -> Optional[datetime]:
+    """Convert optional ISO format text to a datetime."""
+    return datetime.fromisoformat(text) if text else None
+
+
+class SunEventsStore:
+    """Backing store for the sun events cache, kept in a PersistentCache.
+
+    Event cache keys end with the synodic day; everything before it is
+    hashed to identify the configuration.
+    """
+
+    def __init__(self, cache: PersistentCache) -> None:
+        """Initialise variables.
+
+        Parameters
+        ----------
+        cache (PersistentCache)     where to keep sun events (explicit)
+        """
+        self.cache: PersistentCache = cache
+
+    def load(self, key: Hashable) -> Optional[SunEvents]:
+        """Return the sun events stored for an event cache key, or None."""
+        configuration, day = self._split(key)
+        value = self.cache.get(SUN_EVENTS, configuration, day)
+        if value is None:
+            return None
+        return SunEvents(_decode_instant(value["rise"]),
+                         _decode_instant(value["set"]),
+                         Daylight(value["daylight"]))
+
+    def save(self, key: Hashable, value: SunEvents) -> None:
+        """Store the sun events for an event cache key."""
+        configuration, day = self._split(key)
+        self.cache.put(SUN_EVENTS, configuration, day,
+                       {"rise": _encode_instant(value.rise),
+                        "set": _encode_instant(value.set),
+                        "daylight": value.daylight.value})
+
+    @staticmethod
+    def _split(key: Any) -> Tuple[str, str]:
+        """Split an event cache key into configuration hash and day."""
+        return configuration_hash(key[:-1]), str(key[-1])
+
+
+def cached_alarms(cache: Optional[PersistentCache],
+                  requirements: SleepRequirements,
+                  locale: PlanetaryLocation) -> AlarmTimes:
+    """Return today's alarms, calculating them only if not already stored.
+
+    Parameters
+    ----------
+    cache (PersistentCache)             where to look; None to always calculate
+    requirements (SleepRequirements)    sleeping pattern requirements
+    locale (PlanetaryLocation)          where the alarms are for
+
+    Returns
+    -------
+    alarms (AlarmTimes)                 bedtime, get up and start work
+    """
+    day: str = date.today().isoformat()
+    configuration: str = configuration_hash(
+        (astuple(requirements), planet_key(locale.planet),
+         site_key(locale.latitude, locale.longitude)))
+    stored: Optional[Dict[str, Any]] = None
+    if cache is not None:
+        stored = cache.get(ALARMS, configuration, day)
+    if stored is not None:
+        logger.debug(f"FUNCTION \"cached_alarms\": found \"{day}\".")
+        return AlarmTimes(datetime.fromisoformat(stored["sleep"]),
+                          datetime.fromisoformat(stored["wake"]),
+                          datetime.fromisoformat(stored["work"]))
+    alarm = Alarms(requirements.sleep, requirements.earliest_wake_up,
+                   requirements.latest_wake_up, requirements.ablutions,
+                   locale)
+    alarms = AlarmTimes(alarm.sleep, alarm.wake, alarm.work)
+    if cache is not None:
+        cache.put(ALARMS, configuration, day,
+                  {"sleep": alarms.sleep.isoformat(),
+                   "wake": alarms.wake.isoformat(),
+                   "work": alarms.work.isoformat()})
+    return alarms
@@ -0,0 +1,186 @@
+"""Service module for profiling the model's hot paths.
+
+Profiling records how often the physics functions and the `_calculate_*`
+methods of the model are called and how long they take, inclusive of
+anything they call. It is opt-in:
+
+* set `ASTRONOMICAL_PROFILE` before the package is imported to profile the
+  whole process and print a summary at exit (or, if the variable names a
+  `.json` file, save the summary there)
+* or wrap code in `with profile() as summary:` and read the summary after
+
+Hooks are swapped in while profiling and swapped out again afterwards, so
+the model runs its ordinary, undecorated functions the rest of the time.
+"""
+
+import atexit
+import functools
+import importlib
+import inspect
+import json
+import os
+import sys
+from contextlib import contextmanager
+from time import perf_counter
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from astronomical.service.logging import logger
+
+ENVIRONMENT_VARIABLE: str = "ASTRONOMICAL_PROFILE"
+FUNCTION_MODULES: Tuple[str, ...] = ("astronomical.model.physics",)
+METHOD_MODULES: Tuple[str, ...] = (
+    "astronomical.model.real_world_calculations",
+    "astronomical.model.solar_system",
+    "astronomical.model.mechanics")
+METHOD_PREFIX: str = "_calculate_"
+
+_records: Dict[str, List[float]] = {}  # name: [calls, seconds]
+_originals: Dict[int, Callable[..., Any]] = {}  # id of hook: original
+_patched_classes: List[Tuple[type, str, Callable[..., Any]]] = []
+_depth: int = 0
+
+
+def _hook(name: str, function: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a function to count its calls and time them."""
+    record: List[float] = _records.setdefault(name, [0, 0.0])
+
+    @functools.wraps(function)
+    def profiled(*args: Any, **kwargs: Any) -> Any:
+        start: float = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            record[0] += 1
+            record[1] += perf_counter() - start
+
+    return profiled
+
+
+def _astronomical_modules() -> List[ModuleType]:
+    """Return every loaded module of the package."""
+    return [module for name, module in list(sys.modules.items())
+            if name.startswith("astronomical.") and module is not None]
+
+
+def _rebind(replacements: Dict[int, Callable[..., Any]]) -> None:
+    """Rebind module level names, wherever imported, to replacements.
+
+    Replacements are keyed by the id of the function they replace.
+    """
+    for module in _astronomical_modules():
+        for name, value in list(vars(module).items()):
+            if id(value) in replacements:
+                setattr(module, name, replacements[id(value)])
+
+
+def enable() -> None:
+    """Swap the profiling hooks in."""
+    global _depth
+    _depth += 1
+    if _depth > 1:
+        return
+
+    hooks: Dict[int, Callable[..., Any]] = {}
+    for module_name in FUNCTION_MODULES:
+        module = importlib.import_module(module_name)
+        short_name: str = module_name.rsplit(".", 1)[-1]
+        for name, function in inspect.getmembers(module,
+                                                 inspect.isfunction):
+            if function.__module__ == module_name:
+                hook = _hook(f"{short_name}.{name}", function)
+                hooks[id(function)] = hook
+                _originals[id(hook)] = function
+    for module_name in METHOD_MODULES:
+        module = importlib.import_module(module_name)
+        for _, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ != module_name:
+                continue
+            for name, method in list(vars(cls).items()):
+                if name.startswith(METHOD_PREFIX) and inspect.isfunction(
+                        method):
+                    _patched_classes.append((cls, name, method))
+                    setattr(cls, name,
+                            _hook(f"{cls.__name__}.{name}", method))
+
+    _rebind(hooks)
+    logger.info(f"PROFILING: \"{len(hooks) + len(_patched_classes)}\" "
+                f"hooks enabled.")
+
+
+def disable() -> None:
+    """Swap the profiling hooks out, restoring the original functions."""
+    global _depth
+    if _depth == 0:
+        return
+    _depth -= 1
+    if _depth > 0:
+        return
+
+    _rebind(_originals)
+    _originals.clear()
+    for cls, name, method in _patched_classes:
+        setattr(cls, name, method)
+    _patched_classes.clear()
+    logger.info(f"PROFILING: hooks disabled.")
+
+
+def summary() -> Dict[str, Dict[str, float]]:
+    """Return the calls and cumulative seconds recorded for each hook.
+
+    Hooks never called are left out; the slowest come first.
+    """
+    return {name: {"calls": int(calls), "seconds": seconds}
+            for name, (calls, seconds)
+            in sorted(_records.items(), key=lambda item: -item[1][1])
+            if calls}
+
+
+def reset() -> None:
+    """Forget everything recorded so far."""
+    for record in _records.values():
+        record[0], record[1] = 0, 0.0
+
+
+@contextmanager
+def profile() -> Iterator[Dict[str, Dict[str, float]]]:
+    """Profile the enclosed code.
+
+    The dictionary yielded is filled, on leaving the block, with what was
+    recorded inside it; profiling of the whole process is unaffected.
+    """
+    results: Dict[str, Dict[str, float]] = {}
+    before: Dict[str, Dict[str, float]] = summary()
+    enable()
+    try:
+        yield results
+    finally:
+        disable()
+        for name, result in summary().items():
+            previous = before.get(name, {"calls": 0, "seconds": 0.0})
+            if result["calls"] > previous["calls"]:
+                results[name] = {
+                    "calls": result["calls"] - previous["calls"],
+                    "seconds": result["seconds"] - previous["seconds"]}
+
+
+def report(destination: str) -> None:
+    """Print the summary, or save it as JSON if destination is a file."""
+    results = summary()
+    if destination.endswith(".json"):
+        with open(destination, "w") as report_file:
+            json.dump(results, report_file, indent=2)
+        return
+    print(f"{'function':50}{'calls':>10}{'seconds':>12}", file=sys.stderr)
+    for name, result in results.items():
+        print(f"{name:50}{result['calls']:10d}{result['seconds']:12.6f}",
+              file=sys.stderr)
+
+
+def profile_process() -> None:
+    """Profile the rest of the process if the environment asks for it."""
+    destination = os.getenv(ENVIRONMENT_VARIABLE)
+    if not destination:
+        return
+    enable()
+    atexit.register(report, destination)
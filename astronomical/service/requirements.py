@@ -1,13 +1,13 @@
 """Requirements for astronomical."""
 
 from datetime import datetime
-
-import pytz
-from suntime import Sun as Sun_Import  # type: ignore
+from typing import Union
 
 from ..model.custom_types import angle
+from ..model.lunar import MoonEvents, MoonPosition
 from ..model.real_world_calculations import Alarms, State, Time
 from ..service.logging import logger
+from ..service.persistent_cache import AlarmTimes
 
 d = u"\N{DEGREE SIGN}"
 
@@ -20,13 +20,16 @@ class SunService:
         logger.info(f"INTERFACE: \"{self.__class__.__name__}\" "
                     f"instantiating.")
         self.rise, self.set = state.suntimes
+        self.daylight = state.daylight
         self.ra, self.dec = state.equatorial_coords
         self.az, self.alt = state.elevation
 
     def __str__(self) -> str:
         """Generate summary of class."""
-        sunrise = self.rise.strftime("%I:%M%p")
-        sunset = self.set.strftime("%I:%M%p")
+        sunrise = self.rise.strftime("%I:%M%p") if self.rise \
+            else self.daylight.value
+        sunset = self.set.strftime("%I:%M%p") if self.set \
+            else self.daylight.value
         ra: angle = angle(round(self.ra, 2))
         dec: angle = angle(round(self.dec, 2))
         az: angle = angle(round(self.az, 2))
@@ -37,10 +40,39 @@ class SunService:
                f"- Azimuth, Altitude:\t\t({az},{alt})")
 
 
+class MoonService:
+    """Return moonrise/set times, the moon's phase and relative position."""
+
+    def __init__(self, position: MoonPosition, events: MoonEvents) -> None:
+        """Initialise variables."""
+        logger.info(f"INTERFACE: \"{self.__class__.__name__}\" "
+                    f"instantiating.")
+        self.rise, self.set = events
+        self.phase = position.phase
+        self.illumination = position.illumination
+        self.ra, self.dec = position.ra, position.dec
+        self.az, self.alt = position.az, position.alt
+
+    def __str__(self) -> str:
+        """Generate summary of class."""
+        moonrise = self.rise.strftime("%I:%M%p") if self.rise else "none"
+        moonset = self.set.strftime("%I:%M%p") if self.set else "none"
+        ra: angle = angle(round(self.ra, 2))
+        dec: angle = angle(round(self.dec, 2))
+        az: angle = angle(round(self.az, 2))
+        alt: angle = angle(round(self.alt, 2))
+        return(f"Moon data:\n"
+               f"- Rise-> set: \t\t\t{moonrise}-> {moonset}\n"
+               f"- Phase:\t\t\t{self.phase.value} "
+               f"({self.illumination:.0%} lit)\n"
+               f"- Right Ascension, Declination:\t({ra},{dec})\n"
+               f"- Azimuth, Altitude:\t\t({az},{alt})")
+
+
 class AlarmsService:
     """Return alarm type objects for going to sleep and getting up."""
 
-    def __init__(self, alarm: Alarms) -> None:
+    def __init__(self, alarm: Union[Alarms, AlarmTimes]) -> None:
         """Initialise variables."""
         logger.info(f"INTERFACE: \"{self.__class__.__name__}\" "
                     f"instantiating.")
@@ -0,0 +1,11 @@
+"""Benchmark suite for astronomical.
+
+Benchmarks are grouped as micro (each physics function), macro (the model
+and service objects behind each option) and end-to-end (the command line
+script in a fresh interpreter). Results are saved as JSON so that a run can
+be compared against a saved baseline:
+
+    python -m benchmarks run --output baseline.json
+    python -m benchmarks run --output latest.json
+    python -m benchmarks compare baseline.json latest.json
+"""
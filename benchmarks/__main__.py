@@ -0,0 +1,69 @@
+"""Run benchmarks, or compare two saved runs.
+
+Usage:
+    python -m benchmarks run [--filter TEXT] [--repeat N] [--output FILE]
+    python -m benchmarks compare BASELINE CURRENT [--threshold FRACTION]
+
+Compare exits with status 1 if any benchmark regressed. If there is no
+baseline yet, the current run is saved as it.
+"""
+
+import argparse
+import os
+import sys
+
+from benchmarks import end_to_end, harness, macro, micro  # noqa: F401
+
+
+def show(name: str, timing: harness.Timing) -> None:
+    """Print a benchmark's timing as it completes."""
+    print(f"{name:40}{timing.best * 10**6:14.2f}us"
+          f"{timing.median * 10**6:14.2f}us", flush=True)
+
+
+def main() -> None:
+    """Provide the run and compare commands."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run = commands.add_parser("run", help="run the benchmarks")
+    run.add_argument("--filter", default="",
+                     help="only run benchmarks whose name contains this")
+    run.add_argument("--repeat", type=int, default=harness.REPEAT)
+    run.add_argument("--output", help="save the results as JSON here")
+    compare = commands.add_parser("compare",
+                                  help="compare a run against a baseline")
+    compare.add_argument("baseline")
+    compare.add_argument("current")
+    compare.add_argument("--threshold", type=float,
+                         default=harness.THRESHOLD,
+                         help="fractional slow down flagged as a "
+                              "regression (0.1)")
+    args = parser.parse_args()
+
+    if args.command == "run":
+        print(f"{'benchmark':40}{'best':>16}{'median':>16}")
+        report = harness.run(args.filter, args.repeat, progress=show)
+        if args.output:
+            harness.save(report, args.output)
+        return
+
+    current = harness.load(args.current)
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; saving {args.current} "
+              f"as it")
+    changes = harness.compare(harness.load_baseline(args.baseline, current),
+                              current, args.threshold)
+    print(f"{'benchmark':40}{'baseline':>14}{'current':>14}{'ratio':>8}")
+    for change in changes:
+        flag = "  REGRESSION" if change.regression else ""
+        print(f"{change.name:40}{change.baseline * 10**6:12.2f}us"
+              f"{change.current * 10**6:12.2f}us{change.ratio:8.2f}{flag}")
+    regressions = [change for change in changes if change.regression]
+    if regressions:
+        print(f"{len(regressions)} regression(s) beyond "
+              f"{args.threshold:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
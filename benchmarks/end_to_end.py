@@ -0,0 +1,42 @@
+"""End-to-end benchmarks: the command line script in a fresh interpreter.
+
+Each run has its own home and cache directories, so the user's config and
+cache do not affect the timings. Options are timed cold (`--no-cache`) and
+warm (answered from the on-disk cache).
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+from typing import Callable, Dict, List
+
+from benchmarks.harness import benchmark
+
+ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+OPTIONS: List[str] = ["--sun", "--time", "--alarms"]
+SCRIPT: str = "import sys; sys.argv = ['astronomical'] + sys.argv[1:]; " \
+    "from astronomical.interface.cli import main; main()"
+
+home: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+environment: Dict[str, str] = dict(
+    os.environ, HOME=home.name, LOG_LEVEL="",
+    XDG_CACHE_HOME=os.path.join(home.name, ".cache"),
+    PYTHONPATH=os.pathsep.join(filter(None, [ROOT,
+                                             os.getenv("PYTHONPATH")])))
+
+
+def command(*arguments: str) -> Callable[[], None]:
+    """Return a function running the script with the given arguments."""
+    def run() -> None:
+        subprocess.run([sys.executable, "-c", SCRIPT, *arguments],
+                       check=True, capture_output=True, env=environment)
+    return run
+
+
+benchmark("end_to_end.version")(command("--version"))
+for option in OPTIONS:
+    benchmark(f"end_to_end.{option[2:]}.cold")(command(option, "--no-cache"))
+    benchmark(f"end_to_end.{option[2:]}.warm")(command(option))
+benchmark("end_to_end.calendar.year")(
+    command("--calendar", os.devnull, "--start", "2022-01-01", "--no-cache"))
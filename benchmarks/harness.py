@@ -0,0 +1,142 @@
+"""Registering, timing, saving and comparing benchmarks."""
+
+import json
+import os
+import platform
+import statistics
+import sys
+from datetime import datetime
+from time import perf_counter
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+MINIMUM_TIME: float = 0.2  # s, loops are added until a repeat takes this
+REPEAT: int = 5
+THRESHOLD: float = 0.1  # fractional slow down flagged as a regression
+
+registry: Dict[str, Callable[[], Any]] = {}
+
+
+class Timing(NamedTuple):
+    """Timing of a benchmark.
+
+    Attributes
+    ----------
+    best (float)        fastest time per call (s)
+    median (float)      median time per call (s)
+    loops (int)         calls per repeat
+    repeat (int)        number of repeats
+    """
+
+    best: float
+    median: float
+    loops: int
+    repeat: int
+
+
+class Change(NamedTuple):
+    """Change in a benchmark between two runs.
+
+    Attributes
+    ----------
+    name (str)              benchmark name
+    baseline (float)        best time per call in the baseline (s)
+    current (float)         best time per call in the current run (s)
+    ratio (float)           current over baseline
+    regression (bool)       whether the slow down exceeds the threshold
+    """
+
+    name: str
+    baseline: float
+    current: float
+    ratio: float
+    regression: bool
+
+
+def benchmark(name: str) -> Callable[[Callable[[], Any]],
+                                     Callable[[], Any]]:
+    """Register a function, taking no arguments, as a benchmark."""
+    def register(function: Callable[[], Any]) -> Callable[[], Any]:
+        if name in registry:
+            raise ValueError(f"Benchmark \"{name}\" is already registered")
+        registry[name] = function
+        return function
+    return register
+
+
+def time_function(function: Callable[[], Any], repeat: int = REPEAT,
+                  minimum_time: float = MINIMUM_TIME) -> Timing:
+    """Time a function, calibrating the loops so each repeat is measurable."""
+    loops: int = 1
+    while True:
+        start = perf_counter()
+        for _ in range(loops):
+            function()
+        elapsed = perf_counter() - start
+        if elapsed >= minimum_time:
+            break
+        loops *= 10 if elapsed < minimum_time / 10 else 2
+
+    timings: List[float] = [elapsed / loops]
+    for _ in range(repeat - 1):
+        start = perf_counter()
+        for _ in range(loops):
+            function()
+        timings.append((perf_counter() - start) / loops)
+    return Timing(min(timings), statistics.median(timings), loops, repeat)
+
+
+def run(pattern: str = "", repeat: int = REPEAT,
+        minimum_time: float = MINIMUM_TIME,
+        progress: Optional[Callable[[str, Timing], None]] = None
+        ) -> Dict[str, Any]:
+    """Run every registered benchmark whose name contains pattern."""
+    results: Dict[str, Dict[str, Any]] = {}
+    for name, function in sorted(registry.items()):
+        if pattern not in name:
+            continue
+        timing = time_function(function, repeat, minimum_time)
+        results[name] = timing._asdict()
+        if progress:
+            progress(name, timing)
+    return {"created": datetime.now().isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "machine": platform.platform(),
+            "results": results}
+
+
+def save(report: Dict[str, Any], path: str) -> None:
+    """Save a report as JSON."""
+    with open(path, "w") as report_file:
+        json.dump(report, report_file, indent=2)
+
+
+def load(path: str) -> Dict[str, Any]:
+    """Load a report saved as JSON."""
+    with open(path) as report_file:
+        return json.load(report_file)
+
+
+def load_baseline(path: str, current: Dict[str, Any]) -> Dict[str, Any]:
+    """Load a baseline report, starting one from the current run if missing.
+
+    Timings only compare on the same machine, so no baseline is committed;
+    the first run on a fresh checkout becomes the baseline.
+    """
+    if not os.path.exists(path):
+        save(current, path)
+        return current
+    return load(path)
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any],
+            threshold: float = THRESHOLD) -> List[Change]:
+    """Compare the best times of benchmarks found in both reports."""
+    changes: List[Change] = []
+    for name, timing in sorted(current["results"].items()):
+        if name not in baseline["results"]:
+            continue
+        before: float = baseline["results"][name]["best"]
+        ratio: float = timing["best"] / before
+        changes.append(Change(name, before, timing["best"], ratio,
+                              ratio > 1 + threshold))
+    return changes
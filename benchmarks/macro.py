@@ -0,0 +1,152 @@
+"""Macro benchmarks: the model and service objects behind each option.
+
+Sun times are cached process-wide, so each benchmark is timed both cold
+(cache emptied first) and warm (answered from the cache).
+"""
+
+import os
+from dataclasses import replace
+from datetime import date, datetime, timedelta
+
+import numpy as np
+
+from astronomical.interface.configuration import UserDefaults
+from astronomical.model.almanac import sun_times
+from astronomical.model.configuration import SleepRequirements, earth, moon
+from astronomical.model.ephemeris import fit_planet
+from astronomical.model.event_cache import sun_events_cache
+from astronomical.model.kepler import KEPLER
+from astronomical.model.lunar import moon_times
+from astronomical.model.nbody import NBodySystem, propagate
+from astronomical.model.real_world_calculations import Alarms, State, Time
+from astronomical.model.schedule import SleepProfiles, batch_schedule
+from astronomical.model.solar_system import PlanetaryLocation
+from astronomical.service.configuration import DefaultService
+from benchmarks.harness import benchmark
+
+INSTANT: datetime = datetime(2022, 6, 21, 12)
+LONDON: PlanetaryLocation = PlanetaryLocation("London", 0.1276, 51.5072,
+                                              earth, INSTANT)
+SLEEP: SleepRequirements = SleepRequirements()
+PEOPLE: int = 1000
+PROFILES: SleepProfiles = SleepProfiles.from_requirements(
+    SleepRequirements(sleep=timedelta(hours=7, minutes=person % 120))
+    for person in range(PEOPLE))
+KEPLER_EARTH = replace(earth, orbit=KEPLER)
+KEPLER_LONDON: PlanetaryLocation = PlanetaryLocation(
+    "London", 0.1276, 51.5072, KEPLER_EARTH, INSTANT)
+MONTH = [INSTANT + timedelta(days=day) for day in range(30)]
+DECADE = [INSTANT + timedelta(days=day) for day in range(3650)]
+EPOCHS: np.ndarray = np.linspace(0.0, 100 * 365.25 * 86400.0, 1_000_000)
+CONFIG: str = os.path.join(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))), "tests", "data", "config.ini")
+
+
+def state() -> None:
+    """Construct a State and read everything it provides."""
+    current = State(INSTANT, LONDON)
+    current.suntimes
+    current.equatorial_coords
+    current.elevation
+
+
+@benchmark("macro.state.cold")
+def state_cold() -> None:
+    """State with nothing cached."""
+    sun_events_cache.clear()
+    state()
+
+
+@benchmark("macro.state.warm")
+def state_warm() -> None:
+    """State with its sun times cached."""
+    state()
+
+
+@benchmark("macro.time.cold")
+def time_cold() -> None:
+    """NAC time with nothing cached."""
+    sun_events_cache.clear()
+    Time(State(INSTANT, LONDON), INSTANT).nac
+
+
+@benchmark("macro.time.warm")
+def time_warm() -> None:
+    """NAC time with its sun times cached."""
+    Time(State(INSTANT, LONDON), INSTANT).nac
+
+
+@benchmark("macro.alarms")
+def alarms() -> None:
+    """Alarms for tomorrow."""
+    Alarms(SLEEP.sleep, SLEEP.earliest_wake_up, SLEEP.latest_wake_up,
+           SLEEP.ablutions, LONDON).wake
+
+
+@benchmark("macro.alarms.batch")
+def alarms_batch() -> None:
+    """Calculate a year of alarms for a thousand people."""
+    batch_schedule(PROFILES, [LONDON] * PEOPLE, date(2022, 1, 1),
+                   date(2023, 1, 1))
+
+
+@benchmark("macro.kepler.positions")
+def kepler_positions() -> None:
+    """Place the sun on a Keplerian orbit at a million epochs."""
+    replace(earth, orbit=KEPLER)._calculate_sun_position()(EPOCHS)
+
+
+@benchmark("macro.kepler.sun_times.exact")
+def kepler_sun_times_exact() -> None:
+    """Solve a month of sun times on a Keplerian orbit."""
+    KEPLER_EARTH.__dict__.pop("_table", None)
+    for day in MONTH:
+        KEPLER_LONDON._calculate_sun_times(day)
+
+
+@benchmark("macro.kepler.sun_times.table")
+def kepler_sun_times_table() -> None:
+    """Solve a month of sun times from a table of the Keplerian orbit."""
+    KEPLER_EARTH.tabulate(MONTH[0], MONTH[-1])
+    for day in MONTH:
+        KEPLER_LONDON._calculate_sun_times(day)
+
+
+@benchmark("macro.almanac.decade")
+def almanac_decade() -> None:
+    """Calculate a decade of sun times in bulk."""
+    sun_times(LONDON, DECADE[0], DECADE[-1] + timedelta(days=1))
+
+
+@benchmark("macro.almanac.decade.scalar")
+def almanac_decade_scalar() -> None:
+    """Calculate a decade of sun times one day at a time, to compare."""
+    for day in DECADE:
+        LONDON._calculate_sun_times(day)
+
+
+@benchmark("macro.kepler.ephemeris")
+def kepler_ephemeris() -> None:
+    """Fit a century of segments and place the sun at a million epochs."""
+    fit_planet(KEPLER_EARTH, earth.ref_march_equinox,
+               earth.ref_march_equinox + timedelta(days=36525))(EPOCHS)
+
+
+@benchmark("macro.moon.decade")
+def moon_decade() -> None:
+    """Calculate a decade of moonrises and moonsets for a site."""
+    moon_times(moon, LONDON, datetime(2022, 1, 1), datetime(2032, 1, 1))
+
+
+@benchmark("macro.nbody.year")
+def nbody_year() -> None:
+    """Integrate the sun, earth and moon for a year in hourly steps."""
+    system = NBodySystem.from_bodies([earth.parent, earth, moon], INSTANT)
+    for _ in propagate(system, timedelta(hours=1), 8766, every=24):
+        pass
+
+
+@benchmark("macro.default_service")
+def default_service() -> None:
+    """Load the default configuration from the test config."""
+    DefaultService(UserDefaults(CONFIG), INSTANT)
@@ -0,0 +1,70 @@
+"""Benchmark, and guard, the memory held by the custom types.
+
+Large numbers of angles are kept in memory, so each custom type should cost
+no more per instance than its base type plus the small, fixed header of a
+subclass. Memory per instance is measured with tracemalloc over many
+instances and compared with the base type; the exit status is 1 when a
+custom type exceeds its budget.
+
+Usage: python -m benchmarks.memory [--count N]
+"""
+
+import argparse
+import sys
+import tracemalloc
+from datetime import timedelta
+from typing import Any, Callable, List, Tuple
+
+from astronomical.model.custom_types import (angle, eccentricity, mass, radius,
+                                             real_time)
+
+OVERHEAD_BUDGET: int = 16  # bytes per instance over the base type
+
+# name, custom constructor, base constructor; called with the index
+CASES: List[Tuple[str, Callable[[int], Any], Callable[[int], Any]]] = [
+    ("angle", lambda i: angle(i + 0.5), lambda i: float(i + 0.5)),
+    ("mass", lambda i: mass(i + 0.5), lambda i: float(i + 0.5)),
+    ("radius", lambda i: radius(i + 0.5), lambda i: float(i + 0.5)),
+    ("eccentricity", lambda i: eccentricity(0.5 / (i + 1)),
+     lambda i: float(0.5 / (i + 1))),
+    ("real_time", lambda i: real_time(seconds=i + 1),
+     lambda i: timedelta(seconds=i + 1)),
+]
+
+
+def bytes_per_instance(constructor: Callable[[int], Any], count: int
+                       ) -> float:
+    """Return the memory (bytes) held per instance, excluding the list."""
+    tracemalloc.start()
+    instances = [None] * count
+    baseline, _ = tracemalloc.get_traced_memory()
+    for index in range(count):
+        instances[index] = constructor(index)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instances
+    return (current - baseline) / count
+
+
+def main() -> None:
+    """Measure each custom type against its base type."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=100000)
+    args = parser.parse_args()
+
+    over_budget: bool = False
+    print(f"{'type':14}{'custom':>10}{'base':>10}  (bytes per instance)")
+    for name, custom, base in CASES:
+        custom_bytes = bytes_per_instance(custom, args.count)
+        base_bytes = bytes_per_instance(base, args.count)
+        flag = ""
+        if round(custom_bytes - base_bytes) > OVERHEAD_BUDGET:
+            over_budget = True
+            flag = "  over budget"
+        print(f"{name:14}{custom_bytes:10.1f}{base_bytes:10.1f}{flag}")
+    if over_budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
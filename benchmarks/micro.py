@@ -0,0 +1,39 @@
+"""Micro benchmarks: one for each function in the physics module."""
+
+import functools
+from datetime import timedelta
+from typing import Any, Dict, Tuple
+
+from astronomical.model import physics
+from astronomical.model.configuration import earth, sun
+from benchmarks.harness import benchmark
+
+DAY: timedelta = earth._calculate_synodic_day()
+YEAR: timedelta = earth._calculate_orbital_period()
+SINCE_EQUINOX: timedelta = timedelta(days=93, hours=2)  # about midsummer
+SINCE_MIDNIGHT: timedelta = timedelta(hours=10)
+
+# arguments every physics function is timed with
+ARGUMENTS: Dict[str, Tuple[Any, ...]] = {
+    "angular_velocity": (earth.sidereal_day,),
+    "a_sin_theta": (23.44, 0.25),
+    "gravitational_force": (sun.mass, earth.mass, earth.semimajor_axis),
+    "law_of_orbits_aphelion": (earth.semimajor_axis, earth.eccentricity),
+    "law_of_orbits_perihelion": (earth.semimajor_axis, earth.eccentricity),
+    "law_of_orbits": (earth.semimajor_axis, earth.eccentricity),
+    "law_of_periods": (sun.mass, earth.mass, earth.semimajor_axis),
+    "equatorial_coordinates": (SINCE_EQUINOX, DAY, 23.44, YEAR,
+                               SINCE_EQUINOX),
+    "right_ascension": (SINCE_EQUINOX, DAY),
+    "declination": (23.44, YEAR, SINCE_EQUINOX),
+    "solar_hour_angle": (DAY, SINCE_MIDNIGHT),
+    "elevation": (51.5072, 23.44, -30.0),
+    "azimuth": (51.5072, 23.44, -30.0, 55.0),
+    "altitude": (51.5072, 23.44, -30.0),
+    "horizon_hour_angle": (51.5072, 23.44),
+    "synodic_day": (YEAR.total_seconds(), earth.sidereal_day.total_seconds()),
+}
+
+for name, arguments in ARGUMENTS.items():
+    benchmark(f"micro.physics.{name}")(
+        functools.partial(getattr(physics, name), *arguments))
@@ -0,0 +1,74 @@
+"""Benchmark, and guard, the start up time of the command line script.
+
+Shell prompts call the script constantly, so `astronomical --version` must
+stay cheap. The cumulative import time of the script module, as reported by
+`python -X importtime`, and the wall time of `--version` are measured in
+fresh interpreters and compared against budgets; the exit status is 1 when
+either is exceeded.
+
+Usage: python benchmarks/startup.py [--repeat N]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from time import perf_counter
+from typing import List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULE = "astronomical.interface.cli"
+IMPORT_BUDGET: float = 0.05  # s, cumulative import of the script module
+VERSION_BUDGET: float = 0.15  # s, wall time of `--version`
+VERSION = f"import sys; sys.argv = ['astronomical', '--version']; " \
+    f"from {MODULE} import main; main()"
+
+
+def import_time(environment: dict) -> float:
+    """Return the cumulative import time (s) of the script module."""
+    stderr = subprocess.run([sys.executable, "-X", "importtime", "-c",
+                             f"import {MODULE}"],
+                            check=True, capture_output=True, text=True,
+                            env=environment).stderr
+    for line in stderr.splitlines():
+        _, _, cumulative, name = (part.strip() for part in
+                                  line.replace(":", "|", 1).split("|"))
+        if name == MODULE:
+            return int(cumulative) / 10**6
+    raise RuntimeError(f"{MODULE} was not imported")
+
+
+def version_time(environment: dict) -> float:
+    """Return the wall time (s) of `--version` in a fresh interpreter."""
+    start = perf_counter()
+    subprocess.run([sys.executable, "-c", VERSION], check=True,
+                   capture_output=True, env=environment)
+    return perf_counter() - start
+
+
+def main() -> None:
+    """Measure start up and compare against the budgets."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    environment = dict(os.environ,
+                       PYTHONPATH=os.pathsep.join(
+                           filter(None, [ROOT, os.getenv("PYTHONPATH")])))
+    imports: List[float] = [import_time(environment)
+                            for _ in range(args.repeat)]
+    versions: List[float] = [version_time(environment)
+                             for _ in range(args.repeat)]
+
+    print(f"best of {args.repeat} (s):")
+    print(f"import {MODULE}: {min(imports):.4f} "
+          f"(budget {IMPORT_BUDGET})")
+    print(f"astronomical --version: {min(versions):.4f} "
+          f"(budget {VERSION_BUDGET})")
+    if min(imports) > IMPORT_BUDGET or min(versions) > VERSION_BUDGET:
+        print("over budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
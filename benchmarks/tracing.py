@@ -0,0 +1,93 @@
+"""Benchmark the cost of instrumenting base functions.
+
+The same workload is timed in two fresh interpreters, logging at the default
+ERROR level in both:
+
+* instrumented - base functions wrapped for TRACE and ERROR logging, as
+  they always were before instrumentation became conditional
+* default - base functions as now defined when TRACE is not being logged
+
+Usage: python benchmarks/tracing.py [--days N] [--repeat N]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from datetime import datetime, timedelta
+from time import perf_counter
+from typing import Dict
+
+MODES = ("instrumented", "default")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def workload(days: int) -> Dict[str, float]:
+    """Time sun times for a number of days, one by one and in bulk."""
+    from astronomical.model.almanac import sun_times
+    from astronomical.model.configuration import earth
+    from astronomical.model.event_cache import sun_events_cache
+    from astronomical.model.real_world_calculations import State
+    from astronomical.model.solar_system import PlanetaryLocation
+
+    london = PlanetaryLocation("London", 0.1276, 51.5072, earth)
+    first = datetime(2022, 1, 1)
+    sun_events_cache.clear()
+
+    start = perf_counter()
+    for day in range(days):
+        State(first + timedelta(days=day), london).suntimes
+    daily = perf_counter() - start
+
+    start = perf_counter()
+    sun_times(london, first, first + timedelta(days=days))
+    bulk = perf_counter() - start
+    return {"daily": daily, "bulk": bulk}
+
+
+def child(mode: str, days: int) -> None:
+    """Run the workload with the given instrumentation and print timings."""
+    import astronomical.service.logging as service_logging
+    service_logging.trace_base_functions = mode == "instrumented"
+    print(json.dumps(workload(days)))
+
+
+def main() -> None:
+    """Compare instrumented and default timings."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child(args.child, args.days)
+        return
+
+    environment = dict(os.environ, LOG_LEVEL="",
+                       PYTHONPATH=os.pathsep.join(
+                           filter(None, [ROOT, os.getenv("PYTHONPATH")])))
+    best: Dict[str, Dict[str, float]] = {}
+    for mode in MODES:
+        for _ in range(args.repeat):
+            output = subprocess.run(
+                [sys.executable, __file__, "--child", mode,
+                 "--days", str(args.days)],
+                check=True, capture_output=True, text=True,
+                env=environment).stdout
+            timings = json.loads(output)
+            best[mode] = {name: min(seconds, best.get(mode, {}).get(
+                name, seconds)) for name, seconds in timings.items()}
+
+    print(f"{args.days} days of sun times, best of {args.repeat} (s):")
+    print(f"{'':14}{'daily':>10}{'bulk':>10}")
+    for mode in MODES:
+        print(f"{mode:14}{best[mode]['daily']:10.3f}"
+              f"{best[mode]['bulk']:10.3f}")
+    for name in ("daily", "bulk"):
+        speedup = best["instrumented"][name] / best["default"][name]
+        print(f"{name} speed-up: {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
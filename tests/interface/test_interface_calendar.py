@@ -0,0 +1,124 @@
+import io
+import unittest
+from datetime import date, datetime, timedelta, timezone
+from itertools import islice
+from unittest import mock
+
+from astronomical.interface import calendar
+from astronomical.model.configuration import SleepRequirements, earth
+from astronomical.model.solar_system import PlanetaryLocation
+
+CREATED = datetime(2022, 1, 1)
+
+
+class TestFoldFunction(unittest.TestCase):
+    def test_short_lines_are_unchanged(self):
+        """RBICEP: Right"""
+        assert calendar.fold("SUMMARY:Sunrise") == "SUMMARY:Sunrise\r\n"
+
+    def test_long_lines_fold_at_75_octets(self):
+        """RBICEP: Boundary"""
+        line = "X-WR-CALNAME:" + "\N{DEGREE SIGN}" * 100
+
+        folded = calendar.fold(line)
+
+        assert all(len(part.encode()) <= 75
+                   for part in folded.split("\r\n"))
+        assert folded.replace("\r\n ", "") == line + "\r\n"
+
+
+class TestEscapeFunction(unittest.TestCase):
+    def test_text_is_escaped(self):
+        """RBICEP: Right"""
+        assert calendar.escape("Home; Back\\Garden,\r\nUK\n") \
+            == "Home\\; Back\\\\Garden\\,\\nUK\\n"
+
+    def test_plain_text_is_unchanged(self):
+        """RBICEP: Boundary"""
+        assert calendar.escape("NAC 06:00") == "NAC 06:00"
+
+
+class TestCalendarLinesFunction(unittest.TestCase):
+    def test_events_for_each_day(self):
+        """RBICEP: Right"""
+        location = PlanetaryLocation("London", 0.1276, 51.5072, earth)
+        output = io.StringIO(newline="")
+
+        calendar.write_calendar(output, location, date(2022, 6, 20),
+                                date(2022, 6, 22), SleepRequirements())
+        text = output.getvalue()
+
+        assert text.startswith("BEGIN:VCALENDAR\r\n") \
+            and text.endswith("END:VCALENDAR\r\n")
+        assert text.count("BEGIN:VEVENT") == text.count("END:VEVENT") \
+            == 2 * (2 + 24 + 3)
+        starts = {}
+        for event in text.split("BEGIN:VEVENT\r\n")[1:]:
+            fields = dict(line.split(":", 1) for line in event.split("\r\n")
+                          if ":" in line)
+            starts.setdefault(fields["SUMMARY"], []).append(
+                fields["DTSTART"])
+        assert starts["Sunrise"] == starts["NAC 06:00"] \
+            and starts["Sunset"] == starts["NAC 18:00"]
+
+    def test_calendar_name_is_escaped(self):
+        """RBICEP: Conformance"""
+        location = PlanetaryLocation("London, UK;\nHome", 0.1276, 51.5072,
+                                     earth)
+
+        lines = list(islice(calendar.calendar_lines(
+            location, date(2022, 6, 20), date(2022, 6, 21),
+            events=("sun",), created=CREATED), 4))
+
+        assert lines[3] == "X-WR-CALNAME:London\\, UK\\;\\nHome\r\n"
+
+    def test_dtstamp_is_utc(self):
+        """RBICEP: Conformance"""
+        location = PlanetaryLocation("London", 0.1276, 51.5072, earth)
+        created = datetime(2022, 1, 1, 12, tzinfo=timezone(timedelta(hours=2)))
+
+        given = "".join(calendar.calendar_lines(
+            location, date(2022, 6, 20), date(2022, 6, 21),
+            events=("sun",), created=created))
+        now = "".join(calendar.calendar_lines(
+            location, date(2022, 6, 20), date(2022, 6, 21),
+            events=("sun",)))
+
+        assert "DTSTAMP:20220101T100000Z\r\n" in given
+        stamp = now.split("DTSTAMP:")[1][:16]
+        assert abs(datetime.strptime(stamp, "%Y%m%dT%H%M%SZ").replace(
+            tzinfo=timezone.utc) - datetime.now(timezone.utc)) \
+            < timedelta(minutes=1)
+
+    def test_polar_days_have_no_sunrise(self):
+        """RBICEP: Boundary"""
+        location = PlanetaryLocation("Svalbard", 15.0, 78.0, earth)
+
+        text = "".join(calendar.calendar_lines(
+            location, date(2022, 6, 20), date(2022, 6, 22),
+            events=("sun", "nac"), created=CREATED))
+
+        assert "BEGIN:VEVENT" not in text
+
+    def test_calendar_is_streamed(self):
+        """RBICEP: Performance"""
+        location = PlanetaryLocation("London", 0.1276, 51.5072, earth)
+
+        with mock.patch.object(calendar.nac, "hour_boundaries",
+                               wraps=calendar.nac.hour_boundaries) as hours:
+            list(islice(calendar.calendar_lines(
+                location, date(2022, 1, 1), date(2122, 1, 1),
+                events=("nac",), created=CREATED), 10))
+
+        assert hours.call_count == 1
+
+    def test_unknown_events(self):
+        """RBICEP: Error"""
+        location = PlanetaryLocation("London", 0.1276, 51.5072, earth)
+
+        with self.assertRaises(ValueError):
+            list(calendar.calendar_lines(location, date(2022, 1, 1),
+                                         date(2022, 1, 2), events=("tides",)))
+        with self.assertRaises(ValueError):
+            list(calendar.calendar_lines(location, date(2022, 1, 1),
+                                         date(2022, 1, 2), events=("alarms",)))
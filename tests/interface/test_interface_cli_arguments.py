@@ -0,0 +1,57 @@
+import subprocess
+import sys
+import unittest
+
+from astronomical.interface.cli import (ALARMS_HELP, MOON_HELP, SUN_HELP,
+                                        TIME_HELP)
+from astronomical.service.requirements import (AlarmsService, MoonService,
+                                               SunService, TimeService)
+
+VERSION_ONLY = """
+import sys
+sys.argv = ["astronomical", "--version"]
+from astronomical.interface.cli import main
+try:
+    main()
+except SystemExit:
+    pass
+print(" ".join(sorted(sys.modules)))
+"""
+
+NO_CACHE = """
+import argparse
+import sys
+from astronomical.interface.cli import open_cache
+cache = open_cache(argparse.Namespace(no_cache=True, clear_cache=False))
+print(cache, " ".join(sorted(sys.modules)))
+"""
+
+
+class TestCommandLineStartUp(unittest.TestCase):
+    def test_version_does_not_load_the_model(self):
+        """RBICEP: Performance"""
+        output = subprocess.run([sys.executable, "-c", VERSION_ONLY],
+                                check=True, capture_output=True,
+                                text=True).stdout
+        modules = output.splitlines()[-1].split()
+
+        assert "0.5.0" in output \
+            and not {"numpy", "loguru", "suntime", "pytz",
+                     "astronomical.model"} & set(modules)
+
+    def test_no_cache_does_not_load_sqlite(self):
+        """RBICEP: Performance"""
+        output = subprocess.run([sys.executable, "-c", NO_CACHE],
+                                check=True, capture_output=True,
+                                text=True).stdout
+        cache, *modules = output.splitlines()[-1].split()
+
+        assert cache == "None" and not {
+            "sqlite3", "astronomical.service.persistent_cache"} & set(modules)
+
+    def test_help_matches_services(self):
+        """RBICEP: Cross-check"""
+        assert SUN_HELP == SunService.__doc__.lower()[:-1] \
+            and TIME_HELP == TimeService.__doc__.lower()[:-1] \
+            and MOON_HELP == MoonService.__doc__.lower()[:-1] \
+            and ALARMS_HELP == AlarmsService.__doc__.lower()[:-1]
@@ -0,0 +1,70 @@
+import unittest
+from datetime import datetime, timedelta
+from time import perf_counter
+
+import numpy as np
+
+from astronomical.model.almanac import sun_times
+from astronomical.model.configuration import earth
+from astronomical.model.events import Daylight
+from astronomical.model.real_world_calculations import State
+from astronomical.model.solar_system import PlanetaryLocation
+
+
+class TestSunTimes(unittest.TestCase):
+    def test_sun_times_returns_one_row_per_day(self):
+        """RBICEP: Right"""
+        test_location = PlanetaryLocation("London", 0.1276, 51.5072, earth)
+        test_days = 31
+
+        table = sun_times(test_location, datetime(2022, 1, 1, 12),
+                          datetime(2022, 1, 31, 12))
+
+        assert len(table.day) == len(table.rise) == len(table.set) \
+            == len(table.daylight) == test_days
+        assert (table.day <= table.rise).all() \
+            and (table.rise < table.set).all()
+
+    def test_sun_times_agree_with_state(self):
+        """RBICEP: Cross-check"""
+        test_location = PlanetaryLocation("London", 0.1276, 51.5072, earth)
+
+        table = sun_times(test_location, datetime(2022, 1, 1),
+                          datetime(2023, 1, 1))
+
+        for day in range(0, len(table.day), 30):
+            instant = table.day[day].astype(datetime) + timedelta(hours=12)
+            test_sunrise, test_sunset = State(instant, test_location).suntimes
+            assert abs(table.rise[day].astype(datetime) - test_sunrise) \
+                < timedelta(seconds=2)
+            assert abs(table.set[day].astype(datetime) - test_sunset) \
+                < timedelta(seconds=2)
+
+    def test_sun_times_mark_polar_days_and_nights(self):
+        """RBICEP: Boundary"""
+        test_location = PlanetaryLocation("Svalbard", 15.6, 78.2, earth)
+
+        table = sun_times(test_location, datetime(2022, 1, 1),
+                          datetime(2023, 1, 1))
+
+        polar_day = table.daylight == Daylight.POLAR_DAY.value
+        polar_night = table.daylight == Daylight.POLAR_NIGHT.value
+        assert polar_day.any() and polar_night.any()
+        assert np.isnat(table.rise[polar_day | polar_night]).all()
+        assert not np.isnat(table.rise[~(polar_day | polar_night)]).any()
+
+    def test_sun_times_beat_solving_each_day(self):
+        """RBICEP: Performance"""
+        test_location = PlanetaryLocation("London", 0.1276, 51.5072, earth)
+        test_days = [datetime(2022, 1, 1) + timedelta(days=day)
+                     for day in range(365)]
+
+        began = perf_counter()
+        sun_times(test_location, test_days[0], test_days[-1])
+        bulk = perf_counter() - began
+        began = perf_counter()
+        for day in test_days:
+            test_location._calculate_sun_times(day)
+        each_day = perf_counter() - began
+
+        assert bulk * 5 < each_day
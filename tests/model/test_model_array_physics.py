@@ -0,0 +1,76 @@
+import math
+import unittest
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from astronomical.model import array_physics, physics
+
+
+class TestToSeconds(unittest.TestCase):
+    def test_to_seconds_converts_datetime64_and_timedelta64(self):
+        """RBICEP: Right"""
+        test_instants = np.array(["1970-01-01T00:01", "1970-01-02"],
+                                 dtype="datetime64[s]")
+        test_durations = np.array([90, 3600], dtype="timedelta64[s]")
+
+        instants = array_physics.to_seconds(test_instants)
+        durations = array_physics.to_seconds(test_durations)
+
+        assert list(instants) == [60.0, 86400.0] \
+            and list(durations) == [90.0, 3600.0]
+
+    def test_to_seconds_converts_python_objects(self):
+        """RBICEP: Right"""
+        assert array_physics.to_seconds(timedelta(minutes=2)) == 120.0 \
+            and array_physics.to_seconds(datetime(1970, 1, 1, 0, 1)) == 60.0
+
+
+class TestArrayElevation(unittest.TestCase):
+    def test_altitude_broadcasts_latitudes_against_hour_angles(self):
+        """RBICEP: Right"""
+        test_latitudes = np.array([0.0, 45.0, 60.0])[:, np.newaxis]
+        test_hour_angles = np.linspace(-180.0, 180.0, 7)
+        test_declination = 20.0
+
+        alt = array_physics.altitude(test_latitudes, test_declination,
+                                     test_hour_angles)
+
+        assert alt.shape == (3, 7)
+        for i, lat in enumerate(test_latitudes[:, 0]):
+            for j, ha in enumerate(test_hour_angles):
+                assert math.isclose(alt[i, j], physics.altitude(
+                    lat, test_declination, ha), abs_tol=1e-12)
+
+    def test_elevation_agrees_with_scalar_api(self):
+        """RBICEP: Cross-check"""
+        test_hour_angles = np.array([-60.0, -1.0, 0.0, 30.0, 120.0])
+
+        az, alt = array_physics.elevation(51.5, 10.0, test_hour_angles)
+
+        for ha, a, b in zip(test_hour_angles, az, alt):
+            assert np.allclose((a, b), physics.elevation(51.5, 10.0, ha),
+                               rtol=0.0, atol=1e-12)
+
+
+class TestArrayEquatorialCoordinates(unittest.TestCase):
+    def test_declination_accepts_timedelta64(self):
+        """RBICEP: Right"""
+        test_since_equinox = np.array([0, 1, 2, 3], dtype="timedelta64[D]")
+        test_period = np.timedelta64(4, "D")
+        test_dec = [0.0, 45.0, 0.0, -45.0]
+
+        dec = array_physics.declination(45.0, test_period, test_since_equinox)
+
+        assert np.allclose(dec, test_dec)
+
+    def test_solar_hour_angle_and_right_ascension(self):
+        """RBICEP: Right"""
+        test_day = 86400.0
+        test_elapsed = np.array([0.0, 43200.0, 3 * 86400.0 + 21600.0])
+
+        sha = array_physics.solar_hour_angle(test_day, test_elapsed)
+        ra = array_physics.right_ascension(test_elapsed, test_day)
+
+        assert list(sha) == [-180.0, 0.0, 990.0] \
+            and list(ra) == [0.0, 43200.0, 21600.0]
@@ -0,0 +1,52 @@
+import unittest
+from datetime import timedelta
+
+from astronomical.model.custom_types import (angle, eccentricity, mass, radius,
+                                             real_time)
+
+
+class TestCustomTypes(unittest.TestCase):
+    def test_types_have_no_instance_dictionary(self):
+        """RBICEP: Performance"""
+        instances = [mass(1.0), radius(1.0), eccentricity(0.5), angle(1.0),
+                     real_time(seconds=1)]
+
+        for instance in instances:
+            with self.assertRaises(AttributeError):
+                instance.unit = "none"
+            assert not hasattr(instance, "__dict__")
+
+    def test_values_are_plain(self):
+        """RBICEP: Right"""
+        assert mass(2.0).value == 2.0 \
+            and type(angle(90.0).value) is float \
+            and real_time(minutes=1).value == 60.0
+
+    def test_real_time_value_is_per_instance(self):
+        """RBICEP: Cross-check"""
+        day = real_time(hours=23, minutes=56, seconds=4)
+        real_time(seconds=1)
+
+        assert day.value == 86164.0 \
+            and str(day) == "86164.0s"
+
+    def test_representations(self):
+        """RBICEP: Right"""
+        assert str(mass(2.0)) == "2.0kg" \
+            and str(radius(3.0)) == "3.0m" \
+            and str(eccentricity(0.5)) == "0.5" \
+            and str(angle(45.5)) == "45.5\N{DEGREE SIGN}"
+
+    def test_invalid_values_are_rejected(self):
+        """RBICEP: Boundary"""
+        for invalid in (lambda: mass(0.0), lambda: radius(-1.0),
+                        lambda: eccentricity(1.0),
+                        lambda: real_time(seconds=0),
+                        lambda: real_time(hours=1, seconds=-3600)):
+            with self.assertRaises(TypeError):
+                invalid()
+
+    def test_real_time_is_a_timedelta(self):
+        """RBICEP: Existence"""
+        assert real_time(hours=1) == timedelta(hours=1) \
+            and isinstance(real_time(hours=1), timedelta)
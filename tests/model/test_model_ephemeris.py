@@ -0,0 +1,109 @@
+import io
+import os
+import tempfile
+import unittest
+from dataclasses import replace
+from datetime import datetime
+
+import numpy as np
+
+from astronomical.model import ephemeris
+from astronomical.model.configuration import Defaults, earth
+from astronomical.model.kepler import KEPLER
+
+START = datetime(2022, 1, 1)
+END = datetime(2024, 1, 1)
+
+
+class TestFitPlanetFunction(unittest.TestCase):
+    def setUp(self):
+        self.planet = replace(earth, orbit=KEPLER)
+        self.exact = self.planet._calculate_exact_sun_position()
+        self.segments = ephemeris.fit_planet(self.planet, START, END)
+        self.test_times = np.linspace(self.segments.start,
+                                      self.segments._end, 10001,
+                                      endpoint=False)
+
+    def test_segments_agree_with_exact(self):
+        """RBICEP: Cross-check"""
+        dec, offset = self.segments(self.test_times)
+        exact_dec, exact_offset = self.exact(self.test_times)
+        ra = self.segments.right_ascension(self.test_times)
+        exact_ra = self.exact.right_ascension(self.test_times)
+
+        assert self.segments.error < 1e-8
+        assert np.abs(dec - exact_dec).max() < 1e-8
+        assert np.abs(offset - exact_offset).max() < 1e-8
+        assert np.abs((ra - exact_ra + 180) % 360 - 180).max() < 1e-8
+
+    def test_scalars_agree_with_arrays(self):
+        """RBICEP: Conformance"""
+        dec, offset = self.segments(self.test_times[::100])
+
+        for index, test_time in enumerate(self.test_times[::100].tolist()):
+            assert np.isclose(self.segments(test_time),
+                              (dec[index], offset[index]),
+                              rtol=0.0, atol=1e-12).all()
+
+    def test_save_and_load(self):
+        """RBICEP: Inverse"""
+        segments_file = io.BytesIO()
+
+        self.segments.save(segments_file)
+        segments_file.seek(0)
+        loaded = ephemeris.Ephemeris.load(segments_file)
+
+        assert (loaded(self.test_times)[0]
+                == self.segments(self.test_times)[0]).all()
+        assert loaded.fingerprint == self.segments.fingerprint \
+            and loaded.error == self.segments.error
+
+    def test_outside_the_segments(self):
+        """RBICEP: Boundary"""
+        outside = np.array([self.segments._end + 1.0])
+
+        with self.assertRaises(ValueError):
+            self.segments.declination(outside)
+        self.planet.use_ephemeris(self.segments)
+        assert self.segments.declination(outside) \
+            == self.exact.declination(outside)
+
+    def test_not_an_ephemeris(self):
+        """RBICEP: Error"""
+        with self.assertRaises(ValueError):
+            ephemeris.Ephemeris.load(io.BytesIO(bytes(64)))
+
+
+class TestPlanetUseEphemerisMethod(unittest.TestCase):
+    def test_locations_read_the_segments(self):
+        """RBICEP: Right"""
+        planet = replace(earth, orbit=KEPLER)
+        segments = ephemeris.fit_planet(planet, START, END)
+
+        planet.use_ephemeris(segments)
+
+        assert planet._calculate_sun_position() is segments
+
+    def test_segments_for_another_planet(self):
+        """RBICEP: Error"""
+        segments = ephemeris.fit_planet(earth, START, END)
+
+        with self.assertRaises(ValueError):
+            replace(earth, orbit=KEPLER).use_ephemeris(segments)
+
+    def test_defaults_load_segments(self):
+        """RBICEP: Right"""
+        planet = replace(earth, orbit=KEPLER)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "earth.eph")
+            with open(path, "wb") as segments_file:
+                ephemeris.fit_planet(planet, START, END).save(segments_file)
+
+            defaults = Defaults(planet=planet, instant=START,
+                                ephemeris=path)
+
+        assert isinstance(defaults.locale.planet._calculate_sun_position(),
+                          ephemeris.Ephemeris)
+        assert defaults.locale.planet is not planet \
+            and not isinstance(planet._calculate_sun_position(),
+                               ephemeris.Ephemeris)
@@ -0,0 +1,89 @@
+import unittest
+from dataclasses import replace
+from datetime import datetime, timedelta
+from unittest import mock
+
+from astronomical.model.configuration import earth
+from astronomical.model.ephemeris import fit_planet, planet_fingerprint
+from astronomical.model.event_cache import (EventCache, orbit_key, planet_key,
+                                            sun_events_cache)
+from astronomical.model.kepler import KEPLER
+from astronomical.model.real_world_calculations import State, Time
+from astronomical.model.solar_system import PlanetaryLocation
+
+
+class TestEventCacheClass(unittest.TestCase):
+    def test_cache_counts_hits_and_misses(self):
+        """RBICEP: Right"""
+        cache = EventCache(maxsize=2)
+
+        cache.get("a", lambda: 1)
+        cache.get("a", lambda: 2)
+        value = cache.get("a", lambda: 3)
+
+        assert value == 1 \
+            and cache.stats() == (2, 1, 1, 2)
+
+    def test_cache_evicts_least_recently_used(self):
+        """RBICEP: Boundary"""
+        cache = EventCache(maxsize=2)
+
+        cache.get("a", lambda: 1)
+        cache.get("b", lambda: 2)
+        cache.get("a", lambda: 1)
+        cache.get("c", lambda: 3)
+
+        assert cache.get("a", lambda: 0) == 1 \
+            and cache.get("b", lambda: 0) == 0
+
+    def test_cache_rejects_empty_size(self):
+        """RBICEP: Error"""
+        with self.assertRaises(ValueError):
+            EventCache(maxsize=0)
+
+
+class TestSunEventsCache(unittest.TestCase):
+    def test_repeated_nac_conversions_solve_once_per_day(self):
+        """RBICEP: Performance"""
+        sun_events_cache.clear()
+        test_start = datetime(2022, 6, 21, 6)
+
+        with mock.patch.object(PlanetaryLocation, "_calculate_sun_times",
+                               autospec=True,
+                               side_effect=PlanetaryLocation
+                               ._calculate_sun_times) as sun_times:
+            for minute in range(0, 600, 10):
+                instant = test_start + timedelta(minutes=minute)
+                location = PlanetaryLocation("London", 0.1276, 51.5072,
+                                             earth, instant=instant)
+                Time(State(instant, location), instant)
+
+        assert sun_times.call_count == 1 \
+            and sun_events_cache.stats().hits == 59
+
+
+class TestPlanetKeyFunction(unittest.TestCase):
+    def test_approximations_are_keyed_apart(self):
+        """RBICEP: Right"""
+        planet = replace(earth, orbit=KEPLER)
+        exact = planet_key(planet)
+
+        planet.tabulate(datetime(2022, 1, 1), datetime(2022, 2, 1))
+        tabulated = planet_key(planet)
+        planet.use_ephemeris(fit_planet(planet, datetime(2022, 1, 1),
+                                        datetime(2022, 2, 1)))
+        fitted = planet_key(planet)
+
+        assert len({exact, tabulated, fitted}) == 3
+        assert tabulated[:-5] == fitted[:-6] == exact[:-1] \
+            == orbit_key(planet)
+
+    def test_fingerprint_ignores_approximation(self):
+        """RBICEP: Conformance"""
+        planet = replace(earth, orbit=KEPLER)
+        segments = fit_planet(planet, datetime(2022, 1, 1),
+                              datetime(2022, 2, 1))
+
+        planet.use_ephemeris(segments)
+
+        assert planet_fingerprint(planet) == segments.fingerprint
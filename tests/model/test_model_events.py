@@ -0,0 +1,186 @@
+import math
+import unittest
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from astronomical.model.configuration import earth
+from astronomical.model.events import (ANALYTIC, ENGINES, NUMERICAL,
+                                       Daylight, bisect, bisect_array,
+                                       crossing_brackets, find_crossings)
+from astronomical.model.real_world_calculations import State
+from astronomical.model.solar_system import PlanetaryLocation
+
+
+class TestBisect(unittest.TestCase):
+    def test_bisect_returns_right_value(self):
+        """RBICEP: Right"""
+        test_tolerance = 10**-6
+        test_root = math.pi
+
+        root = bisect(math.sin, 3.0, 4.0, test_tolerance)
+
+        assert abs(root - test_root) <= test_tolerance
+
+
+class TestFindCrossings(unittest.TestCase):
+    def test_find_crossings_returns_rising_and_setting(self):
+        """RBICEP: Right"""
+        test_tolerance = 10**-6
+        test_crossings = [(math.pi, False), (2*math.pi, True)]
+
+        crossings = find_crossings(math.sin, 1.0, 7.0, test_tolerance)
+
+        assert len(crossings) == len(test_crossings)
+        for (crossing, rising), (test_crossing, test_rising) \
+                in zip(crossings, test_crossings):
+            assert abs(crossing - test_crossing) <= test_tolerance \
+                and rising == test_rising
+
+    def test_find_crossings_returns_nothing_without_change_of_sign(self):
+        """RBICEP: Boundary"""
+        crossings = find_crossings(math.cos, -1.0, 1.0, 10**-6)
+
+        assert crossings == []
+
+
+class TestSunTimes(unittest.TestCase):
+    def test_sun_times_agree_with_minute_scan(self):
+        """RBICEP: Cross-check"""
+        test_location = PlanetaryLocation("London", 0.1276, 51.5072, earth)
+        test_instant = datetime(2022, 6, 21, 12)
+        # values from the previous minute-by-minute scan
+        test_sunrise = datetime(2022, 6, 21, 3, 17, 21)
+        test_sunset = datetime(2022, 6, 21, 19, 42, 21)
+
+        sunrise, sunset = State(test_instant, test_location).suntimes
+
+        assert abs(sunrise - test_sunrise) < timedelta(minutes=2) \
+            and abs(sunset - test_sunset) < timedelta(minutes=2)
+
+    def test_sunset_on_the_day_boundary(self):
+        """RBICEP: Boundary"""
+        # the synodic day ends at about 23:28 in 2022, as the sun sets here
+        test_location = PlanetaryLocation("Equator", 90.0, 0.0, earth)
+
+        for test_day in range(1, 8):
+            events = test_location._calculate_sun_times(
+                datetime(2022, 1, test_day))
+
+            assert events.daylight == Daylight.NORMAL
+            assert abs(events.set - events.rise
+                       - timedelta(hours=12)) < timedelta(minutes=1)
+
+    def test_sun_times_follow_on_from_day_to_day(self):
+        """RBICEP: Cross-check"""
+        for test_longitude in range(-180, 181, 30):
+            test_location = PlanetaryLocation("Parallel", test_longitude,
+                                              20.0, earth)
+            days = [test_location._calculate_sun_times(
+                datetime(2022, 1, 1) + timedelta(days=day))
+                for day in range(0, 365, 5)]
+
+            for events in days:
+                assert events.daylight == Daylight.NORMAL \
+                    and events.rise < events.set
+            for before, after in zip(days, days[1:]):
+                assert before.set < after.rise
+                assert abs(after.rise - before.rise
+                           - timedelta(days=5)) < timedelta(minutes=10)
+
+    def test_sun_times_cost_does_not_grow_with_day_length(self):
+        """RBICEP: Performance"""
+        calls = []
+
+        def counted(seconds):
+            calls.append(seconds)
+            return math.sin(2 * math.pi * seconds / test_period)
+
+        for test_period in (86400.0, 100 * 3600.0):
+            calls.clear()
+            find_crossings(counted, 0.0, test_period, 1.0)
+            if test_period == 86400.0:
+                earth_calls = len(calls)
+
+        assert len(calls) - earth_calls <= 4
+
+
+class TestAnalyticSunTimes(unittest.TestCase):
+    def test_analytic_sun_times_agree_with_numerical(self):
+        """RBICEP: Cross-check"""
+        test_location = PlanetaryLocation("London", 0.1276, 51.5072, earth)
+        test_instant = datetime(2022, 6, 21, 12)
+
+        numerical = State(test_instant, test_location, engine=NUMERICAL)
+        analytic = State(test_instant, test_location, engine=ANALYTIC)
+
+        for test_time, time in zip(numerical.suntimes, analytic.suntimes):
+            assert abs(time - test_time) < timedelta(seconds=5)
+        assert analytic.daylight == Daylight.NORMAL
+
+    def test_analytic_sun_times_agree_around_the_world(self):
+        """RBICEP: Cross-check"""
+        for test_latitude in (-30.0, 0.0, 51.5):
+            for test_longitude in range(-180, 181, 45):
+                test_location = PlanetaryLocation(
+                    "Grid", test_longitude, test_latitude, earth)
+                for test_day in range(0, 365, 15):
+                    instant = datetime(2022, 1, 1) + timedelta(days=test_day)
+                    numerical = test_location._calculate_sun_times(instant)
+                    analytic = \
+                        test_location._calculate_analytic_sun_times(instant)
+
+                    assert analytic.daylight == numerical.daylight \
+                        == Daylight.NORMAL
+                    assert abs(analytic.rise - numerical.rise) \
+                        < timedelta(seconds=30)
+                    assert abs(analytic.set - numerical.set) \
+                        < timedelta(seconds=30)
+
+    def test_analytic_sun_times_return_polar_day_and_night(self):
+        """RBICEP: Boundary"""
+        test_location = PlanetaryLocation("Svalbard", 15.6, 78.2, earth)
+
+        for test_engine in ENGINES:
+            summer = State(datetime(2022, 6, 21), test_location,
+                           engine=test_engine)
+            winter = State(datetime(2022, 12, 21), test_location,
+                           engine=test_engine)
+
+            assert summer.daylight == Daylight.POLAR_DAY \
+                and summer.suntimes == (None, None)
+            assert winter.daylight == Daylight.POLAR_NIGHT \
+                and winter.suntimes == (None, None)
+
+    def test_unknown_engine_raises_error(self):
+        """RBICEP: Error"""
+        test_location = PlanetaryLocation("London", 0.1276, 51.5072, earth)
+
+        with self.assertRaises(ValueError):
+            State(datetime(2022, 6, 21), test_location, engine="guess")
+
+
+class TestArraySolvers(unittest.TestCase):
+    def test_crossing_brackets_and_bisect_array(self):
+        """RBICEP: Right"""
+        test_phases = np.array([0.0, 1.0, np.pi])
+        test_tolerance = 10**-6
+
+        def waves(x):
+            return np.sin(x + test_phases)
+
+        rising, setting, positive = crossing_brackets(waves, 0.5,
+                                                      0.5 + 2*np.pi)
+        rises = bisect_array(waves, rising[0], rising[1], test_tolerance)
+        sets = bisect_array(waves, setting[0], setting[1], test_tolerance)
+
+        assert np.allclose(np.sin(rises + test_phases), 0, atol=10**-5)
+        assert np.allclose(np.sin(sets + test_phases), 0, atol=10**-5)
+        assert list(positive) == [True, True, False]
+
+    def test_bisect_array_carries_missing_brackets(self):
+        """RBICEP: Boundary"""
+        roots = bisect_array(np.sin, np.array([3.0, np.nan]),
+                             np.array([4.0, np.nan]), 10**-6)
+
+        assert abs(roots[0] - math.pi) < 10**-6 and np.isnan(roots[1])
@@ -0,0 +1,128 @@
+import math
+import unittest
+from dataclasses import replace
+from datetime import datetime
+
+import numpy as np
+
+from astronomical.model import array_physics, kepler
+from astronomical.model.configuration import earth
+from astronomical.model.solar_system import PlanetaryLocation
+
+
+class TestEccentricAnomalyFunction(unittest.TestCase):
+    def test_solves_keplers_equation(self):
+        """RBICEP: Right"""
+        test_mean_anomalies = np.linspace(-10.0, 10.0, 1001)
+
+        for eccentricity in (0.0, 0.0167, 0.5, 0.9):
+            E = kepler.eccentric_anomaly(test_mean_anomalies, eccentricity)
+
+            assert np.allclose(E - eccentricity * np.sin(E),
+                               test_mean_anomalies, rtol=0.0, atol=1e-12)
+
+    def test_scalars_stay_scalars(self):
+        """RBICEP: Conformance"""
+        E = kepler.eccentric_anomaly(1.0, 0.0167)
+
+        assert np.ndim(E) == 0
+        assert math.isclose(E - 0.0167 * math.sin(E), 1.0)
+
+    def test_circular_orbits_have_no_anomaly(self):
+        """RBICEP: Boundary"""
+        test_mean_anomalies = np.array([0.0, 1.0, math.pi, 5.0])
+
+        assert np.allclose(kepler.true_anomaly(
+            kepler.eccentric_anomaly(test_mean_anomalies, 0.0), 0.0),
+            [0.0, 1.0, math.pi, 5.0])
+
+    def test_missing_anomalies_stay_missing(self):
+        """RBICEP: Boundary"""
+        E = kepler.eccentric_anomaly(np.array([1.0, np.nan]), 0.0167)
+
+        assert math.isclose(E[0] - 0.0167 * math.sin(E[0]), 1.0) \
+            and np.isnan(E[1])
+
+
+class TestKeplerSolverClass(unittest.TestCase):
+    def test_warm_start_agrees_with_cold_start(self):
+        """RBICEP: Cross-check"""
+        test_solver = kepler.KeplerSolver(0.5)
+        first = np.linspace(0.0, 6.0, 100)
+
+        test_solver.solve(first)
+        warm = test_solver.solve(first + 0.01)
+
+        assert np.allclose(warm, kepler.eccentric_anomaly(first + 0.01, 0.5),
+                           rtol=0.0, atol=1e-12)
+
+    def test_warm_start_after_far_epochs(self):
+        """RBICEP: Boundary"""
+        test_solver = kepler.KeplerSolver(0.9)
+        rng = np.random.default_rng(1)
+        test_epochs = rng.uniform(-1e4, 1e4, (50, 20))
+
+        for mean_anomalies in test_epochs:
+            warm = test_solver.solve(mean_anomalies)
+
+            assert np.allclose(warm, kepler.eccentric_anomaly(
+                mean_anomalies, 0.9), rtol=0.0, atol=1e-9)
+
+    def test_sun_is_independent_of_earlier_dates(self):
+        """RBICEP: Cross-check"""
+        planet = replace(earth, orbit=kepler.KEPLER, eccentricity=0.3)
+        cold = replace(planet)._calculate_sun_position()
+        warmed = planet._calculate_sun_position()
+        test_time = (datetime(2300, 6, 1)
+                     - earth.ref_march_equinox).total_seconds()
+
+        warmed.declination(np.array([-4e9]))
+        warmed.declination(np.array([4e9]))
+
+        assert math.isclose(warmed.declination(np.array([test_time]))[0],
+                            cold.declination(np.array([test_time]))[0],
+                            abs_tol=1e-9)
+
+
+class TestSunPositionClass(unittest.TestCase):
+    def test_uniform_declination_is_unchanged(self):
+        """RBICEP: Cross-check"""
+        test_times = np.linspace(0.0, 4e7, 50)
+        period = earth._calculate_orbital_period().total_seconds()
+
+        dec, offset = earth._calculate_sun_position()(test_times)
+
+        assert (dec == array_physics.declination(
+            earth.orbital_obliquity, period, test_times)).all()
+        assert offset == 0.0
+
+    def test_equation_of_time_extremes(self):
+        """RBICEP: Right"""
+        planet = replace(earth, orbit=kepler.KEPLER)
+        position = planet._calculate_sun_position()
+        days = np.arange(366) * 86400.0
+
+        minutes = position.equation_of_time(days) / 60
+
+        assert -15.0 < minutes.min() < -13.0
+        assert 15.0 < minutes.max() < 17.0
+        assert math.isclose(np.abs(position.declination(days)).max(),
+                            earth.orbital_obliquity, abs_tol=0.01)
+
+    def test_kepler_moves_sunrise(self):
+        """RBICEP: Right"""
+        planet = replace(earth, orbit=kepler.KEPLER)
+        uniform = PlanetaryLocation("London", 0.1276, 51.5072, earth)
+        keplerian = PlanetaryLocation("London", 0.1276, 51.5072, planet)
+
+        before = uniform._calculate_sun_times(datetime(2022, 11, 3, 12))
+        after = keplerian._calculate_sun_times(datetime(2022, 11, 3, 12))
+
+        assert after.rise < before.rise and after.set < before.set
+
+    def test_unknown_or_incomplete_orbits(self):
+        """RBICEP: Error"""
+        with self.assertRaises(ValueError):
+            kepler.SunPosition("epicycles", 23.44, 0.0167, 3.16e7, 86400.0)
+        with self.assertRaises(ValueError):
+            kepler.SunPosition(kepler.KEPLER, 23.44, 0.0167, 3.16e7, 86400.0)
@@ -0,0 +1,86 @@
+import unittest
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from astronomical.model.configuration import earth
+from astronomical.model.location_set import LocationSet
+from astronomical.model.solar_system import PlanetaryLocation
+
+
+class TestLocationSetClass(unittest.TestCase):
+    def setUp(self):
+        self.test_locations = [
+            PlanetaryLocation("London", 0.1276, 51.5072, earth),
+            PlanetaryLocation("Sydney", 151.2, -33.9, earth),
+            PlanetaryLocation("Quito", -78.5, -0.2, earth),
+        ]
+        self.test_instant = datetime(2022, 6, 21, 12)
+
+    def test_location_set_holds_arrays(self):
+        """RBICEP: Right"""
+        locations = LocationSet.from_locations(self.test_locations)
+
+        assert len(locations) == 3 \
+            and locations.latitudes.dtype == np.float64 \
+            and locations[1].name == "Sydney"
+
+    def test_location_set_rejects_mismatched_lengths(self):
+        """RBICEP: Error"""
+        with self.assertRaises(ValueError):
+            LocationSet(["London"], [0.1, 0.2], [51.5], earth)
+
+    def test_sun_times_agree_with_planetary_location(self):
+        """RBICEP: Cross-check"""
+        locations = LocationSet.from_locations(self.test_locations)
+
+        table = locations.sun_times(self.test_instant)
+
+        assert table.rise.shape == (1, 3)
+        for site, location in enumerate(self.test_locations):
+            events = location._calculate_sun_times(self.test_instant)
+            assert abs(table.rise[0, site].astype(datetime) - events.rise) \
+                < timedelta(seconds=2)
+            assert abs(table.set[0, site].astype(datetime) - events.set) \
+                < timedelta(seconds=2)
+
+    def test_equatorial_coords_and_elevation_agree(self):
+        """RBICEP: Cross-check"""
+        locations = LocationSet.from_locations(self.test_locations)
+
+        ra, dec = locations.equatorial_coords(self.test_instant)
+        az, alt = locations.elevation(self.test_instant)
+
+        for site, location in enumerate(self.test_locations):
+            test_ra, test_dec = \
+                location._calculate_equatorial_coords(self.test_instant)
+            test_az, test_alt = \
+                location._calculate_elevation(self.test_instant)
+            assert np.isclose(ra[site], test_ra) \
+                and np.isclose(dec[site], test_dec)
+            assert np.isclose(az[site], test_az) \
+                and np.isclose(alt[site], test_alt)
+
+    def test_elevation_follows_longitude(self):
+        """RBICEP: Cross-check"""
+        locations = LocationSet(["West", "East"], [-60.0, 60.0],
+                                [51.5, 51.5], earth)
+        table = locations.sun_times(self.test_instant)
+
+        for site in range(len(locations)):
+            for events in (table.rise, table.set):
+                _, alt = locations.elevation(events[0, site])
+                test_alt = locations[site]._calculate_elevation(
+                    events[0, site].astype(datetime))[1]
+
+                assert abs(alt[site]) < 0.01 and abs(test_alt) < 0.01
+
+    def test_queries_broadcast_over_instants(self):
+        """RBICEP: Right"""
+        locations = LocationSet.from_locations(self.test_locations)
+        test_instants = np.arange("2022-06-21T00", "2022-06-22T00",
+                                  dtype="datetime64[h]")
+
+        az, alt = locations.elevation(test_instants)
+
+        assert az.shape == alt.shape == (24, 3)
@@ -0,0 +1,125 @@
+import unittest
+from dataclasses import replace
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from astronomical.model import array_physics, lunar, timescale
+from astronomical.model.configuration import Defaults, earth, moon
+from astronomical.model.solar_system import PlanetaryLocation
+
+LONDON = PlanetaryLocation("London", 0.1276, 51.5072, earth)
+
+
+class TestLunarOrbitClass(unittest.TestCase):
+    def test_phases_of_a_known_month(self):
+        """RBICEP: Right"""
+        test_phases = {datetime(2022, 1, 2, 18, 33): lunar.Phase.NEW,
+                       datetime(2022, 1, 9, 18, 11):
+                           lunar.Phase.FIRST_QUARTER,
+                       datetime(2022, 1, 17, 23, 48): lunar.Phase.FULL,
+                       datetime(2022, 1, 25, 13, 41):
+                           lunar.Phase.LAST_QUARTER}
+
+        for instant, phase in test_phases.items():
+            assert lunar.moon_position(moon, LONDON, instant).phase == phase
+
+    def test_illumination_waxes_to_full(self):
+        """RBICEP: Right"""
+        orbit = lunar.lunar_orbit(moon)
+
+        assert orbit.illumination(timescale.seconds(
+            datetime(2022, 1, 2, 18, 33))) < 0.01
+        assert orbit.illumination(timescale.seconds(
+            datetime(2022, 1, 17, 23, 48))) > 0.99
+
+    def test_declination_follows_the_nodes(self):
+        """RBICEP: Right"""
+        orbit = lunar.lunar_orbit(moon)
+
+        def widest(year):
+            instants = timescale.seconds(datetime(year, 1, 1)) \
+                + np.arange(0.0, 365 * 86400.0, 3600.0)
+            return np.abs(orbit.equatorial(instants)[1]).max()
+
+        # lunar standstills: minor in 2015, major in 2024
+        assert 18.0 < widest(2015) < 19.5
+        assert 28.0 < widest(2024) < 29.0
+
+    def test_azimuth_of_a_known_moon(self):
+        """RBICEP: Right"""
+        # the full moon of 25 January 2024 rose in the east north east
+        position = lunar.moon_position(moon, LONDON,
+                                       datetime(2024, 1, 25, 18))
+
+        assert 72.0 < position.az < 82.0 and 14.0 < position.alt < 24.0
+
+    def test_azimuth_crosses_the_sky(self):
+        """RBICEP: Right"""
+        test_hours = {datetime(2024, 1, 25, 23): (140.0, 220.0),
+                      datetime(2024, 1, 26, 5): (240.0, 290.0)}
+
+        for instant, (least, most) in test_hours.items():
+            assert least < lunar.moon_position(moon, LONDON, instant).az \
+                < most
+
+    def test_needs_a_reference_new_moon(self):
+        """RBICEP: Error"""
+        with self.assertRaises(ValueError):
+            lunar.LunarOrbit(replace(moon, ref_new_moon=None))
+
+
+class TestMoonTimesFunction(unittest.TestCase):
+    def test_a_rise_and_set_most_days(self):
+        """RBICEP: Right"""
+        table = lunar.moon_times(moon, LONDON, datetime(2022, 1, 1, 12),
+                                 datetime(2022, 12, 31, 12))
+
+        assert len(table.day) == len(table.rise) == len(table.set) == 365
+        # the moon rises about 50 minutes later each day, so skips a day
+        # each month
+        rose = ~np.isnat(table.rise)
+        assert 10 <= (~rose).sum() <= 14
+        assert (table.day[rose] <= table.rise[rose]).all()
+
+    def test_moon_is_on_the_horizon(self):
+        """RBICEP: Cross-check"""
+        orbit = lunar.lunar_orbit(moon)
+        table = lunar.moon_times(moon, LONDON, datetime(2022, 1, 1),
+                                 datetime(2022, 2, 1))
+        rises = table.rise[~np.isnat(table.rise)]
+
+        altitudes = orbit.altitude(LONDON.latitude, LONDON.longitude,
+                                   array_physics.to_seconds(rises))
+
+        assert np.abs(altitudes - orbit.parallax).max() < 0.01
+
+    def test_events_agree_with_table(self):
+        """RBICEP: Cross-check"""
+        table = lunar.moon_times(moon, LONDON, datetime(2022, 1, 5),
+                                 datetime(2022, 1, 6))
+
+        events = lunar.moon_events(moon, LONDON, datetime(2022, 1, 5, 12))
+
+        assert abs(events.rise - table.rise[0].astype(datetime)) \
+            < timedelta(microseconds=1)
+
+    def test_moon_of_another_planet(self):
+        """RBICEP: Error"""
+        mars = replace(earth, name="Mars")
+        location = PlanetaryLocation("Jezero", 77.5, 18.4, mars)
+
+        with self.assertRaises(ValueError):
+            lunar.moon_times(moon, location, datetime(2022, 1, 1),
+                             datetime(2022, 1, 2))
+
+
+class TestDefaultsMoon(unittest.TestCase):
+    def test_moon_follows_the_planet(self):
+        """RBICEP: Right"""
+        configured_earth = replace(earth)
+
+        assert Defaults(instant=datetime(2022, 1, 1)).moon is moon
+        assert Defaults(planet=configured_earth).moon.parent \
+            is configured_earth
+        assert Defaults(planet=replace(earth, name="Mars")).moon is None
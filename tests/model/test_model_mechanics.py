@@ -1,12 +1,15 @@
-from datetime import timedelta
+from datetime import datetime, timedelta
 import unittest
+from unittest import mock
 
-from astronomical.model.custom_types import mass, radius
+from astronomical.model.custom_types import eccentricity, mass, radius, \
+    real_time
 from astronomical.model.mechanics import (
     RotationalMechanicsService,
     OrbitalMechanicsService
 )
-from astronomical.model.solar_system import Star
+from astronomical.model.physics import law_of_periods
+from astronomical.model.solar_system import Planet, Star
 
 
 class TestRotationalMechanicsServiceClass(unittest.TestCase):
@@ -77,3 +80,47 @@ class TestOrbitalMechanicsServiceClass(unittest.TestCase):
         T = orbiting_body._calculate_orbital_period()
         
         assert T.days == test_T.days  # round to days
+
+
+class TestDerivedParameters(unittest.TestCase):
+    def setUp(self):
+        self.test_sun = Star(name="The Sun",
+                             mass=mass(1.9885*10**30),
+                             radius=radius(696340000))
+        self.test_planet = Planet(name="Earth",
+                                  mass=mass(5.9722*10**24),
+                                  radius=radius(6371000),
+                                  semimajor_axis=radius(149.598*10**9),
+                                  eccentricity=eccentricity(0.014710219),
+                                  orbital_obliquity=23.44,
+                                  parent=self.test_sun,
+                                  sidereal_day=real_time(seconds=86164),
+                                  ref_march_equinox=datetime(2021, 3, 20),
+                                  ref_midnight=datetime(1970, 1, 1))
+
+    def test_derived_parameters_are_remembered(self):
+        """RBICEP: Performance"""
+        with mock.patch("astronomical.model.mechanics.law_of_periods",
+                        wraps=law_of_periods) as periods:
+            first = self.test_planet._calculate_orbital_period()
+            self.test_planet._calculate_synodic_day()
+            second = self.test_planet._calculate_orbital_period()
+            self.test_planet._calculate_synodic_day()
+
+        assert first is second and periods.call_count == 1
+
+    def test_derived_parameters_follow_mutation(self):
+        """RBICEP: Right"""
+        year = self.test_planet._calculate_orbital_period()
+        day = self.test_planet._calculate_synodic_day()
+
+        self.test_planet.semimajor_axis = radius(4 * 149.598*10**9)
+        longer_year = self.test_planet._calculate_orbital_period()
+        self.test_planet.sidereal_day = real_time(seconds=2 * 86164)
+        longer_day = self.test_planet._calculate_synodic_day()
+        self.test_sun.mass = mass(4 * 1.9885*10**30)
+        shorter_year = self.test_planet._calculate_orbital_period()
+
+        assert round(longer_year / year) == 8 \
+            and round(longer_day / day) == 2 \
+            and round(longer_year / shorter_year) == 2
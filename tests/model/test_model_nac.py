@@ -0,0 +1,160 @@
+import unittest
+from datetime import date, datetime, timedelta
+from unittest import mock
+
+import numpy as np
+
+from astronomical.model import nac
+from astronomical.model.configuration import earth
+from astronomical.model.real_world_calculations import State, Time
+from astronomical.model.solar_system import PlanetaryLocation
+
+
+def hourly(start: datetime, hours: int):
+    return [start + timedelta(hours=hour, minutes=7) for hour in range(hours)]
+
+
+class TestNacSecondsFunction(unittest.TestCase):
+    def test_sunrise_and_sunset_are_6am_and_6pm(self):
+        """RBICEP: Right"""
+        sunrise, sunset = 25200.0, 68400.0  # 7am, 7pm
+
+        assert nac.nac_seconds(sunrise, sunrise, sunset, 86400.0) == 21600.0
+        assert nac.nac_seconds(sunset, sunrise, sunset, 86400.0) == 64800.0
+
+    def test_array_agrees_with_scalar(self):
+        """RBICEP: Cross-check"""
+        std_times = np.linspace(0.0, 86399.0, 97)
+
+        test_nacs = nac.nac_seconds_array(std_times, np.full(97, 25000.5),
+                                          np.full(97, 70000.25), 86164.0)
+
+        assert [nac.nac_seconds(float(std_time), 25000.5, 70000.25, 86164.0)
+                for std_time in std_times] == test_nacs.tolist()
+
+
+class TestStreamFunction(unittest.TestCase):
+    def test_stream_agrees_with_time(self):
+        """RBICEP: Cross-check"""
+        test_location = PlanetaryLocation("London", 0.1276, 51.5072, earth)
+        instants = hourly(datetime(2022, 6, 20), 72)
+
+        test_nacs = list(nac.stream(instants, test_location))
+
+        assert test_nacs == [Time(State(instant, test_location), instant).nac
+                             for instant in instants]
+
+    def test_sun_events_fetched_once_per_day(self):
+        """RBICEP: Performance"""
+        test_location = PlanetaryLocation("London", 0.1276, 51.5072, earth)
+        instants = hourly(datetime(2022, 3, 1, 12), 72)
+
+        with mock.patch.object(test_location, "sun_events_at",
+                               wraps=test_location.sun_events_at) as lookup:
+            list(nac.stream(instants, test_location))
+
+        assert lookup.call_count == 4
+
+    def test_polar_day_raises(self):
+        """RBICEP: Error"""
+        test_location = PlanetaryLocation("Svalbard", 15.0, 78.0, earth)
+
+        with self.assertRaises(ValueError):
+            list(nac.stream([datetime(2022, 6, 21, 12)], test_location))
+
+
+class TestConvertFunction(unittest.TestCase):
+    def test_convert_agrees_with_stream(self):
+        """RBICEP: Cross-check"""
+        test_location = PlanetaryLocation("London", 0.1276, 51.5072, earth)
+        instants = hourly(datetime(2022, 12, 20), 96)[::-1]
+
+        test_nacs = nac.convert(np.array(instants, dtype="datetime64[us]"),
+                                test_location)
+
+        assert test_nacs.astype(datetime).tolist() \
+            == list(nac.stream(instants, test_location))
+
+    def test_polar_day_is_nat(self):
+        """RBICEP: Boundary"""
+        test_location = PlanetaryLocation("Svalbard", 15.0, 78.0, earth)
+        instants = np.array(["2022-06-21T12:00", "2022-12-21T12:00"],
+                            dtype="datetime64[us]")
+
+        test_nacs = nac.convert(instants, test_location)
+
+        assert np.isnat(test_nacs).all()
+
+
+class TestStdSecondsFunction(unittest.TestCase):
+    def test_inverts_nac_seconds(self):
+        """RBICEP: Inverse"""
+        sunrise, sunset = 25000.5, 70000.25
+
+        for std_time in np.linspace(0.0, 86399.0, 97):
+            test_nac = nac.nac_seconds(float(std_time), sunrise, sunset,
+                                       86164.0)
+            if std_time < sunrise and test_nac >= nac.NAC_SUNRISE:
+                continue  # the night overruns 6am; the day takes over
+            assert abs(nac.std_seconds(test_nac, sunrise, sunset, 86164.0)
+                       - std_time) < 2.0
+
+    def test_array_agrees_with_scalar(self):
+        """RBICEP: Cross-check"""
+        nac_times = np.linspace(0.0, 86399.0, 97)
+
+        test_stds = nac.std_seconds_array(nac_times, np.full(97, 25000.5),
+                                          np.full(97, 70000.25), 86164.0)
+
+        assert np.allclose(
+            [nac.std_seconds(float(nac_time), 25000.5, 70000.25, 86164.0)
+             for nac_time in nac_times], test_stds)
+
+
+class TestToStandardFunctions(unittest.TestCase):
+    def test_round_trip(self):
+        """RBICEP: Inverse"""
+        test_location = PlanetaryLocation("London", 0.1276, 51.5072, earth)
+        instants = hourly(datetime(2022, 9, 1, 12), 48)
+
+        for instant, test_nac in zip(instants,
+                                     nac.stream(instants, test_location)):
+            assert abs(nac.to_standard(test_nac, test_location) - instant) \
+                < timedelta(seconds=2)
+
+    def test_array_agrees_with_scalar(self):
+        """RBICEP: Cross-check"""
+        test_location = PlanetaryLocation("London", 0.1276, 51.5072, earth)
+        nac_times = hourly(datetime(2022, 4, 30), 60)
+
+        test_stds = nac.to_standard_array(
+            np.array(nac_times, dtype="datetime64[us]"), test_location)
+
+        for test_std, nac_time in zip(test_stds.astype(datetime), nac_times):
+            assert abs(test_std - nac.to_standard(nac_time, test_location)) \
+                < timedelta(microseconds=2)
+
+    def test_hour_boundaries_for_a_year(self):
+        """RBICEP: Right"""
+        test_location = PlanetaryLocation("London", 0.1276, 51.5072, earth)
+
+        boundaries = nac.hour_boundaries(test_location, date(2022, 1, 1),
+                                         date(2023, 1, 1))
+
+        assert boundaries.shape == (365, 24)
+        assert (np.diff(boundaries.ravel()) > np.timedelta64(0)).all()
+        instant = datetime(2022, 6, 21, 12)
+        sunrise, sunset = State(instant, test_location).suntimes
+        assert abs(boundaries[171, 6].astype(datetime) - sunrise) \
+            < timedelta(microseconds=2)
+        assert abs(boundaries[171, 18].astype(datetime) - sunset) \
+            < timedelta(microseconds=2)
+
+    def test_polar_night(self):
+        """RBICEP: Error"""
+        test_location = PlanetaryLocation("Svalbard", 15.0, 78.0, earth)
+
+        with self.assertRaises(ValueError):
+            nac.to_standard(datetime(2022, 12, 21, 12), test_location)
+        assert np.isnat(nac.hour_boundaries(
+            test_location, date(2022, 12, 21), date(2022, 12, 22))).all()
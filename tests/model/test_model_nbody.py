@@ -0,0 +1,135 @@
+import io
+import os
+import tempfile
+import unittest
+from dataclasses import replace
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from astronomical.model import nbody
+from astronomical.model.configuration import earth, moon
+from astronomical.model.physics import law_of_periods
+
+EPOCH = datetime(2022, 1, 1)
+
+
+class TestNBodySystemClass(unittest.TestCase):
+    def test_planet_starts_on_its_orbit(self):
+        """RBICEP: Right"""
+        system = nbody.NBodySystem.from_bodies([earth.parent, earth], EPOCH)
+        offset = system.state.positions[1] - system.state.positions[0]
+
+        # near perihelion and opposite the sun's December solstice point
+        assert abs(np.linalg.norm(offset) / earth.semimajor_axis
+                   - (1 - earth.eccentricity)) < 0.001
+        assert 95 < np.degrees(np.arctan2(offset[1], offset[0])) < 105
+
+    def test_system_about_its_barycentre(self):
+        """RBICEP: Right"""
+        system = nbody.NBodySystem.from_bodies([earth.parent, earth, moon],
+                                               EPOCH)
+
+        assert np.abs(system.masses @ system.state.positions).max() \
+            < 1e-6 * system.masses.sum()
+        assert np.abs(system.masses @ system.state.velocities).max() \
+            < 1e-12 * system.masses.sum()
+
+    def test_parent_missing(self):
+        """RBICEP: Error"""
+        with self.assertRaises(ValueError):
+            nbody.NBodySystem.from_bodies([earth, moon], EPOCH)
+
+
+class TestPropagateFunction(unittest.TestCase):
+    def setUp(self):
+        self.system = nbody.NBodySystem.from_bodies(
+            [earth.parent, earth, moon], EPOCH)
+
+    def test_energy_is_conserved(self):
+        """RBICEP: Right"""
+        energy = self.system.energy()
+
+        for method in nbody.METHODS:
+            system = nbody.NBodySystem(self.system.names, self.system.masses,
+                                       self.system.state)
+            for _ in nbody.propagate(system, timedelta(hours=2), 4380,
+                                     method, every=4380):
+                pass
+
+            assert abs((system.energy() - energy) / energy) < 1e-10
+
+    def test_period_agrees_with_law_of_periods(self):
+        """RBICEP: Cross-check"""
+        planet = replace(earth, eccentricity=0.0)
+        system = nbody.NBodySystem.from_bodies([planet.parent, planet],
+                                               EPOCH)
+        period = law_of_periods(planet.parent.mass, planet.mass,
+                                planet.semimajor_axis).total_seconds()
+        first = system.state.positions[1] - system.state.positions[0]
+
+        states = list(nbody.propagate(system, timedelta(hours=1),
+                                      int(period // 3600) + 48))
+        times = np.array([state.time for state in states])
+        offsets = np.array([state.positions[1] - state.positions[0]
+                            for state in states])
+        angles = np.unwrap(np.arctan2(offsets[:, 1], offsets[:, 0])
+                           - np.arctan2(first[1], first[0]))
+        angles -= 2 * np.pi * np.floor(angles[0] / (2 * np.pi))
+
+        returned = np.interp(2 * np.pi, angles, times)
+        assert abs(returned - nbody.timescale.seconds(EPOCH) - period) \
+            < 1e-6 * period
+
+    def test_checkpoint_resumes_the_run(self):
+        """RBICEP: Inverse"""
+        whole = nbody.NBodySystem(self.system.names, self.system.masses,
+                                  self.system.state)
+        for _ in nbody.propagate(whole, timedelta(hours=1), 200, every=200):
+            pass
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "system.npz")
+            for _ in nbody.propagate(self.system, timedelta(hours=1), 120,
+                                     every=120, checkpoint=path,
+                                     checkpoint_every=50):
+                pass
+            resumed = nbody.load_checkpoint(path)
+            for _ in nbody.propagate(resumed, timedelta(hours=1), 80,
+                                     every=80):
+                pass
+
+        assert resumed.names == whole.names
+        assert resumed.state.time == whole.state.time
+        assert np.allclose(resumed.state.positions, whole.state.positions,
+                           rtol=1e-12, atol=1e-3)
+
+    def test_unknown_method(self):
+        """RBICEP: Error"""
+        with self.assertRaises(ValueError):
+            next(nbody.propagate(self.system, timedelta(hours=1), 1,
+                                 "euler"))
+
+
+class TestWriteStatesFunction(unittest.TestCase):
+    def test_write_and_read(self):
+        """RBICEP: Inverse"""
+        system = nbody.NBodySystem.from_bodies([earth.parent, earth, moon],
+                                               EPOCH)
+        states_file = io.BytesIO()
+
+        written = nbody.write_states(states_file, system, nbody.propagate(
+            system, timedelta(hours=1), 240, every=24))
+        states_file.seek(0)
+        names, masses, states = nbody.read_states(states_file)
+        read = list(states)
+
+        assert written == len(read) == 10
+        assert names == system.names and (masses == system.masses).all()
+        assert read[-1].time == system.state.time
+        assert (read[-1].velocities == system.state.velocities).all()
+
+    def test_not_a_state_file(self):
+        """RBICEP: Error"""
+        with self.assertRaises(ValueError):
+            nbody.read_states(io.BytesIO(bytes(64)))
@@ -15,7 +15,8 @@ from astronomical.model.physics import (
     solar_hour_angle,
     altitude,
     azimuth,
-    elevation
+    elevation,
+    horizon_hour_angle
 )
 
 
@@ -186,3 +187,25 @@ class TestElevationCoordinates(unittest.TestCase):
                              
         assert int(azimuth) == int(test_azimuth) \
             and int(altitude) == int(test_altitude)
+
+
+class TestHorizonHourAngle(unittest.TestCase):
+    def test_horizon_hour_angle_returns_right_value(self):
+        """RBICEP: Right"""
+        test_latitude = 45.0
+        test_declination = 0.0
+        test_h0 = 90.0
+
+        h0 = horizon_hour_angle(test_latitude, test_declination)
+
+        assert round(h0, 6) == test_h0
+
+    def test_horizon_hour_angle_is_clamped_at_the_poles(self):
+        """RBICEP: Boundary"""
+        test_latitude = 80.0
+
+        polar_day = horizon_hour_angle(test_latitude, 20.0)
+        polar_night = horizon_hour_angle(test_latitude, -20.0)
+
+        assert polar_day == 180.0 \
+            and polar_night == 0.0
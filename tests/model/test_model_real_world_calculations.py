@@ -0,0 +1,63 @@
+import unittest
+from dataclasses import replace
+from datetime import datetime
+from unittest import mock
+
+from astronomical.model.configuration import earth
+from astronomical.model.event_cache import sun_events_cache
+from astronomical.model.real_world_calculations import State
+from astronomical.model.solar_system import PlanetaryLocation
+
+
+class TestStateClass(unittest.TestCase):
+    def test_construction_calculates_nothing(self):
+        """RBICEP: Performance"""
+        with mock.patch.object(PlanetaryLocation, "_calculate_sun_times") \
+                as sun_times, \
+                mock.patch.object(PlanetaryLocation,
+                                  "_calculate_elevation") as elevation:
+            location = PlanetaryLocation("London", 0.1276, 51.5072, earth)
+            State(datetime(2022, 6, 21, 12), location)
+
+        sun_times.assert_not_called()
+        elevation.assert_not_called()
+
+    def test_properties_are_calculated_once_and_shared(self):
+        """RBICEP: Performance"""
+        test_instant = datetime(2022, 6, 21, 12)
+        location = PlanetaryLocation("London", 0.1276, 51.5072, earth,
+                                     instant=test_instant)
+        sun_events_cache.clear()
+
+        with mock.patch.object(PlanetaryLocation, "_calculate_sun_times",
+                               wraps=location._calculate_sun_times) \
+                as sun_times:
+            state = State(test_instant, location)
+            suntimes = state.suntimes
+            later = State(datetime(2022, 6, 21, 18), location)
+
+            assert later.suntimes == suntimes == location.suntimes
+            assert sun_times.call_count == 1
+
+    def test_location_instant_is_not_frozen_at_import(self):
+        """RBICEP: Right"""
+        before = datetime.now()
+
+        location = PlanetaryLocation("London", 0.1276, 51.5072, earth)
+
+        assert location.instant >= before
+
+    def test_remembered_results_follow_the_planet(self):
+        """RBICEP: Right"""
+        test_instant = datetime(2022, 6, 21, 12)
+        location = PlanetaryLocation("London", 0.1276, 51.5072,
+                                     replace(earth), instant=test_instant)
+        upright = PlanetaryLocation("London", 0.1276, 51.5072,
+                                    replace(earth, orbital_obliquity=0.0),
+                                    instant=test_instant)
+        tilted = location.equatorial_coords
+
+        location.planet.orbital_obliquity = 0.0
+        assert location.equatorial_coords == upright.equatorial_coords
+        location.planet = earth
+        assert location.equatorial_coords == tilted
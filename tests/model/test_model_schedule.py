@@ -0,0 +1,127 @@
+import unittest
+from datetime import date, datetime, time, timedelta
+from unittest import mock
+
+import numpy as np
+
+from astronomical.model import schedule
+from astronomical.model.configuration import SleepRequirements, earth
+from astronomical.model.real_world_calculations import Alarms
+from astronomical.model.solar_system import PlanetaryLocation
+
+SLEEP = timedelta(hours=8)
+ABLUTIONS = timedelta(hours=1)
+
+
+def alarms_made_at(now: datetime) -> Alarms:
+    class frozen(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return now
+
+    location = PlanetaryLocation("London", 0.1276, 51.5072, earth)
+    with mock.patch("astronomical.model.real_world_calculations.datetime",
+                    frozen):
+        return Alarms(SLEEP, time(7), time(6), ABLUTIONS, location)
+
+
+class TestScheduleFunctions(unittest.TestCase):
+    def test_latest_vernal_equinox(self):
+        """RBICEP: Right"""
+        test_nows = np.array([-50.0, 0.0, 250.0])
+
+        assert schedule.latest_vernal_equinox(test_nows, 10.0, 100.0) \
+            .tolist() == [-90.0, -90.0, 210.0]
+
+    def test_annual_progress_is_a_turn_per_year(self):
+        """RBICEP: Right"""
+        year = 365 * 86400.0
+
+        assert schedule.annual_progress(-1.0, year, 0.0) == 0.0
+        assert np.isclose(schedule.annual_progress(year - 1.0, year, 0.0),
+                          2 * np.pi)
+
+    def test_solstice_extremes(self):
+        """RBICEP: Boundary"""
+        margin = 3600.0
+
+        assert schedule.sleep_duration(np.pi / 2, margin, 28800.0) \
+            == 25200.0
+        assert schedule.wake_time(np.pi / 2, margin, 25200.0) == 21600.0
+        assert schedule.wake_time(-np.pi / 2, margin, 25200.0) == 25200.0
+
+
+class TestAlarmScheduleFunction(unittest.TestCase):
+    def test_one_row_per_day(self):
+        """RBICEP: Right"""
+        test_schedule = schedule.alarm_schedule(
+            SLEEP, time(7), time(6), ABLUTIONS, earth, date(2022, 1, 1),
+            date(2023, 1, 1))
+
+        assert len(test_schedule.day) == len(test_schedule.sleep) \
+            == len(test_schedule.wake) == len(test_schedule.work) == 365
+        assert (test_schedule.work - test_schedule.wake
+                == np.timedelta64(1, "h")).all()
+
+    def test_agrees_with_alarms(self):
+        """RBICEP: Cross-check"""
+        test_schedule = schedule.alarm_schedule(
+            SLEEP, time(7), time(6), ABLUTIONS, earth, date(2022, 1, 1),
+            date(2023, 1, 1))
+
+        for day in range(0, 365, 29):
+            wake_day = test_schedule.day[day].astype(datetime)
+            test_alarms = alarms_made_at(wake_day - timedelta(hours=3))
+            for column, alarm in ((test_schedule.sleep, test_alarms.sleep),
+                                  (test_schedule.wake, test_alarms.wake),
+                                  (test_schedule.work, test_alarms.work)):
+                assert abs(column[day].astype(datetime) - alarm) \
+                    < timedelta(microseconds=2)
+
+
+class TestBatchScheduleFunction(unittest.TestCase):
+    def test_each_person_agrees_with_alarm_schedule(self):
+        """RBICEP: Cross-check"""
+        requirements = [SleepRequirements(),
+                        SleepRequirements(timedelta(hours=9), time(8),
+                                          time(6, 30), timedelta(0))]
+        profiles = schedule.SleepProfiles.from_requirements(requirements)
+        location = PlanetaryLocation("London", 0.1276, 51.5072, earth)
+
+        test_schedule = schedule.batch_schedule(
+            profiles, [location, location], date(2022, 1, 1),
+            date(2022, 3, 1))
+
+        assert test_schedule.wake.shape == (59, 2)
+        for person, requirement in enumerate(requirements):
+            single = schedule.alarm_schedule(
+                requirement.sleep, requirement.earliest_wake_up,
+                requirement.latest_wake_up, requirement.ablutions, earth,
+                date(2022, 1, 1), date(2022, 3, 1))
+            assert (test_schedule.sleep[:, person] == single.sleep).all() \
+                and (test_schedule.wake[:, person] == single.wake).all() \
+                and (test_schedule.work[:, person] == single.work).all()
+
+    def test_annual_progress_once_per_planet(self):
+        """RBICEP: Performance"""
+        profiles = schedule.SleepProfiles.from_requirements(
+            [SleepRequirements()] * 50)
+        locations = [PlanetaryLocation(f"Site {site}", site, 45.0, earth)
+                     for site in range(50)]
+
+        with mock.patch.object(schedule, "annual_progress",
+                               wraps=schedule.annual_progress) as progress:
+            schedule.batch_schedule(profiles, locations, date(2022, 1, 1),
+                                    date(2023, 1, 1))
+
+        assert progress.call_count == 1
+
+    def test_one_location_per_profile(self):
+        """RBICEP: Error"""
+        profiles = schedule.SleepProfiles.from_requirements(
+            [SleepRequirements()] * 2)
+        location = PlanetaryLocation("London", 0.1276, 51.5072, earth)
+
+        with self.assertRaises(ValueError):
+            schedule.batch_schedule(profiles, [location], date(2022, 1, 1),
+                                    date(2022, 1, 2))
@@ -0,0 +1,113 @@
+import unittest
+from dataclasses import replace
+from datetime import datetime
+
+import numpy as np
+
+from astronomical.model import tables
+from astronomical.model.configuration import Defaults, earth
+from astronomical.model.custom_types import eccentricity
+from astronomical.model.kepler import KEPLER
+from astronomical.model.solar_system import PlanetaryLocation
+
+START = datetime(2022, 1, 1)
+END = datetime(2023, 1, 1)
+
+
+class TestSolarTableClass(unittest.TestCase):
+    def setUp(self):
+        self.planet = replace(earth, orbit=KEPLER)
+        self.exact = self.planet._calculate_sun_position()
+
+    def test_interpolation_agrees_with_exact(self):
+        """RBICEP: Cross-check"""
+        for interpolation, tolerance in ((tables.CUBIC, 1e-5),
+                                         (tables.LINEAR, 2e-3)):
+            table = self.planet.tabulate(START, END, interpolation)
+            test_times = np.linspace(table._first, table._last, 10001,
+                                     endpoint=False)
+
+            dec, offset = table(test_times)
+            exact_dec, exact_offset = self.exact(test_times)
+
+            assert np.abs(dec - exact_dec).max() < tolerance
+            assert np.abs(offset - exact_offset).max() < tolerance
+
+    def test_scalars_agree_with_arrays(self):
+        """RBICEP: Conformance"""
+        table = self.planet.tabulate(START, END)
+        test_times = np.linspace(table._first, table._last, 101,
+                                 endpoint=False)
+
+        dec, offset = table(test_times)
+
+        for index, test_time in enumerate(test_times.tolist()):
+            assert np.isclose(table(test_time), (dec[index], offset[index]),
+                              rtol=0.0, atol=1e-12).all()
+
+    def test_outside_window_is_exact(self):
+        """RBICEP: Boundary"""
+        table = self.planet.tabulate(START, END)
+        test_times = np.array([table._first - 1.0, table._last + 1e6])
+
+        assert (table.declination(test_times)
+                == self.exact.declination(test_times)).all()
+        assert table(float(test_times[0])) == self.exact(test_times[0])
+
+    def test_phase_from_midnight(self):
+        """RBICEP: Right"""
+        table = self.planet.tabulate(START, END)
+
+        assert np.isclose(table.phase(table._first + table.step / 4), 0.25)
+
+    def test_unknown_interpolation(self):
+        """RBICEP: Error"""
+        with self.assertRaises(ValueError):
+            self.planet.tabulate(START, END, "quintic")
+        with self.assertRaises(ValueError):
+            tables.SolarTable(self.exact, 0.0, 0)
+
+
+class TestPlanetTabulateMethod(unittest.TestCase):
+    def test_locations_share_the_table(self):
+        """RBICEP: Right"""
+        planet = replace(earth, orbit=KEPLER)
+        table = planet.tabulate(START, END)
+        london = PlanetaryLocation("London", 0.1276, 51.5072, planet)
+        paris = PlanetaryLocation("Paris", 2.3522, 48.8566, planet)
+
+        assert london.planet._calculate_sun_position() is table \
+            and paris.planet._calculate_sun_position() is table
+
+    def test_table_goes_stale_with_the_orbit(self):
+        """RBICEP: Existence"""
+        planet = replace(earth, orbit=KEPLER)
+        table = planet.tabulate(START, END)
+
+        planet.eccentricity = eccentricity(0.1)
+
+        assert planet._calculate_sun_position() is not table
+
+    def test_defaults_tabulate_keplerian_orbits(self):
+        """RBICEP: Right"""
+        planet = replace(earth, orbit=KEPLER)
+
+        keplerian = Defaults(planet=planet, instant=START).locale.planet
+        uniform = Defaults(planet=replace(earth),
+                           instant=START).locale.planet
+
+        assert isinstance(keplerian._calculate_sun_position(),
+                          tables.SolarTable)
+        assert not isinstance(uniform._calculate_sun_position(),
+                              tables.SolarTable)
+
+    def test_defaults_leave_the_planet_given_alone(self):
+        """RBICEP: Boundary"""
+        planet = replace(earth, orbit=KEPLER)
+
+        defaults = Defaults(planet=planet, instant=START)
+
+        assert defaults.locale.planet is not planet \
+            and defaults.state.locale.planet is defaults.locale.planet
+        assert not isinstance(planet._calculate_sun_position(),
+                              tables.SolarTable)
@@ -0,0 +1,37 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from astronomical.model import timescale
+
+
+class TestSecondsFunction(unittest.TestCase):
+    def test_instants_are_seconds_since_epoch(self):
+        """RBICEP: Right"""
+        assert timescale.seconds(datetime(1970, 1, 2)) == 86400.0 \
+            and timescale.seconds(
+                datetime(1970, 1, 1, 1, tzinfo=timezone.utc)) == 3600.0
+
+    def test_durations_and_numbers(self):
+        """RBICEP: Right"""
+        assert timescale.seconds(timedelta(minutes=2)) == 120.0 \
+            and timescale.seconds(5) == 5.0 \
+            and timescale.seconds(2.5) == 2.5
+
+    def test_round_trip(self):
+        """RBICEP: Inverse"""
+        instant = datetime(2022, 6, 21, 3, 16, 47, 129683)
+
+        assert timescale.to_datetime(timescale.seconds(instant)) == instant \
+            and timescale.to_timedelta(90.0) == timedelta(seconds=90)
+
+
+class TestPeriodFunctions(unittest.TestCase):
+    def test_period_start(self):
+        """RBICEP: Right"""
+        assert timescale.periods_since(250.0, 10.0, 100.0) == 2 \
+            and timescale.period_start(250.0, 10.0, 100.0) == 210.0
+
+    def test_period_start_before_reference(self):
+        """RBICEP: Boundary"""
+        assert timescale.periods_since(-50.0, 0.0, 100.0) == -1 \
+            and timescale.period_start(-50.0, 0.0, 100.0) == -100.0
@@ -0,0 +1,37 @@
+import unittest
+from unittest import mock
+
+from astronomical.service import logging
+
+
+def divide(numerator, denominator):
+    return numerator / denominator
+
+
+class TestBaseFunctionDecorator(unittest.TestCase):
+    def test_traced_functions_return_their_value(self):
+        """RBICEP: Right"""
+        with mock.patch.object(logging, "trace_base_functions", True):
+            traced = logging.base_function(divide)
+
+        assert traced is not divide and traced(6, 3) == 2
+
+    def test_traced_functions_raise_errors(self):
+        """RBICEP: Error"""
+        with mock.patch.object(logging, "trace_base_functions", True):
+            traced = logging.base_function(divide)
+
+        errors = []
+        sink = logging.logger.add(errors.append, level="ERROR")
+        try:
+            with self.assertRaises(ZeroDivisionError):
+                traced(1, 0)
+        finally:
+            logging.logger.remove(sink)
+
+        assert len(errors) == 1
+
+    def test_untraced_functions_are_untouched(self):
+        """RBICEP: Performance"""
+        with mock.patch.object(logging, "trace_base_functions", False):
+            assert logging.base_function(divide) is divide
@@ -0,0 +1,116 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+
+from astronomical.model.configuration import SleepRequirements, earth
+from astronomical.model.event_cache import EventCache
+from astronomical.model.events import Daylight, SunEvents
+from astronomical.model.solar_system import PlanetaryLocation
+from astronomical.service.persistent_cache import (PersistentCache,
+                                                   SunEventsStore,
+                                                   cached_alarms,
+                                                   default_cache_path)
+
+
+class TestPersistentCacheClass(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "cache", "events.db")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_values_survive_reopening(self):
+        """RBICEP: Right"""
+        cache = PersistentCache(self.path)
+        cache.put("kind", "abc", "1", {"value": 1})
+        cache.close()
+
+        reopened = PersistentCache(self.path)
+
+        assert reopened.get("kind", "abc", "1") == {"value": 1} \
+            and reopened.get("kind", "abc", "2") is None
+
+    def test_clear_forgets_values(self):
+        """RBICEP: Right"""
+        cache = PersistentCache(self.path)
+        cache.put("kind", "abc", "1", {"value": 1})
+
+        cache.clear()
+
+        assert cache.get("kind", "abc", "1") is None
+
+    def test_two_connections_share_values(self):
+        """RBICEP: Cross-check"""
+        writer = PersistentCache(self.path)
+        reader = PersistentCache(self.path)
+
+        writer.put("kind", "abc", "1", {"value": 1})
+
+        assert reader.get("kind", "abc", "1") == {"value": 1}
+
+    def test_default_path_follows_cache_home(self):
+        """RBICEP: Right"""
+        os.environ["XDG_CACHE_HOME"] = self.directory.name
+        try:
+            path = default_cache_path()
+        finally:
+            del os.environ["XDG_CACHE_HOME"]
+
+        assert path.startswith(self.directory.name)
+
+
+class TestSunEventsStoreClass(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = PersistentCache(
+            os.path.join(self.directory.name, "events.db"))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_sun_events_round_trip(self):
+        """RBICEP: Inverse"""
+        store = SunEventsStore(self.cache)
+        events = SunEvents(datetime(2022, 1, 1, 8), None, Daylight.NORMAL)
+
+        store.save(("planet", "site", 1), events)
+
+        assert store.load(("planet", "site", 1)) == events \
+            and store.load(("planet", "site", 2)) is None
+
+    def test_event_cache_reads_through_store(self):
+        """RBICEP: Cross-check"""
+        events = SunEvents(None, None, Daylight.POLAR_NIGHT)
+        EventCache(store=SunEventsStore(self.cache)).get(("a", 1),
+                                                         lambda: events)
+
+        fresh = EventCache(store=SunEventsStore(self.cache))
+
+        assert fresh.get(("a", 1), lambda: None) == events
+
+
+class TestCachedAlarmsFunction(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = PersistentCache(
+            os.path.join(self.directory.name, "events.db"))
+        self.locale = PlanetaryLocation("London", 0.1276, 51.5072, earth)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_alarms_are_remembered(self):
+        """RBICEP: Right"""
+        first = cached_alarms(self.cache, SleepRequirements(), self.locale)
+
+        second = cached_alarms(self.cache, SleepRequirements(), self.locale)
+
+        assert first == second
+
+    def test_alarms_calculate_without_cache(self):
+        """RBICEP: Existence"""
+        alarms = cached_alarms(None, SleepRequirements(), self.locale)
+
+        assert alarms.sleep < alarms.wake < alarms.work
@@ -0,0 +1,48 @@
+import unittest
+from datetime import datetime
+
+from astronomical.model import physics, solar_system
+from astronomical.model.configuration import earth
+from astronomical.model.event_cache import sun_events_cache
+from astronomical.model.real_world_calculations import State
+from astronomical.model.solar_system import PlanetaryLocation
+from astronomical.service import profiling
+
+
+class TestProfileFunction(unittest.TestCase):
+    def setUp(self):
+        sun_events_cache.clear()
+        self.location = PlanetaryLocation("London", 0.1276, 51.5072, earth)
+
+    def test_profile_counts_calls(self):
+        """RBICEP: Right"""
+        with profiling.profile() as summary:
+            State(datetime(2022, 6, 21, 12), self.location).suntimes
+
+        assert summary["State._calculate_sun_times"]["calls"] == 1 \
+            and summary["physics.altitude"]["calls"] > 1 \
+            and summary["State._calculate_sun_times"]["seconds"] > 0.0
+
+    def test_profile_restores_functions(self):
+        """RBICEP: Inverse"""
+        altitude = physics.altitude
+        calculate = PlanetaryLocation._calculate_sun_times
+
+        with profiling.profile():
+            profiled = solar_system.altitude
+
+        assert profiled is not altitude \
+            and physics.altitude is altitude \
+            and solar_system.altitude is altitude \
+            and PlanetaryLocation._calculate_sun_times is calculate
+
+    def test_profile_only_reports_its_own_calls(self):
+        """RBICEP: Cross-check"""
+        with profiling.profile():
+            physics.declination(23.44, earth._calculate_orbital_period(),
+                                earth.sidereal_day)
+
+        with profiling.profile() as summary:
+            pass
+
+        assert summary == {}
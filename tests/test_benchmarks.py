@@ -0,0 +1,62 @@
+import os
+import tempfile
+import unittest
+
+from benchmarks import harness
+
+
+class TestBenchmarkHarness(unittest.TestCase):
+    def test_time_function_calibrates_loops(self):
+        """RBICEP: Right"""
+        timing = harness.time_function(lambda: None, repeat=2,
+                                       minimum_time=0.001)
+
+        assert timing.loops > 1 \
+            and timing.repeat == 2 \
+            and timing.best <= timing.median
+
+    def test_compare_flags_regressions(self):
+        """RBICEP: Boundary"""
+        baseline = {"results": {"a": {"best": 1.0}, "b": {"best": 1.0},
+                                "gone": {"best": 1.0}}}
+        current = {"results": {"a": {"best": 1.1}, "b": {"best": 1.2},
+                               "new": {"best": 1.0}}}
+
+        changes = harness.compare(baseline, current, threshold=0.15)
+
+        assert [change.name for change in changes] == ["a", "b"] \
+            and [change.regression for change in changes] == [False, True]
+
+    def test_missing_baseline_starts_from_current_run(self):
+        """RBICEP: Boundary"""
+        current = {"results": {"a": {"best": 1.0}}}
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "baseline.json")
+            baseline = harness.load_baseline(path, current)
+            saved = harness.load(path)
+
+        assert baseline == saved == current
+        assert not any(change.regression
+                       for change in harness.compare(baseline, current))
+
+    def test_benchmark_names_are_unique(self):
+        """RBICEP: Error"""
+        harness.benchmark("test.unique")(lambda: None)
+
+        with self.assertRaises(ValueError):
+            harness.benchmark("test.unique")(lambda: None)
+        del harness.registry["test.unique"]
+
+    def test_every_physics_function_has_a_micro_benchmark(self):
+        """RBICEP: Cross-check"""
+        import inspect
+
+        from astronomical.model import physics
+        from benchmarks import micro
+
+        functions = {name for name, member in
+                     inspect.getmembers(physics, inspect.isfunction)
+                     if member.__module__ == physics.__name__}
+
+        assert functions == set(micro.ARGUMENTS)